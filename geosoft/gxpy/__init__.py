@@ -11,8 +11,12 @@ from . import geometry
 from . import geometry_utility
 from . import grid
 from . import grid_fft
+from . import grid_overview
+from . import grid_statistics
 from . import grid_utility
 from . import gdb
+from . import gdb_cache
+from . import gdb_index
 from . import agg
 from . import map
 from . import view
@@ -22,6 +26,7 @@ from . import vox
 from . import vox_display
 from . import metadata
 from . import spatialdata
+from . import spatial_index
 from . import surface
 from . import dap_client
 from . import segy_reader
@@ -33,8 +38,12 @@ __all__ = ['agg',
            'geometry',
            'geometry_utility',
            'gdb',
+           'gdb_cache',
+           'gdb_index',
            'grid',
            'grid_fft',
+           'grid_overview',
+           'grid_statistics',
            'grid_utility',
            'group',
            'gx',
@@ -42,6 +51,7 @@ __all__ = ['agg',
            'metadata',
            'project',
            'segy_reader',
+           'spatial_index',
            'spatialdata',
            'surface',
            'system',
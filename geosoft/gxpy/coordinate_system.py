@@ -6,6 +6,14 @@ Coodinate systems
     :`Coordinate_translate`: translate coordinates between coordinate systems
     :`Wkt`:                  well-know coordinate system for ESRI interoperability
 
+**Caching**
+
+Coordinate systems created from the same name, GXF, WKT, xml, JSON or dictionary description are copied from a
+cached definition rather than parsed again, `interned` returns shared read-only coordinate system instances,
+and `coordinate_translate` returns cached `Coordinate_translate` instances.  Caches are kept for each thread
+because gxapi instances can only be used on the thread that created them, and are limited to the most recently
+used `CACHE_SIZE` descriptions and `TRANSLATE_CACHE_SIZE` translations.
+
 Coordinate systems describe how cartesian coordinates are located ralative to the Earth.  Cartesian coordinates
 are right-handed (x, y, z) spatial ordinates that describe locations within a coordinate system frame of reference.
 For coordinates relative to a horizontal plane, positive z is up, usually equivalent to elevation relative to
@@ -69,6 +77,8 @@ the parameters defined in the GXF stings.  See :attr:`Coordinate_system.gxf`.
     :PARM_PROJECTION: 'transform'
     :PARM_UNITS: 'units'
     :PARM_LOCAL_DATUM: 'datumtrf'
+    :CACHE_SIZE: 256
+    :TRANSLATE_CACHE_SIZE: 64
 
 .. seealso:: `geosoft.gxapi.GXIPJ`
 
@@ -78,13 +88,18 @@ the parameters defined in the GXF stings.  See :attr:`Coordinate_system.gxf`.
     `tests <https://github.com/GeosoftInc/gxpy/blob/master/geosoft/gxpy/tests/test_coordinate_system.py>`_
 """
 
+import os
 import json
+import threading
+from collections import OrderedDict
 import numpy as np
 import geosoft
 import geosoft.gxapi as gxapi
 from . import utility as gxu
 from . import dataframe as gxdf
 from . import vv as gxvv
+from . import gx as gx
+from . import system as gxsys
 
 __version__ = geosoft.__version__
 
@@ -134,6 +149,12 @@ PARM_PROJECTION = 'transform'
 PARM_UNITS = 'units'
 PARM_LOCAL_DATUM = 'datumtrf'
 
+CACHE_SIZE = 256  #: number of coordinate system descriptions and comparisons cached per thread
+TRANSLATE_CACHE_SIZE = 64  #: number of `Coordinate_translate` instances cached per thread
+CONVERT_CHUNK_SIZE = 1000000  #: number of points converted at a time by `Coordinate_translate.convert_array`
+
+_thread_caches = threading.local()
+
 
 class CSException(geosoft.GXRuntimeError):
     """
@@ -190,6 +211,126 @@ def _unknown(name):
     return _unknown_name in name
 
 
+def _cache(name):
+    """least-recently-used cache dictionary of this thread and GX context"""
+    context = gx._get_gx_instance()
+    if getattr(_thread_caches, 'context', None) is not context:
+        _thread_caches.__dict__.clear()
+        _thread_caches.context = context
+    cache = getattr(_thread_caches, name, None)
+    if cache is None:
+        cache = OrderedDict()
+        setattr(_thread_caches, name, cache)
+    return cache
+
+
+def _cache_get(name, key):
+    cache = _cache(name)
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(name, key, value, size=CACHE_SIZE):
+    cache = _cache(name)
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > size:
+        cache.popitem(last=False)
+
+
+def _description_key(coordinate_system):
+    """hashable canonical key of a coordinate system description, None if the description is not cached"""
+    if isinstance(coordinate_system, str):
+        return 'str', coordinate_system.strip()
+    if isinstance(coordinate_system, dict):
+        try:
+            return 'dict', json.dumps(coordinate_system, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+    if isinstance(coordinate_system, (list, tuple)) and len(coordinate_system) == 5 and \
+            all(isinstance(s, str) for s in coordinate_system):
+        return 'gxf', tuple(coordinate_system)
+    return None
+
+
+def clear_cache():
+    """
+    Clear the coordinate system, comparison and translation caches of this thread.  Caches hold
+    GX objects and are cleared when the GX context of the thread is closed.
+
+    .. versionadded:: 2024.1
+    """
+    _thread_caches.__dict__.clear()
+
+
+def _convert_chunks(xyz, spans, convert):
+    """
+    Convert (start, stop) spans of points of a float64 array in place through reused float64 VVs.
+
+    :param xyz:     float64 numpy array shape (n, 2) or (n, 3+), may be strided
+    :param spans:   list of (start, stop) point ranges
+    :param convert: function(vvs) that converts a list of 2 or 3 `geosoft.gxapi.GXVV` in place
+    """
+
+    nd = min(xyz.shape[1], 3)
+    size = max(stop - start for start, stop in spans)
+    buffer = np.empty(size, dtype=np.float64)
+    vvs = [gxapi.GXVV.create_ext(gxapi.GS_DOUBLE, size) for _ in range(nd)]
+    for start, stop in spans:
+        n = stop - start
+        b = buffer[:n]
+        for i, vv in enumerate(vvs):
+            np.copyto(b, xyz[start: stop, i])
+            b[np.isnan(b)] = gxapi.rDUMMY
+            vv.set_data_np(0, b)
+            vv.set_len(n)
+        convert(vvs)
+        for i, vv in enumerate(vvs):
+            column = xyz[start: stop, i]
+            column[:] = vv.get_data_np(0, n, np.float64)
+            gxu.dummy_to_nan(column)
+
+
+def _convert_array(xyz, convert, remote=None, chunk_size=CONVERT_CHUNK_SIZE, threads=1):
+    """
+    Convert the (x, y) or (x, y, z) columns of a float64 array in place, in chunks of points.
+
+    Only one chunk of each column is copied to the engine at a time, so memory use is bounded by the chunk size
+    regardless of the number of points.  gxapi instances can only be used on the thread that created them, so
+    each worker thread runs in its own GX context and calls remote() to create its own conversion function.
+
+    :param xyz:         float64 numpy array shape (n, 2) or (n, 3+), may be strided
+    :param convert:     function(vvs) that converts a list of 2 or 3 `geosoft.gxapi.GXVV` in place
+    :param remote:      function() that returns a conversion function for the calling thread, required if
+                        threads is not 1.
+    :param chunk_size:  number of points converted at a time
+    :param threads:     number of threads, None to use all cores
+    """
+
+    npoints = xyz.shape[0]
+    if npoints == 0:
+        return
+    chunk_size = max(1, int(chunk_size))
+    spans = [(i, min(i + chunk_size, npoints)) for i in range(0, npoints, chunk_size)]
+    if threads is None:
+        threads = os.cpu_count()
+    threads = max(1, min(threads, len(spans)))
+    if threads == 1:
+        _convert_chunks(xyz, spans, convert)
+        return
+
+    def worker(thread_spans):
+        with gx.GXpy(suppress_progress=True):
+            try:
+                _convert_chunks(xyz, thread_spans, remote())
+            finally:
+                clear_cache()
+
+    gxsys.parallel_map(worker, [spans[i::threads] for i in range(threads)], threads=threads)
+
+
 def name_list(what, datum_filter=''):
     """
     Get a list of coordinate system names
@@ -515,11 +656,22 @@ class Coordinate_system:
     def __init__(self, coordinate_system=None):
 
         self._dict = None
+        self._key = None
+        self._hash = None
+        self._read_only = False
         self._gxapi_ipj = gxapi.GXIPJ.create()
 
         if coordinate_system is None:
             coordinate_system = _unknown_name
 
+        # copy a cached definition of the same description
+        key = _description_key(coordinate_system)
+        if key is not None:
+            template = _cache_get('descriptions', key)
+            if template is not None:
+                template.copy(self.gxipj)
+                return
+
         if isinstance(coordinate_system, str):
             self._from_str(coordinate_system)
 
@@ -528,12 +680,19 @@ class Coordinate_system:
 
         elif isinstance(coordinate_system, Coordinate_system):
             coordinate_system.gxipj.copy(self.gxipj)
+            self._key = coordinate_system._key
+            self._hash = coordinate_system._hash
 
         elif isinstance(coordinate_system, dict):
             self._from_dict(coordinate_system)
         else:
             self._from_gxf(coordinate_system)
 
+        if key is not None:
+            template = gxapi.GXIPJ.create()
+            self.gxipj.copy(template)
+            _cache_put('descriptions', key, template)
+
     def __eq__(self, other):
         return self.same_as(other)
 
@@ -586,6 +745,30 @@ class Coordinate_system:
         """ `geosoft.gxapi.GXIPJ` instance"""
         return self._gxapi_ipj
 
+    @property
+    def read_only(self):
+        """
+        `True` for shared coordinate systems returned by `interned`, which cannot be changed.
+
+        .. versionadded:: 2024.1
+        """
+        return self._read_only
+
+    def _changing(self):
+        """called before the coordinate system is changed"""
+        if self._read_only:
+            raise CSException(_t('Coordinate system "{}" is read-only, make a copy to change it.').format(self))
+        self._dict = None
+        self._key = None
+        self._hash = None
+
+    def _identity(self):
+        """(hash, key) that identifies the coordinate system, calculated once"""
+        if self._key is None:
+            self._key = tuple(self.gxf)
+            self._hash = hash(self._key)
+        return self._hash, self._key
+
     @property
     def name(self):
         """ coordinate system name as 'datum / projection <orientation> [vcs]' """
@@ -621,6 +804,7 @@ class Coordinate_system:
 
     @vcs.setter
     def vcs(self, vcs):
+        self._changing()
         self.gxipj.set_vcs(vcs)
 
     @property
@@ -714,12 +898,23 @@ class Coordinate_system:
         Return True if both coordinate systems (HCS and VCS) are the same. 
         
         .. versionadded:: 9.2
+
+        .. versionchanged:: 2024.1 identical coordinate systems are recognized from a hash of the definition, and
+            comparison results are cached.
         """
-        if other is None:
+        if other is None or other is self:
             return True
         if not isinstance(other, Coordinate_system):
             other = Coordinate_system(other)
-        return self.same_hcs(other) and self.same_vcs(other)
+        shash, skey = self._identity()
+        ohash, okey = other._identity()
+        if shash == ohash and skey == okey:
+            return True
+        same = _cache_get('same', (skey, okey))
+        if same is None:
+            same = self.same_hcs(other) and self.same_vcs(other)
+            _cache_put('same', (skey, okey), same)
+        return same
 
     def _from_str(self, cstr):
         """
@@ -927,6 +1122,7 @@ class Coordinate_system:
 
     @gxf.setter
     def gxf(self, gxfs):
+        self._changing()
         self._from_gxf(gxfs)
 
     @property
@@ -943,6 +1139,7 @@ class Coordinate_system:
 
     @xml.setter
     def xml(self, xml):
+        self._changing()
         self.gxipj.set_xml(xml)
 
     @property
@@ -958,6 +1155,7 @@ class Coordinate_system:
 
     @esri_wkt.setter
     def esri_wkt(self, gxfs):
+        self._changing()
         self._from_str(gxfs)
 
     @property
@@ -971,6 +1169,7 @@ class Coordinate_system:
 
     @json.setter
     def json(self, json_str):
+        self._changing()
         self._from_str(json_str)
 
     def cs_name(self, what=NAME):
@@ -1030,71 +1229,91 @@ class Coordinate_system:
             self.gxipj.get_name(what, s)
             return s.value
 
-    def _oriented_xyz(self, direction, xyz, column_ordered=False):
+    def _oriented_xyz(self, direction, xyz, column_ordered=False, in_place=False,
+                      chunk_size=CONVERT_CHUNK_SIZE, threads=1):
         """
         Return oriented (x, y, z) coordinates from true base (x, y, z) coordinates.
 
         :param xyz:             (x, y, z) or iterable
         :param column_ordered:  if xyz is iterable, and this is True, the data is assumed to be
                                 column ordered and the results are returned column ordered.
+        :param in_place:        if True, numpy array data is converted in-place.  Ignored for a single (x, y, z).
+        :param chunk_size:      number of points converted at a time
+        :param threads:         number of threads, None to use all cores
         :returns:               (x, y, z) in un-oriented space
 
         .. versionadded:: 9.2
+
+        .. versionchanged:: 2024.1 converted in chunks through `Coordinate_translate.convert_array`
         """
 
         if not isinstance(xyz, np.ndarray):
             xyz = np.array(xyz)
 
-        if xyz.ndim == 1:
-            x = (xyz[0],)
-            y = (xyz[1],)
-            z = (xyz[2],)
+        single = xyz.ndim == 1
+        if single:
+            work = np.array(xyz[:3], dtype=np.float64).reshape((1, 3))
+        elif in_place and xyz.dtype == np.float64:
+            work = xyz
+        elif column_ordered:
+            work = np.array(xyz[:3], dtype=np.float64)
         else:
-            if column_ordered:
-                x, y, z = xyz[0, :], xyz[1, :], xyz[2, :]
-            else:
-                x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+            work = np.array(xyz[:, :3], dtype=np.float64)
 
-        x = gxvv.GXvv(x, dtype=float)
-        y = gxvv.GXvv(y, dtype=float)
-        z = gxvv.GXvv(z, dtype=float)
+        xml = None if threads == 1 else self.xml
 
-        self.gxipj.convert_orientation_warp_vv(x.gxvv, y.gxvv, z.gxvv, direction)
+        def remote():
+            cs = Coordinate_system(xml)
+            return lambda vvs: cs.gxipj.convert_orientation_warp_vv(vvs[0], vvs[1], vvs[2], direction)
 
-        if xyz.ndim == 1:
-            return x[0][0], y[0][0], z[0][0]
-        else:
-            xyz_column = np.array([x.np, y.np, z.np])
-            if column_ordered:
-                return xyz_column
-            else:
-                return xyz_column.swapaxes(0, 1)
+        _convert_array(work.T if (column_ordered and not single) else work,
+                       lambda vvs: self.gxipj.convert_orientation_warp_vv(vvs[0], vvs[1], vvs[2], direction),
+                       remote, chunk_size=chunk_size, threads=threads)
+
+        if single:
+            return work[0, 0], work[0, 1], work[0, 2]
+        if in_place:
+            if work is not xyz:
+                if column_ordered:
+                    xyz[:3] = work
+                else:
+                    xyz[:, :3] = work
+            return xyz
+        return work
 
-    def oriented_from_xyz(self, xyz, column_ordered=False):
+    def oriented_from_xyz(self, xyz, column_ordered=False, in_place=False, threads=1):
         """
         Return oriented (x, y, z) coordinates from true base (x, y, z) coordinates.
 
         :param xyz:             (x, y, z) or iterable
         :param column_ordered:  if xyz is iterable, and this is True, the data is assumed to be
                                 column ordered and the results are returned column ordered.
+        :param in_place:        if True, numpy array data is converted in-place.
+        :param threads:         number of threads for large arrays, None to use all cores
         :returns:               (x, y, z) in un-oriented space
 
         .. versionadded:: 9.2
+
+        .. versionchanged:: 2024.1 added `in_place` and `threads`
         """
-        return self._oriented_xyz(0, xyz, column_ordered=column_ordered)
+        return self._oriented_xyz(0, xyz, column_ordered=column_ordered, in_place=in_place, threads=threads)
 
-    def xyz_from_oriented(self, xyz, column_ordered=False):
+    def xyz_from_oriented(self, xyz, column_ordered=False, in_place=False, threads=1):
         """
         Return true base (x, y, z) coordinates from oriented (x, y, z) coordinates.
 
         :param xyz:             (x, y, z) or iterable
         :param column_ordered:  if xyz is iterable, and this is True, the data is assumed to be
                                 column ordered and the results are returned column ordered.
+        :param in_place:        if True, numpy array data is converted in-place.
+        :param threads:         number of threads for large arrays, None to use all cores
         :returns:               (x, y, z) in oriented space
 
         .. versionadded:: 9.2
+
+        .. versionchanged:: 2024.1 added `in_place` and `threads`
         """
-        return self._oriented_xyz(1, xyz, column_ordered=column_ordered)
+        return self._oriented_xyz(1, xyz, column_ordered=column_ordered, in_place=in_place, threads=threads)
 
 
 def is_known(coordinate_system):
@@ -1113,6 +1332,61 @@ def is_known(coordinate_system):
         return False
 
 
+def interned(coordinate_system):
+    """
+    Shared read-only `Coordinate_system` for a coordinate system description.
+
+    :param coordinate_system:   any coordinate system description accepted by `Coordinate_system`, or a
+                                `Coordinate_system` instance.
+    :returns:                   read-only `Coordinate_system` instance, which is the same instance for the same
+                                description.  Attempts to change a read-only coordinate system raise
+                                `CSException`.
+
+    Use interned coordinate systems where many objects refer to the same coordinate system and do not change it.
+
+    .. versionadded:: 2024.1
+    """
+
+    if isinstance(coordinate_system, Coordinate_system):
+        if coordinate_system.read_only:
+            return coordinate_system
+        key = ('gxf', coordinate_system._identity()[1])
+    else:
+        key = _description_key(coordinate_system)
+        if key is None:
+            coordinate_system = Coordinate_system(coordinate_system)
+            key = ('gxf', coordinate_system._identity()[1])
+
+    cs = _cache_get('interned', key)
+    if cs is None:
+        cs = Coordinate_system(coordinate_system)
+        cs._identity()
+        cs._read_only = True
+        _cache_put('interned', key, cs)
+    return cs
+
+
+def coordinate_translate(cs_from, cs_to):
+    """
+    Cached `Coordinate_translate` between two coordinate systems.
+
+    :param cs_from:  from coordinate system, any form accepted by `Coordinate_system`
+    :param cs_to:    to coordinate system, any form accepted by `Coordinate_system`
+    :returns:        `Coordinate_translate` instance, which is the same instance for the same coordinate systems.
+
+    .. versionadded:: 2024.1
+    """
+
+    cs_from = interned(cs_from)
+    cs_to = interned(cs_to)
+    key = (cs_from._identity()[1], cs_to._identity()[1])
+    pj = _cache_get('translate', key)
+    if pj is None:
+        pj = Coordinate_translate(cs_from, cs_to)
+        _cache_put('translate', key, pj, TRANSLATE_CACHE_SIZE)
+    return pj
+
+
 class Coordinate_translate:
     """
     Class to reproject coordinates between different coordinate systems.
@@ -1182,6 +1456,56 @@ class Coordinate_translate:
         if zvvin:
             zvvin.set_data(zvv)
 
+    def _convert_gxvv(self, vvs):
+        if len(vvs) == 3:
+            self._pj.convert_vv3(vvs[0], vvs[1], vvs[2])
+        else:
+            self._pj.convert_vv(vvs[0], vvs[1])
+
+    def convert_array(self, xyz, chunk_size=CONVERT_CHUNK_SIZE, threads=1):
+        """
+        Project a large numpy array of locations in-place.
+
+        :param xyz:         float64 numpy array shape (n, 2) for (x, y) or (n, 3+) for (x, y, z).  Only the
+                            first 2 or 3 columns are changed.  Views, such as the columns of a larger array,
+                            are converted in-place.
+        :param chunk_size:  number of points converted at a time, default is `CONVERT_CHUNK_SIZE`
+        :param threads:     number of threads to convert chunks in parallel, default is 1.  Use None for the
+                            number of cores on this computer.
+        :returns:           xyz
+
+        Points are converted a chunk at a time so that memory used to pass the points to the projection engine
+        is limited by the chunk size.  Each thread converts with its own GX context and projection, so
+        threading pays off for many millions of points.
+
+        :example:
+
+            .. code::
+
+                import geosoft.gxpy.coordinate_system as gxcs
+
+                pj = gxcs.coordinate_translate('NAD83 / UTM zone 17N', 'WGS 84')
+                pj.convert_array(points[:, :3], threads=None)
+
+        .. versionadded:: 2024.1
+        """
+
+        if not isinstance(xyz, np.ndarray) or xyz.dtype != np.float64 or xyz.ndim != 2 or xyz.shape[1] < 2:
+            raise CSException(_t('Data must be a float64 numpy array of dimension (n, 2) or (n, 3+).'))
+        if not xyz.flags['WRITEABLE']:
+            raise CSException(_t('Data array is read-only.'))
+
+        if threads == 1:
+            remote = None
+        else:
+            descriptions = (self._cs_from.xml, self._cs_to.xml)
+
+            def remote():
+                return Coordinate_translate(*descriptions)._convert_gxvv
+
+        _convert_array(xyz, self._convert_gxvv, remote, chunk_size=chunk_size, threads=threads)
+        return xyz
+
     def convert(self, xyz, in_place=False):
         """
         Project data in array in which first columns are x,y or x,y,z.
@@ -1210,6 +1534,9 @@ class Coordinate_translate:
         .. versionadded:: 9.2
 
         .. versionchanged:: 9.3.1 conversion methods will return results in the same type as the input data.
+
+        .. versionchanged:: 2024.1 converted through `convert_array`, float64 numpy arrays are converted in-place
+                            without copying the whole array.
         """
 
         xyz_in = xyz
@@ -1233,25 +1560,15 @@ class Coordinate_translate:
         if nd < 2:
             raise CSException(_t('Data must have dimension 2 (x,y) or 3 for (x,y,z) or higher.'))
 
-        vvx = gxvv.GXvv(xyz[:, 0])
-        vvy = gxvv.GXvv(xyz[:, 1])
-        if nd >= 3:
-            vvz = gxvv.GXvv(xyz[:, 2])
-        else:
-            vvz = None
-        self.convert_vv(vvx, vvy, vvz)
+        if in_place and xyz.dtype == np.float64:
+            return self.convert_array(xyz)
 
+        nc = min(nd, 3)
+        converted = self.convert_array(np.array(xyz[:, :nc], dtype=np.float64))
         if in_place:
-            xyz[:, 0] = vvx.np
-            xyz[:, 1] = vvy.np
-            if nd > 2:
-                xyz[:, 2] = vvz.np
+            xyz[:, :nc] = converted
             return xyz
-
-        if nd >= 3:
-            xyz = np.array([vvx.np, vvy.np, vvz.np]).T
-        else:
-            xyz = np.array([vvx.np, vvy.np]).T
+        xyz = converted.astype(xyz.dtype, copy=False)
 
         if flatten_return:
             xyz = xyz.flatten()
@@ -5,6 +5,8 @@ Geosoft databases for line-oriented spatial data.
     :`Geosoft_gdb`: Geosoft line database
     :`Line`:        line handling
     :`Channel`:     channel handling
+    :`LineReader`:  bulk reading of the same channels from many lines
+    :`LineWriter`:  bulk writing of the same channels to many lines
     
 :Constants:
     :LINE_TYPE_NORMAL: `geosoft.gxapi.DB_LINE_TYPE_NORMAL`
@@ -52,6 +54,10 @@ Geosoft databases for line-oriented spatial data.
 
     :DRAW_AS_POINTS: 0
     :DRAW_AS_LINES: 1
+
+    :DATAFRAME_ARRAY_EXPAND: 0
+    :DATAFRAME_ARRAY_MULTIINDEX: 1
+    :DATAFRAME_ARRAY_BLOCK: 2
     
 .. seealso:: `geosoft.gxapi.GXGB`, `geosoft.gxapi.GXEDB`,
              `geosoft.gxapi.GXDBREAD`, `geosoft.gxapi.GXDBWRITE`
@@ -65,6 +71,8 @@ Geosoft databases for line-oriented spatial data.
 import os
 import sys
 import math
+import queue
+import threading
 import numpy as np
 import pandas as pd
 
@@ -80,6 +88,9 @@ from . import map as gxmap
 from . import view as gxview
 from . import group as gxgroup
 from . import geometry as gxgeo
+from . import geometry_utility as gxgeou
+from . import gdb_cache as gxcache
+from . import gdb_index as gxindex
 
 __version__ = geosoft.__version__
 
@@ -134,6 +145,10 @@ SYMBOL_LOCK_WRITE = gxapi.DB_LOCK_READWRITE
 DRAW_AS_POINTS = 0
 DRAW_AS_LINES = 1
 
+DATAFRAME_ARRAY_EXPAND = 0
+DATAFRAME_ARRAY_MULTIINDEX = 1
+DATAFRAME_ARRAY_BLOCK = 2
+
 
 class GdbException(geosoft.GXRuntimeError):
     """
@@ -229,6 +244,35 @@ def delete_files(file_name):
         gxu.delete_file(file_name + '.xml')
 
 
+def _prefetch_lines(file_name, lines, channels, dtype, fid, read_queue, stop):
+    """
+    Thread target for `Geosoft_gdb.iter_lines` that reads lines into a queue from its own GX context and
+    database handle. A `None` item marks the end of the data, and an exception raised while reading
+    is passed through the queue to the consumer.
+    """
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                read_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        with gx.GXpy(suppress_progress=True):
+            with Geosoft_gdb.open(file_name) as gdb:
+                reader = LineReader(gdb, channels, dtype=dtype)
+                for line in lines:
+                    npd, _, line_fid = reader.read(line, fid=fid)
+                    if not put((line, npd, line_fid)):
+                        return
+    except Exception as e:
+        put(e)
+    put(None)
+
+
 class Geosoft_gdb(gxgeo.Geometry):
     """
     Class to work with Geosoft databases. This class wraps many of the functions found in 
@@ -337,6 +381,8 @@ class Geosoft_gdb(gxgeo.Geometry):
                         self._db.sync()
 
                     self._db = None
+                    if self._index is not None and not discard:
+                        self._index.save()
                 if discard:
                     gxu.delete_files_by_root(self._file_name)
                 if pop:
@@ -358,6 +404,8 @@ class Geosoft_gdb(gxgeo.Geometry):
         self._xmlmetadata_changed = False
         self._xmlmetadata_root = ''
         self._extent = {'xyz': None, 'extent': None}
+        self._cache = None
+        self._index = None
 
         if name is None:
             if self._db:
@@ -477,6 +525,8 @@ class Geosoft_gdb(gxgeo.Geometry):
         .. versionadded:: 9.1
         """
         self._db.commit()
+        if self._index is not None:
+            self._index.save()
 
     def discard(self):
         """
@@ -485,6 +535,8 @@ class Geosoft_gdb(gxgeo.Geometry):
         .. versionadded:: 9.1
         """
         self._db.discard()
+        if self._index is not None:
+            self._index.discard()
 
     # ============================================================================
     # internal helper functions
@@ -621,7 +673,13 @@ class Geosoft_gdb(gxgeo.Geometry):
 
     @property
     def file_name(self):
-        """Database file name."""
+        """
+        Database file name, None if the database does not have a file name.
+
+        .. versionchanged:: 2024.1 None if there is no file name
+        """
+        if self._file_name is None:
+            return None
         return os.path.abspath(self._file_name)
 
     @property
@@ -784,7 +842,6 @@ class Geosoft_gdb(gxgeo.Geometry):
                 return _min, _max
             if mdata < _min:
                 _min = mdata
-                return _min, _max
             mdata = np.nanmax(_data)
             if mdata > _max:
                 _max = mdata
@@ -803,12 +860,22 @@ class Geosoft_gdb(gxgeo.Geometry):
                     return None
                 xyz = xyz[0:2]
 
-            for l in lines:
-                data = self.read_line(l, channels=xyz)[0]
-                xmin, xmax = expand(xmin, xmax, data[:, 0])
-                ymin, ymax = expand(ymin, ymax, data[:, 1])
-                if data.shape[1] > 2:
-                    zmin, zmax = expand(zmin, zmax, data[:, 2])
+            if self._index is not None:
+                for line in lines:
+                    box = self._index.line_extent(line, xyz)
+                    if box is None:
+                        continue
+                    xmin, xmax = expand(xmin, xmax, np.array((box[0], box[3])))
+                    ymin, ymax = expand(ymin, ymax, np.array((box[1], box[4])))
+                    if len(xyz) > 2 and box[2] is not None:
+                        zmin, zmax = expand(zmin, zmax, np.array((box[2], box[5])))
+
+            else:
+                for _, data, _ in self.iter_lines(channels=xyz, lines=lines):
+                    xmin, xmax = expand(xmin, xmax, data[:, 0])
+                    ymin, ymax = expand(ymin, ymax, data[:, 1])
+                    if data.shape[1] > 2:
+                        zmin, zmax = expand(zmin, zmax, data[:, 2])
 
             ext = gxgeo.Point2((xmin, ymin, zmin, xmax, ymax, zmax), coordinate_system=self.coordinate_system)
             self._extent['xyz'] = str(xyz)
@@ -1251,6 +1318,71 @@ class Geosoft_gdb(gxgeo.Geometry):
         """
         self._extent['xyz'] = None
 
+    def use_cache(self, folder=None, build=True, channels=None):
+        """
+        Read channel data through a columnar on-disk cache, see `geosoft.gxpy.gdb_cache.GdbCache`.
+
+        :param folder:      cache folder, default is a folder named "<database>.gdb.cache" next to the database.
+        :param build:       `True` to build the cache now if it does not exist or is out of date.
+        :param channels:    channels to cache if the cache is built, default is all channels.
+        :returns:           `geosoft.gxpy.gdb_cache.GdbCache` instance, or None if the database does not have
+                            a file name, in which case data is always read from the database.
+
+        While the cache is valid (the database has no uncommitted changes and the database file has not changed
+        since the cache was built), `read_channel` returns read-only memory-mapped arrays from the cache,
+        and `read_line` assembles float data from the cache when all requested channels share the same
+        fiducial.  Otherwise data is read from the database.
+
+        .. versionadded:: 2024.1
+        """
+
+        if not self.file_name:
+            self._cache = None
+            return None
+        cache = gxcache.GdbCache(self, folder)
+        if build and not cache.is_valid:
+            cache.build(channels=channels)
+        self._cache = cache
+        return cache
+
+    def _valid_cache(self):
+        """the cache if it can be used, otherwise None"""
+        if self._cache is not None and self._cache.is_valid:
+            return self._cache
+        return None
+
+    def use_index(self, file_name=None, build=False):
+        """
+        Maintain a per-line channel statistics index, see `geosoft.gxpy.gdb_index.LineIndex`.
+
+        :param file_name:   index file, default is "<database>.gdb.index.json" next to the database.
+        :param build:       `True` to index all lines and channels now, otherwise statistics are
+                            computed as they are needed.
+        :returns:           `geosoft.gxpy.gdb_index.LineIndex` instance
+
+        Once an index is in use, `write_channel`, `write_line`, `delete_line`, `delete_line_data` and
+        `delete_channel` keep it up to date, `extent` is determined from the indexed line bounding boxes,
+        and `list_values` skips lines that have no valid data in the channel.  The index is saved
+        by `commit`.
+
+        .. versionadded:: 2024.1
+        """
+
+        index = gxindex.LineIndex(self, file_name)
+        if build:
+            index.build()
+        self._index = index
+        return index
+
+    @property
+    def index(self):
+        """
+        The `geosoft.gxpy.gdb_index.LineIndex` in use, None if not using an index. See `use_index`.
+
+        .. versionadded:: 2024.1
+        """
+        return self._index
+
     def delete_channel(self, channels):
         """
         Delete channel(s) by name or symbol.
@@ -1272,7 +1404,10 @@ class Geosoft_gdb(gxgeo.Geometry):
                 if c.protect:
                     protected_channels.append(c.name)
                 else:
+                    name = c.name
                     c.delete()
+                    if self._index is not None:
+                        self._index.remove(channel=name)
             except GdbException:
                 continue
 
@@ -1294,10 +1429,12 @@ class Geosoft_gdb(gxgeo.Geometry):
         for s in lines:
             if type(s) is str and not self.exist_symb_(s, gxapi.DB_SYMB_LINE):
                 continue
-            ls = self.line_name_symb(s)[1] if type(s) is str else s
+            ln, ls = self.line_name_symb(s)
             self.unlock_(ls)
             self.lock_write_(ls)
             self._db.delete_symb(ls)
+            if self._index is not None:
+                self._index.remove(ln)
 
     def delete_line_data(self, lines):
         """
@@ -1360,6 +1497,85 @@ class Geosoft_gdb(gxgeo.Geometry):
 
         self.clear_extent()
 
+    def select_lines_in_area(self, area, select=True, selected=True, row_ranges=False):
+        """
+        Select lines that have data locations inside a spatial area.
+
+        :param area:        area as a `geosoft.gxpy.geometry.Point2` box, or a `geosoft.gxpy.geometry.PPoint`
+                            polygon. If the area has a coordinate system it is reprojected to the database
+                            coordinate system.
+        :param select:      `True` to select lines in the area and deselect lines outside the area, `False` to
+                            only return the lines in the area without changing the line selection.
+        :param selected:    `True` to consider only currently selected lines, `False` for all lines
+        :param row_ranges:  `True` to also return the rows of each line that are inside the area
+        :returns:           list of line names in the area, or if `row_ranges` is `True` a dictionary of
+                            {line: [(start_row, end_row), ...]}, where each range is from start_row up to but
+                            not including end_row.
+
+        Lines are tested by their (x, y) data locations, see `xyz_channels`.  Lines whose bounding box does not
+        overlap the area are excluded using the line statistics index (see `use_index`) without reading the
+        line data.  If an index is not in use the locations of every line are read.
+
+        .. versionadded:: 2024.1
+        """
+
+        xyz = self.xyz_channels
+        if None in xyz[0:2]:
+            raise GdbException(_t('The database does not have x and y location channels.'))
+        xy = xyz[0:2]
+
+        cs = self.coordinate_system
+        if isinstance(area, gxgeo.Point2):
+            box = gxgeo.Point2(area, coordinate_system=cs) if gxcs.is_known(cs) else area
+            polygon = None
+            ax0, ay0, ax1, ay1 = box.extent_xy
+            ax0, ax1 = min(ax0, ax1), max(ax0, ax1)
+            ay0, ay1 = min(ay0, ay1), max(ay0, ay1)
+        elif isinstance(area, gxgeo.PPoint):
+            polygon = gxgeo.PPoint(area, coordinate_system=cs) if gxcs.is_known(cs) else area
+            ax0, ay0 = np.nanmin(polygon.xy, axis=0)
+            ax1, ay1 = np.nanmax(polygon.xy, axis=0)
+        else:
+            raise GdbException(_t('Area must be a Point2 or PPoint, found {}').format(type(area)))
+
+        lines = list(self.list_lines(select=selected))
+        in_area = {}
+        for line in lines:
+            if self._index is not None:
+                box = self._index.line_extent(line, xy)
+                if box is None or box[3] < ax0 or box[0] > ax1 or box[4] < ay0 or box[1] > ay1:
+                    continue
+
+            data = self.read_line(line, channels=xy)[0]
+            if polygon is None:
+                with np.errstate(invalid='ignore'):
+                    inside = ((data[:, 0] >= ax0) & (data[:, 0] <= ax1) &
+                              (data[:, 1] >= ay0) & (data[:, 1] <= ay1))
+            else:
+                inside = gxgeou.points_in_polygon(data, polygon)
+            if not inside.any():
+                continue
+
+            if row_ranges:
+                edges = np.diff(np.concatenate(([0], inside.view(np.int8), [0])))
+                starts = np.flatnonzero(edges == 1)
+                ends = np.flatnonzero(edges == -1)
+                in_area[line] = [(int(r0), int(r1)) for r0, r1 in zip(starts, ends)]
+            else:
+                in_area[line] = None
+
+        if select:
+            for line in lines:
+                if line in in_area:
+                    self._db.select(line, gxapi.DB_LINE_SELECT_INCLUDE)
+                else:
+                    self._db.select(line, gxapi.DB_LINE_SELECT_EXCLUDE)
+            self.clear_extent()
+
+        if row_ranges:
+            return in_area
+        return list(in_area)
+
     # =====================================================================================
     # reading and writing
 
@@ -1371,7 +1587,7 @@ class Geosoft_gdb(gxgeo.Geometry):
                 channels = [channels]
         elif isinstance(channels, int):
             channels = [channels]
-        return [self.channel_name_symb(c)[0] if isinstance(channels, int) else c for c in channels]
+        return [self.channel_name_symb(c)[0] if isinstance(c, int) else c for c in channels]
 
 
     def sorted_chan_list(self, channels=None):
@@ -1549,9 +1765,20 @@ class Geosoft_gdb(gxgeo.Geometry):
         For dtype=np.float, dummy values will be np.nan. For integer types dummy values will be the
         Geosoft dummy values.
 
+        If a cache is in use (see `use_cache`), cached data is returned as a read-only `numpy.memmap`.
+
         .. versionadded:: 9.1
+
+        .. versionchanged:: 2024.1 reads from the cache if one is in use.
         """
 
+        cache = self._valid_cache()
+        if cache is not None:
+            ln = self.line_name_symb(line)[0]
+            cn = self.channel_name_symb(channel)[0]
+            if cache.has(ln, cn) and (dtype is None or np.dtype(dtype) == np.dtype(cache.channel_details(cn)['dtype'])):
+                return cache.read_channel(ln, cn)
+
         if self.channel_width(channel) == 1:
             vv = self.read_channel_vv(line, channel, dtype)
             return vv.get_data(vv.dtype)[0], vv.fid
@@ -1708,7 +1935,7 @@ class Geosoft_gdb(gxgeo.Geometry):
     def _num_rows_from_fid(cls, src_fid_start, src_fid_last, fid):
         return int((src_fid_last - fid[0])/fid[1] + 1.5)
 
-    def read_line(self, line, channels=None, dtype=None, fid=None, dummy=None):
+    def read_line(self, line, channels=None, dtype=None, fid=None, dummy=None, dummy_policy=None, fill_value=None):
         """
         Read a line of data into a numpy array.
 
@@ -1724,6 +1951,13 @@ class Geosoft_gdb(gxgeo.Geometry):
             READ_REMOVE_DUMMYCOLUMNS remove columns with dummies
             ======================== ===================================================
 
+        :param dummy_policy: dummy handling by channel, applied after `dummy`. One of the
+                            `geosoft.gxpy.utility` DUMMY constants for all channels, a list with a constant for
+                            each returned column, or a dictionary {channel_name: DUMMY constant} where channels
+                            not in the dictionary are DUMMY_KEEP.  If rows are dropped the fiducials lose meaning.
+                            See `geosoft.gxpy.utility.apply_dummy_policy`.
+        :param fill_value:  value(s) for DUMMY_FILL channels, a single value, a list or a dictionary by channel name
+
         :returns:   2D numpy array shape(records,channels), list of channel names, (fidStart,fidIncr)
         :raises:    GdbException if first channel requested is empty
 
@@ -1750,109 +1984,164 @@ class Geosoft_gdb(gxgeo.Geometry):
             npd,ch,fid = gdb.read_line('L100','X',np.int32)              # read channel 'X' into integer array
 
         .. versionadded:: 9.1
-        """
 
-        ls = self.line_name_symb(line)[1]
-        fid_start, fid_incr, fid_last, ncols, channels = self.scan_line_fid(line, channels)
+        .. versionchanged:: 2024.1 reads through a `LineReader`, use a `LineReader` directly to read many lines.
+            Added `dummy_policy` and `fill_value`. Reads from the cache if one is in use, see `use_cache`.
+        """
 
-        if fid is None:
-            fid = (fid_start, fid_incr)
-        nrows = self._num_rows_from_fid(fid_start, fid_last, fid)
-        if nrows == 0 or ncols == 0:
-            if len(channels) == 0:
-                data = np.array([], dtype=dtype)
+        cached = None
+        cache = self._valid_cache()
+        if cache is not None and (dtype is None or np.dtype(dtype) == np.float64):
+            if channels is None:
+                cache_channels = self.sorted_chan_list()
             else:
-                data = np.array([], dtype=dtype).reshape((-1, len(channels)))
-            return data, channels, fid
+                cache_channels = [self.channel_name_symb(c)[0] for c in self._to_string_chan_list(channels)]
+            ln = self.line_name_symb(line)[0]
+            if cache_channels and all(cache.has(ln, c) for c in cache_channels):
+                cached = cache.read_line(ln, cache_channels, fid=fid)
 
-        # read to a numpy array
-        npd = np.empty((nrows, ncols), dtype=dtype)
-        if npd.dtype == np.float32 or npd.dtype == np.float64:
-            dummy_value = np.nan
+        if cached is not None:
+            npd, ch_names, fid = cached
         else:
-            dummy_value = gxu.gx_dummy(npd.dtype)
+            npd, ch_names, fid = LineReader(self, channels, dtype=dtype, order='C').read(line, fid=fid)
+        if npd.ndim != 2 or npd.shape[0] == 0:
+            return npd, ch_names, fid
 
-        all_empty = True
-        ch_names = []
-        icol = 0
-        for ch in channels:
-            cn, cs = self.channel_name_symb(ch)
-            w = self.channel_width(cs)
-            if w == 1:
-                vv = self.read_channel_vv(ls, cs, dtype=npd.dtype)
-                if vv.length > 0:
-                    all_empty = False
-                vv.refid(fid, nrows)
-                npd[:, icol] = vv.np
-                icol += 1
-                ch_names.append(cn)
-            else:
-                va = self.read_channel_va(ls, cs, dtype=npd.dtype)
-                if va.length > 0:
-                    all_empty = False
-                va.refid(fid, nrows)
-                npd[:, icol:icol+w] = va.np
-                icol += w
-                for i in range(w):
-                    ch_names.append('{}[{}]'.format(cn, str(i)))
-
-        nch = len(ch_names)
-
-        if all_empty:
-            npd = np.empty((0, ncols), dtype=dtype)
-        elif dummy:
-            # dummy handling
+        if dummy:
             if dummy == READ_REMOVE_DUMMYCOLUMNS:
-                n_ok = 0
-
-                # shift data and channel names to remove columns containing a dummy
-                for i in range(nch):
-                    if np.isnan(dummy_value):
-                        if np.isnan(npd[:, i]).any():
-                            continue
-                    elif dummy_value in npd[:, i]:
-                        continue
-                    if n_ok != i:
-                        npd[:, n_ok] = npd[:, i]
-                        ch_names[n_ok] = ch_names[i]
-                    n_ok += 1
-                if n_ok != nch:
-                    npd = npd[:, 0:n_ok]
-                    ch_names = ch_names[0:n_ok]
+                keep = ~gxu.dummy_mask(npd, axis=0)
+                if not keep.all():
+                    npd = npd[:, keep]
+                    ch_names = [c for c, k in zip(ch_names, keep) if k]
 
             elif dummy == READ_REMOVE_DUMMYROWS:
-
-                if np.isnan(dummy_value):
-                    mask = np.apply_along_axis(lambda a: not (np.isnan(a).any()), 1, npd)
-                else:
-                    mask = np.apply_along_axis(lambda a: not (dummy_value in a), 1, npd)
-                npd = npd[mask, :]
+                npd = npd[~gxu.dummy_mask(npd, axis=1)]
                 fid = (0.0, 1.0)
 
             else:
                 raise GdbException(_t('Unrecognized dummy={}').format(dummy))
 
+        if dummy_policy is not None:
+            if isinstance(dummy_policy, dict):
+                dummy_policy = [dummy_policy.get(c.split('[')[0], gxu.DUMMY_KEEP) for c in ch_names]
+                if isinstance(fill_value, dict):
+                    fill_value = [fill_value.get(c.split('[')[0]) for c in ch_names]
+            npd, dropped = gxu.apply_dummy_policy(npd, dummy_policy, fill_value=fill_value)
+            if dropped.any():
+                fid = (0.0, 1.0)
+
         return npd, ch_names, fid
 
-    def read_line_dataframe(self, line, channels=None, fid=None):
+    def iter_lines(self, channels=None, lines=None, dtype=None, fid=None, chunk_rows=None, prefetch=0):
+        """
+        Generator that reads through lines of the database, yielding the data of each line, or of fixed-size
+        row chunks of each line.
+
+        :param channels:    list of channels, strings or symbol number.  If None, read all channels
+        :param lines:       list of lines to read, default is all selected lines
+        :param dtype:       numpy data type for the array, default np.float64. Use "<Unnn" for string type.
+        :param fid:         required fiducial as tuple (start,incr), default smallest in the data of each line
+        :param chunk_rows:  if specified, long lines are yielded in chunks of at most this many rows
+        :param prefetch:    number of lines to read ahead in a background thread, default 0 reads each line
+                            when it is needed.  See note below.
+        :returns:           yields (line_name, numpy_data, (fidStart, fidIncr)) where numpy_data is shaped
+                            (records, channels) as from `read_line`.
+
+        All lines are read through one `LineReader`.  Chunks are views of the line data, and the fid
+        returned with each chunk is the fid of the first row in that chunk.
+
+        .. note::
+
+            GX objects are bound to the thread that created them, so the prefetch thread creates its own
+            GX context and opens its own handle to the database file.  The database must therefore be a named
+            file with all changes committed, and cannot be the database locked by an open Oasis montaj
+            project (`Geosoft_gdb.open()` with no name).
+
+        Examples:
+
+        .. code::
+
+            for line, npd, fid in gdb.iter_lines(['X', 'Y', 'mag'], chunk_rows=100000, prefetch=2):
+                # ... process npd while the next lines are read ...
+
+        .. versionadded:: 2024.1
+        """
+
+        if lines is None:
+            lines = list(self.list_lines())
+        else:
+            lines = [self.line_name_symb(line)[0] for line in lines]
+
+        if chunk_rows is not None and chunk_rows < 1:
+            raise GdbException(_t('chunk_rows must be >= 1'))
+
+        def chunks(line, npd, line_fid):
+            if chunk_rows is None or npd.ndim != 2 or npd.shape[0] <= chunk_rows:
+                yield line, npd, line_fid
+            else:
+                for i in range(0, npd.shape[0], chunk_rows):
+                    yield line, npd[i: i + chunk_rows], (line_fid[0] + i * line_fid[1], line_fid[1])
+
+        if prefetch <= 0:
+            reader = LineReader(self, channels, dtype=dtype)
+            for line in lines:
+                npd, _, line_fid = reader.read(line, fid=fid)
+                yield from chunks(line, npd, line_fid)
+            return
+
+        if self._edb is not None or not self._file_name:
+            raise GdbException(_t('Prefetch requires a named database that is not locked by the project.'))
+
+        if channels is None:
+            channels = self.sorted_chan_list()
+        else:
+            channels = [self.channel_name_symb(c)[0] for c in self._to_string_chan_list(channels)]
+        read_queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+        worker = threading.Thread(target=_prefetch_lines,
+                                  args=(self._file_name, lines, channels, dtype, fid, read_queue, stop),
+                                  daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = read_queue.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield from chunks(*item)
+        finally:
+            stop.set()
+            worker.join()
+
+    def read_line_dataframe(self, line, channels=None, fid=None, array_format=DATAFRAME_ARRAY_EXPAND):
         """
         Read a line of data into a Pandas DataFrame
 
-        :param line:        line to read, string or symbol number
-        :param channels:    list of channels, strings or symbol number.  If empty, read all channels
-        :param fid:         required fiducial as tuple (start,incr), default smallest in data
+        :param line:            line to read, string or symbol number
+        :param channels:        list of channels, strings or symbol number.  If empty, read all channels
+        :param fid:             required fiducial as tuple (start,incr), default smallest in data
+        :param array_format:    how VA channels are returned:
 
-        :returns:   Pandas DataFrame, list of channel names, (fidStart,fidIncr)
-        :raises:    GdbException if first channel requested is empty
+            ========================== ============================================================
+            DATAFRAME_ARRAY_EXPAND     a column for each element with names name[0], name[1], etc.
+            DATAFRAME_ARRAY_MULTIINDEX MultiIndex columns (name, element). Single-column channels
+                                       are (name, '').
+            DATAFRAME_ARRAY_BLOCK      one column for the channel, each row a numpy array view of
+                                       the channel's 2D data.
+            ========================== ============================================================
 
-        VA channels are expanded by element with channel names name[0], name[1], etc.
+        :returns:   Pandas DataFrame, list of column names, (fidStart,fidIncr)
+        :raises:    GdbException if first channel requested is empty
 
         This method can be used to conveniently get a table structure of all data corresponding to the
-        native types of the channels. It is however not necessarily the most efficient way to get at the data.
-        If your database has a lot of channels, or wide array channels it will be more efficient
-        to read and work with just the channels you need.  See `read_channel`, `read_channel_vv`
-        and `read_channel_va`. This method also does not currently support dummy removal in the same
-        way as `read_line`.
+        native types of the channels. If your database has a lot of channels, or wide array channels it will
+        be more efficient to read and work with just the channels you need.  See `read_channel`,
+        `read_channel_vv` and `read_channel_va`. This method also does not currently support dummy removal in
+        the same way as `read_line`.
+
+        Numeric channels are read into one 2D buffer for each data type, and the DataFrame is built
+        in one step from column views of these buffers without further copies.
 
         Examples:
 
@@ -1869,61 +2158,135 @@ class Geosoft_gdb(gxgeo.Geometry):
             df,ch,fid = gdb.read_line('L100',channels=['X','Y','Z'])    # read a list of channels to (n,3) array
 
         .. versionadded:: 9.5
+
+        .. versionchanged:: 2024.1
+            added `array_format`, and the DataFrame is built without per-column inserts.
         """
 
-        df = pd.DataFrame()
+        if array_format not in (DATAFRAME_ARRAY_EXPAND, DATAFRAME_ARRAY_MULTIINDEX, DATAFRAME_ARRAY_BLOCK):
+            raise GdbException(_t('Invalid array_format: {}').format(array_format))
 
         ls = self.line_name_symb(line)[1]
         fid_start, fid_incr, fid_last, ncols, channels = self.scan_line_fid(line, channels)
-        ch_names = []
 
         if fid is None:
             fid = (fid_start, fid_incr)
 
         nrows = self._num_rows_from_fid(fid_start, fid_last, fid)
-        if nrows == 0 or ncols == 0:
-            for ch in channels:
-                cn, cs = self.channel_name_symb(ch)
-                w = self.channel_width(cs)
-                if w == 1:
-                    df[cn] = ()
-                    ch_names.append(cn)
-                else:
-                    for i in range(w):
-                        va_cn = '{}[{}]'.format(cn, str(i))
-                        df[va_cn] = ()
-                        ch_names.append(va_cn)
-            return df, ch_names, fid
+        if ncols == 0:
+            nrows = 0
 
-        icol = 0
-        all_empty = True
+        # one (columns, rows) buffer per numeric data type, so every column is a contiguous row
+        columns = []
+        group_width = {}
         for ch in channels:
             cn, cs = self.channel_name_symb(ch)
             w = self.channel_width(cs)
+            dtype = np.dtype(self.channel_dtype(cs))
+            columns.append((cn, cs, w, dtype))
+            if dtype.type is not np.str_:
+                group_width[dtype] = group_width.get(dtype, 0) + w
+        buffers = {dtype: np.empty((w, nrows), dtype=dtype) for dtype, w in group_width.items()}
+        next_column = dict.fromkeys(group_width, 0)
+
+        blocks = []
+        all_empty = True
+        for cn, cs, w, dtype in columns:
             if w == 1:
                 vv = self.read_channel_vv(ls, cs)
                 if vv.length > 0:
                     all_empty = False
-                vv.refid(fid, nrows)
-                df[cn] = vv.np
-                icol += 1
-                ch_names.append(cn)
+                if nrows:
+                    vv.refid(fid, nrows)
             else:
                 va = self.read_channel_va(ls, cs)
                 if va.length > 0:
                     all_empty = False
-                va.refid(fid, nrows)
-                icol += w
+                if nrows:
+                    va.refid(fid, nrows)
+
+            if dtype.type is np.str_:
+                if w == 1:
+                    block = vv.np[:nrows].reshape((1, -1))
+                else:
+                    block = va.np[:nrows].T
+            else:
+                icol = next_column[dtype]
+                next_column[dtype] += w
+                block = buffers[dtype][icol: icol + w]
+                if nrows:
+                    if w == 1:
+                        block[0] = vv.gxvv.get_data_np(0, nrows, dtype)
+                    else:
+                        block[:] = va.gxva.get_array_np(0, 0, nrows, w, dtype).reshape((nrows, w)).T
+            blocks.append((cn, w, block))
+
+        # float dummies to nan, one pass per buffer
+        for buffer in buffers.values():
+            gxu.dummy_to_nan(buffer)
+
+        data = {}
+        for cn, w, block in blocks:
+            if w == 1:
+                key = (cn, '') if array_format == DATAFRAME_ARRAY_MULTIINDEX else cn
+                data[key] = block[0]
+            elif array_format == DATAFRAME_ARRAY_BLOCK:
+                rows = np.empty(nrows, dtype=object)
+                for i, row in enumerate(block.T):
+                    rows[i] = row
+                data[cn] = rows
+            else:
                 for i in range(w):
-                    va_cn = '{}[{}]'.format(cn, str(i))
-                    df[va_cn] = va.np[:, i]
-                    ch_names.append(va_cn)
+                    if array_format == DATAFRAME_ARRAY_MULTIINDEX:
+                        data[(cn, i)] = block[i]
+                    else:
+                        data['{}[{}]'.format(cn, str(i))] = block[i]
+
+        df = pd.DataFrame(data, copy=False)
+        if all_empty and nrows:
+            df = df.iloc[:0]
+
+        return df, list(data), fid
+
+    def read_lines_dataframe(self, lines=None, channels=None, fid=None, array_format=DATAFRAME_ARRAY_EXPAND,
+                             line_column='line'):
+        """
+        Read many lines of data into a single Pandas DataFrame.
+
+        :param lines:           lines to read, default is all selected lines
+        :param channels:        list of channels, strings or symbol number.  If empty, read all channels
+        :param fid:             required fiducial as tuple (start,incr), default is the smallest fiducial in the
+                                data of each line.
+        :param array_format:    how VA channels are returned, see `read_line_dataframe`
+        :param line_column:     name of the first column, which holds the line name of each row as a
+                                categorical.
+
+        :returns:   Pandas DataFrame, list of column names
+
+        .. versionadded:: 2024.1
+        """
 
-        if all_empty:
-            # Delete one and only row
-            df = df.drop([0])
+        if lines is None:
+            lines = list(self.list_lines())
+        else:
+            lines = [self.line_name_symb(line)[0] for line in lines]
+
+        frames = []
+        names = None
+        for line in lines:
+            df, names, _ = self.read_line_dataframe(line, channels=channels, fid=fid, array_format=array_format)
+            frames.append(df)
+
+        if len(frames) == 0:
+            return pd.DataFrame({line_column: pd.Categorical([])}), [line_column]
 
-        return df, ch_names, fid
+        lengths = [len(df) for df in frames]
+        df = pd.concat(frames, ignore_index=True)
+        codes = np.repeat(np.arange(len(lines)), lengths)
+        line_key = (line_column, '') if array_format == DATAFRAME_ARRAY_MULTIINDEX else line_column
+        df.insert(0, line_key, pd.Categorical.from_codes(codes, categories=lines))
+
+        return df, [line_key] + names
 
     def write_channel_vv(self, line, channel, vv):
         """
@@ -1944,7 +2307,7 @@ class Geosoft_gdb(gxgeo.Geometry):
         except GdbException:
             if type(channel) is str:
                 cs = self.new_channel(channel, vv.dtype)
-                cn = channel
+                cn = self.channel_name_symb(cs)[0]
             else:
                 raise
 
@@ -1957,6 +2320,9 @@ class Geosoft_gdb(gxgeo.Geometry):
         finally:
             self.unlock_(cs)
 
+        if self._index is not None:
+            self._index.update(ln, cn, vv.np, vv.fid)
+
         if vv.unit_of_measure:
             Channel(self, cs).unit_of_measure = vv.unit_of_measure
 
@@ -1979,6 +2345,7 @@ class Geosoft_gdb(gxgeo.Geometry):
         except GdbException:
             if type(channel) is str:
                 cs = self.new_channel(channel, va.dtype, array=va.width)
+                cn = self.channel_name_symb(cs)[0]
             else:
                 raise
 
@@ -1988,6 +2355,9 @@ class Geosoft_gdb(gxgeo.Geometry):
         finally:
             self.unlock_(cs)
 
+        if self._index is not None:
+            self._index.update(ln, cn, va.np, va.fid)
+
         if va.unit_of_measure:
             Channel(self, cs).unit_of_measure = va.unit_of_measure
 
@@ -2020,10 +2390,10 @@ class Geosoft_gdb(gxgeo.Geometry):
             data = np.array(data)
 
         if isinstance(channel, str):
-            cn = channel
             cs = self.new_channel(channel, data.dtype, array=_va_width(data))
         else:
-            cn, cs = self.channel_name_symb(channel)
+            cs = channel
+        cn, cs = self.channel_name_symb(cs)
 
         if cn in self.xyz_channels:
             self.clear_extent()
@@ -2061,6 +2431,9 @@ class Geosoft_gdb(gxgeo.Geometry):
             finally:
                 self.unlock_(cs)
 
+        if self._index is not None:
+            self._index.update(ln, cn, data, fid)
+
         if unit_of_measure:
             Channel(self, cs).unit_of_measure = unit_of_measure
 
@@ -2100,48 +2473,17 @@ class Geosoft_gdb(gxgeo.Geometry):
         :param fid:         option fid tuple (start, increment), default (0.0,1.0)
 
         .. versionadded:: 9.1
+
+        .. versionchanged:: 2024.1
+            multiple channels are written together by a `LineWriter`. Use a `LineWriter` directly to write
+            the same channels to many lines.
         """
 
         if type(channels) is str:
             self.write_channel(line, channels, data, fid=fid)
 
         else:
-            if channels is None:
-                channels = self.sorted_chan_list()
-            else:
-                channels = self._to_string_chan_list(channels)
-
-            if not isinstance(data, np.ndarray):
-                data = np.array(data)
-            if data.ndim == 1:
-                data = data.reshape((-1, 1))
-
-            # ensure data matches channels
-            np_data = 0
-            for chan in channels:
-                try:
-                    ch, cs = self.channel_name_symb(chan)
-                    w = self.channel_width(cs)
-                except GdbException:
-                    w = 1
-                np_data += w
-
-            # channel - data mismatch
-            if data.shape[1] != np_data:
-                raise GdbException(_t('Data dimension ({}) does not match data required by channels ({}).').
-                                   format(data.shape, channels))
-
-            # all good, write the data
-            np_index = 0
-            for chan in channels:
-                try:
-                    ch, cs = self.channel_name_symb(chan)
-                    w = self.channel_width(cs)
-                except GdbException:
-                    w = 1
-                    cs = chan
-                self.write_channel(line, cs, data[:, np_index: np_index + w], fid=fid)
-                np_index += w
+            LineWriter(self, channels).write(line, data, fid=fid)
 
     def list_values(self, chan, umax=1000, selected=True, dupl=50, progress=None, stop=None):
         """
@@ -2170,6 +2512,10 @@ class Geosoft_gdb(gxgeo.Geometry):
         ndup = 0
         for l in lines:
 
+            if self._index is not None and self._index.is_indexed(l, cn) and \
+                    self._index.statistics(l, cn)['count'] == 0:
+                continue
+
             try:
                 d, c, f = self.read_line(l, cs, dtype=dtype)
             except GdbException:
@@ -2919,3 +3265,363 @@ class Line:
         if bearing == gxapi.rDUMMY:
             return None
         return bearing
+
+
+class LineReader:
+    """
+    Bulk reader for the same set of channels from many lines. Channel symbols, widths and output columns
+    are resolved once, and one pool of `geosoft.gxpy.vv.GXvv` and `geosoft.gxpy.va.GXva` instances is reused
+    for every line read.
+
+    :param gdb:             `Geosoft_gdb` instance
+    :param channels:        list of channels, strings or symbol number.  If None, read all channels
+    :param dtype:           numpy data type for the array, default np.float64. Use "<Unnn" for string type.
+    :param order:           memory layout of returned arrays, 'F' (default) keeps each channel contiguous,
+                            'C' for row-major arrays.
+    :param reuse_buffer:    `True` to read every line into one internal buffer that grows as needed.  Arrays
+                            returned by `read` are then views of the buffer that are only valid until the
+                            next call to `read`.
+
+    VA channels are expanded by element with channel names name[0], name[1], etc.
+
+    Examples:
+
+    .. code::
+
+        reader = gxdb.LineReader(gdb, ['X', 'Y', 'mag'], reuse_buffer=True)
+        for line in gdb.list_lines():
+            npd, ch, fid = reader.read(line)
+            # ... npd is only valid until the next read ...
+
+    .. versionadded:: 2024.1
+    """
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__, self.__dict__)
+
+    def __init__(self, gdb, channels=None, dtype=None, order='F', reuse_buffer=False):
+
+        self.gdb = gdb
+        if channels is None:
+            channels = gdb.sorted_chan_list()
+        else:
+            channels = gdb._to_string_chan_list(channels)
+        self._channels = channels
+
+        if dtype is None:
+            dtype = np.float64
+        self._dtype = np.dtype(dtype)
+        self._is_string = self._dtype.type is np.str_
+        self._order = order
+        self._reuse_buffer = reuse_buffer
+        self._buffer = None
+
+        # (symbol, width, first column, pooled vv or va) for each channel
+        self._columns = []
+        self._channel_names = []
+        icol = 0
+        for ch in channels:
+            cn, cs = gdb.channel_name_symb(ch)
+            w = gdb.channel_width(cs)
+            if w == 1:
+                pool = gxvv.GXvv(dtype=self._dtype)
+                self._channel_names.append(cn)
+            else:
+                pool = gxva.GXva(width=w, dtype=self._dtype)
+                for i in range(w):
+                    self._channel_names.append('{}[{}]'.format(cn, str(i)))
+            self._columns.append((cs, w, icol, pool))
+            icol += w
+        self._width = icol
+
+    @property
+    def channels(self):
+        """list of requested channel names"""
+        return list(self._channels)
+
+    @property
+    def channel_names(self):
+        """list of output column names, array channels expanded to name[0], name[1], ..."""
+        return list(self._channel_names)
+
+    @property
+    def width(self):
+        """number of output columns"""
+        return self._width
+
+    @property
+    def dtype(self):
+        """numpy data type of returned arrays"""
+        return self._dtype
+
+    def _fid_range(self):
+        """
+        Smallest common fid of the pooled data, consistent with `Geosoft_gdb.scan_line_fid`.
+
+        :returns: (fid_start, fid_increment, fid_last), or None if there is no fiducial information.
+        """
+
+        fid_start = fid_increment = fid_last = None
+        for cs, w, icol, pool in self._columns:
+            c_start, c_increment = pool.fid
+            n = pool.length
+            if fid_start is None:
+                fid_start, fid_increment = c_start, c_increment
+                if n == 0:
+                    fid_last = fid_start
+                else:
+                    fid_last = fid_start + fid_increment * (n - 1)
+            elif c_start != gxapi.rDUMMY:
+                c_last = c_start + c_increment * (n - 1)
+                if fid_start == gxapi.rDUMMY or c_start < fid_start:
+                    fid_start = c_start
+                if fid_increment == gxapi.rDUMMY or c_increment < fid_increment:
+                    fid_increment = c_increment
+                if c_last > fid_last:
+                    fid_last = c_last
+
+        if fid_start is None or fid_start == gxapi.rDUMMY or fid_increment == gxapi.rDUMMY:
+            return None
+        return fid_start, fid_increment, fid_last
+
+    def _output(self, nrows, out):
+        """return an output array for nrows of data"""
+
+        if out is not None:
+            if out.ndim != 2 or out.shape[0] < nrows or out.shape[1] != self._width:
+                raise GdbException(_t('Output array shape {} cannot hold data shape {}').
+                                   format(out.shape, (nrows, self._width)))
+            if out.dtype != self._dtype:
+                raise GdbException(_t('Output array dtype {} does not match reader dtype {}').
+                                   format(out.dtype, self._dtype))
+            return out[:nrows]
+
+        if not self._reuse_buffer:
+            return np.empty((nrows, self._width), dtype=self._dtype, order=self._order)
+
+        if self._buffer is None or self._buffer.shape[0] < nrows:
+            self._buffer = np.empty((nrows, self._width), dtype=self._dtype, order=self._order)
+        return self._buffer[:nrows]
+
+    def read(self, line, fid=None, out=None):
+        """
+        Read a line of data into a numpy array.
+
+        :param line:    line to read, string or symbol number
+        :param fid:     required fiducial as tuple (start,incr), default smallest in data
+        :param out:     optional array shape (>= records, `width`) of the reader dtype to receive the data.
+                        The returned array is a view of the first rows of `out`.
+
+        :returns:       2D numpy array shape(records, channels), list of channel names, (fidStart,fidIncr)
+
+        Each channel symbol is locked only once per line.  Float dummies are returned as np.nan.
+
+        .. versionadded:: 2024.1
+        """
+
+        ls = self.gdb.line_name_symb(line)[1]
+        gxdb = self.gdb.gxdb
+
+        for cs, w, icol, pool in self._columns:
+            self.gdb.lock_read_(cs)
+            try:
+                if w == 1:
+                    gxdb.get_chan_vv(ls, cs, pool.gxvv)
+                else:
+                    gxdb.get_chan_va(ls, cs, pool.gxva)
+            finally:
+                self.gdb.unlock_(cs)
+
+        fid_range = self._fid_range()
+        if fid_range is None:
+            if fid is None:
+                fid = (0., 1.)
+            ncols = 0
+            nrows = Geosoft_gdb._num_rows_from_fid(0., 0., fid)
+        else:
+            fid_start, fid_incr, fid_last = fid_range
+            if fid is None:
+                fid = (fid_start, fid_incr)
+            ncols = self._width
+            nrows = Geosoft_gdb._num_rows_from_fid(fid_start, fid_last, fid)
+
+        if nrows == 0 or ncols == 0:
+            if len(self._channels) == 0:
+                data = np.array([], dtype=self._dtype)
+            else:
+                data = np.array([], dtype=self._dtype).reshape((-1, len(self._channels)))
+            return data, list(self._channels), fid
+
+        if all(pool.length == 0 for cs, w, icol, pool in self._columns):
+            return np.empty((0, self._width), dtype=self._dtype), list(self._channel_names), fid
+
+        npd = self._output(nrows, out)
+        for cs, w, icol, pool in self._columns:
+            pool.refid(fid, nrows)
+            if self._is_string:
+                if w == 1:
+                    npd[:, icol] = pool.np
+                else:
+                    npd[:, icol: icol + w] = pool.np
+            elif w == 1:
+                npd[:, icol] = pool.gxvv.get_data_np(0, nrows, self._dtype)
+            else:
+                npd[:, icol: icol + w] = pool.gxva.get_array_np(0, 0, nrows, w, self._dtype).reshape((-1, w))
+
+        # float dummies to nan in one pass over the block
+        gxu.dummy_to_nan(npd)
+
+        return npd, list(self._channel_names), fid
+
+
+class LineWriter:
+    """
+    Bulk writer for the same set of channels to many lines. Channel symbols and widths are resolved once,
+    and one pool of `geosoft.gxpy.vv.GXvv` and `geosoft.gxpy.va.GXva` instances is reused for every line
+    written.  This is the complement of `LineReader`.
+
+    :param gdb:         `Geosoft_gdb` instance
+    :param channels:    list of channels, strings or symbol number.  If None, write all channels.
+                        Channels that do not exist are created as single-column channels of the type of
+                        the data on the first `write`.
+
+    Examples:
+
+    .. code::
+
+        reader = gxdb.LineReader(gdb, ['X', 'Y', 'mag'])
+        writer = gxdb.LineWriter(gdb, ['mag_filtered', 'mag_derivative'])
+        for line in gdb.list_lines():
+            npd, ch, fid = reader.read(line)
+            writer.write(line, process(npd), fid=fid)
+
+    .. versionadded:: 2024.1
+    """
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__, self.__dict__)
+
+    def __init__(self, gdb, channels=None):
+
+        self.gdb = gdb
+        if channels is None:
+            channels = gdb.sorted_chan_list()
+        else:
+            channels = gdb._to_string_chan_list(channels)
+
+        # [name, symbol, width, first column] for each channel, symbol is None until a new channel is created
+        self._columns = []
+        icol = 0
+        for ch in channels:
+            try:
+                cn, cs = gdb.channel_name_symb(ch)
+                w = gdb.channel_width(cs)
+            except GdbException:
+                if not isinstance(ch, str):
+                    raise
+                cn, cs, w = ch, None, 1
+            self._columns.append([cn, cs, w, icol])
+            icol += w
+        self._channels = [c[0] for c in self._columns]
+        self._width = icol
+        self._pool = {}
+        self._xyz = any(cn in gdb.xyz_channels for cn in self._channels)
+
+    @property
+    def channels(self):
+        """list of channel names"""
+        return list(self._channels)
+
+    @property
+    def width(self):
+        """number of data columns required"""
+        return self._width
+
+    def _pooled(self, cs, w, dtype):
+        """pooled vv or va for a channel, replaced if the data type changes"""
+        pool = self._pool.get(cs)
+        if pool is None or pool.dtype != dtype:
+            if w == 1:
+                pool = gxvv.GXvv(dtype=dtype)
+            else:
+                pool = gxva.GXva(width=w, dtype=dtype)
+            self._pool[cs] = pool
+        return pool
+
+    def write(self, line, data, fid=(0.0, 1.0)):
+        """
+        Write a line of data.
+
+        :param line:    line to write to, name or symbol.  The line is created if it does not exist.
+        :param data:    numpy array shape (records, `width`), or 1D for a single channel.  Float data may
+                        use np.nan for dummies.
+        :param fid:     fid tuple (start, increment), default (0.0,1.0)
+
+        All channels are converted and loaded before any channel is written, and each channel symbol
+        is locked only once.
+
+        .. versionadded:: 2024.1
+        """
+
+        if not isinstance(data, np.ndarray):
+            data = np.array(data)
+        if data.ndim == 1:
+            data = data.reshape((-1, 1))
+        if data.ndim != 2 or data.shape[1] != self._width:
+            raise GdbException(_t('Data dimension ({}) does not match data required by channels ({}).').
+                               format(data.shape, self._channels))
+
+        gdb = self.gdb
+        ln, ls = gdb.line_name_symb(line, create=True)
+
+        for column in self._columns:
+            if column[1] is None:
+                column[1] = gdb.new_channel(column[0], data.dtype)
+
+        # nan to dummy in one pass over the block
+        if data.dtype == np.float32 or data.dtype == np.float64:
+            nan_mask = np.isnan(data)
+            if nan_mask.any():
+                data = np.where(nan_mask, gxu.gx_dummy(data.dtype), data)
+
+        nrows = data.shape[0]
+        is_string = data.dtype.type is np.str_
+        pools = []
+        for cn, cs, w, icol in self._columns:
+            pool = self._pooled(cs, w, data.dtype)
+            if is_string:
+                pool.set_data(data[:, icol], fid=fid)
+            elif w == 1:
+                gvv = pool.gxvv
+                if nrows:
+                    gvv.set_data_np(0, np.ascontiguousarray(data[:, icol]))
+                gvv.set_len(nrows)
+                pool.fid = fid
+            else:
+                gva = pool.gxva
+                gva.set_ln(nrows)
+                if nrows:
+                    gva.set_array_np(0, 0, np.ascontiguousarray(data[:, icol: icol + w]))
+                pool.fid = fid
+            pools.append((cs, w, pool))
+
+        locked = []
+        try:
+            for cs, w, pool in pools:
+                gdb.lock_write_(cs)
+                locked.append(cs)
+            for cs, w, pool in pools:
+                if w == 1:
+                    gdb.gxdb.put_chan_vv(ls, cs, pool.gxvv)
+                else:
+                    gdb.gxdb.put_chan_va(ls, cs, pool.gxva)
+        finally:
+            for cs in reversed(locked):
+                gdb.unlock_(cs)
+
+        if self._xyz:
+            gdb.clear_extent()
+
+        if gdb.index is not None:
+            for cn, cs, w, icol in self._columns:
+                gdb.index.update(ln, cn, data[:, icol: icol + w] if w > 1 else data[:, icol], fid)
@@ -0,0 +1,321 @@
+"""
+Columnar on-disk cache of Geosoft database channels.
+
+Each line and channel is stored in its own numpy `.npy` file so that cached data can be opened as a
+read-only `numpy.memmap` without copying.  A JSON manifest records the fiducial and length of each
+line/channel, the channel details and the database coordinate system, together with the database
+file modification time and size used to decide if the cache is still valid.
+
+:Classes:
+
+    ================= ============================================
+    :class:`GdbCache` columnar cache of a `Geosoft_gdb` database
+    ================= ============================================
+
+.. seealso:: `geosoft.gxpy.gdb`
+
+.. note::
+
+    Regression tests provide usage examples:
+    `Tests <https://github.com/GeosoftInc/gxpy/blob/master/geosoft/gxpy/tests/test_gdb_cache.py>`_
+
+"""
+import os
+import json
+import shutil
+import numpy as np
+
+import geosoft
+from . import utility as gxu
+
+__version__ = geosoft.__version__
+
+MANIFEST_FILE = 'manifest.json'  #: name of the cache manifest file
+CACHE_VERSION = 1  #: cache format version, caches of a different version are rebuilt
+
+
+def _t(s):
+    return geosoft.gxpy.system.translate(s)
+
+
+class GdbCacheException(geosoft.GXRuntimeError):
+    """
+    Exceptions from :mod:`geosoft.gxpy.gdb_cache`.
+
+    .. versionadded:: 2024.1
+    """
+    pass
+
+
+def default_cache_folder(gdb_file_name):
+    """
+    Default cache folder for a database, which is a folder named "<database>.gdb.cache" next to the database.
+
+    :param gdb_file_name:   database file name
+    :returns:               cache folder name
+
+    .. versionadded:: 2024.1
+    """
+    return os.path.normpath(gdb_file_name) + '.cache'
+
+
+def _file_state(file_name):
+    """(modification time, size) of a file"""
+    st = os.stat(file_name)
+    return st.st_mtime, st.st_size
+
+
+class GdbCache:
+    """
+    Columnar cache of the channel data in a `geosoft.gxpy.gdb.Geosoft_gdb` database.
+
+    :param gdb:     `geosoft.gxpy.gdb.Geosoft_gdb` instance, which must be a named database file.
+    :param folder:  cache folder, default is `default_cache_folder` of the database.
+
+    The cache is valid while the database has no uncommitted changes and the database file modification
+    time and size are the same as when the cache was built.  Use `build` to (re)build the cache.
+
+    Cached data is returned as read-only `numpy.memmap` arrays in the channel data type. Float dummies
+    are numpy.nan, integer dummies are Geosoft dummies, consistent with `Geosoft_gdb.read_channel`.
+
+    Examples:
+
+    .. code::
+
+        import geosoft.gxpy.gdb as gxdb
+        import geosoft.gxpy.gdb_cache as gxcache
+
+        with gxdb.Geosoft_gdb.open('survey.gdb') as gdb:
+            cache = gxcache.GdbCache(gdb)
+            if not cache.is_valid:
+                cache.build()
+            data, fid = cache.read_channel('L100', 'mag')
+
+    .. versionadded:: 2024.1
+    """
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__, self.__dict__)
+
+    def __str__(self):
+        return self._folder
+
+    def __init__(self, gdb, folder=None):
+
+        if not gdb.file_name:
+            raise GdbCacheException(_t('A database cache requires a named database file.'))
+        self._gdb = gdb
+        if folder is None:
+            folder = default_cache_folder(gdb.file_name)
+        self._folder = os.path.normpath(folder)
+        self._manifest = None
+        self._load_manifest()
+
+    def _load_manifest(self):
+        manifest_file = os.path.join(self._folder, MANIFEST_FILE)
+        self._manifest = None
+        if os.path.isfile(manifest_file):
+            try:
+                with open(manifest_file) as f:
+                    manifest = json.load(f)
+                if manifest.get('version') == CACHE_VERSION:
+                    self._manifest = manifest
+            except (OSError, ValueError):
+                self._manifest = None
+
+    @property
+    def folder(self):
+        """cache folder"""
+        return self._folder
+
+    @property
+    def manifest(self):
+        """cache manifest dictionary, None if the cache has not been built"""
+        return self._manifest
+
+    @property
+    def is_valid(self):
+        """
+        `True` if the cache exists and matches the current committed state of the database.
+
+        .. versionadded:: 2024.1
+        """
+        if self._manifest is None:
+            return False
+        if self._gdb.data_has_changed:
+            return False
+        try:
+            mtime, size = _file_state(self._gdb.file_name)
+        except OSError:
+            return False
+        return mtime == self._manifest['mtime'] and size == self._manifest['size']
+
+    @property
+    def coordinate_system(self):
+        """coordinate system of the cached database as a JSON string, None if not cached"""
+        if self._manifest is None:
+            return None
+        return self._manifest.get('coordinate_system')
+
+    def channel_details(self, channel):
+        """
+        Cached channel details dictionary, see `geosoft.gxpy.gdb.Geosoft_gdb.channel_details`.
+
+        :param channel: channel name
+        :returns:       details dictionary, or None if the channel is not cached
+
+        .. versionadded:: 2024.1
+        """
+        if self._manifest is None:
+            return None
+        return self._manifest['channels'].get(channel)
+
+    def has(self, line, channel):
+        """
+        `True` if the line/channel is in the cache.  This does not check cache validity, see `is_valid`.
+
+        :param line:    line name
+        :param channel: channel name
+
+        .. versionadded:: 2024.1
+        """
+        if self._manifest is None:
+            return False
+        return channel in self._manifest['lines'].get(str(line), {})
+
+    def clear(self):
+        """
+        Delete the cache folder and all cached data.
+
+        .. versionadded:: 2024.1
+        """
+        if os.path.isdir(self._folder):
+            shutil.rmtree(self._folder, ignore_errors=True)
+        self._manifest = None
+
+    def build(self, channels=None, lines=None, progress=None):
+        """
+        Build the cache from the current committed database.  Any existing cache is replaced.
+
+        :param channels:    list of channels to cache, default is all channels
+        :param lines:       list of lines to cache, default is all lines
+        :param progress:    progress reporting function
+
+        .. versionadded:: 2024.1
+        """
+
+        gdb = self._gdb
+        if gdb.data_has_changed:
+            raise GdbCacheException(_t('Commit database changes before building a cache.'))
+
+        if channels is None:
+            channels = gdb.sorted_chan_list()
+        else:
+            channels = [gdb.channel_name_symb(c)[0] for c in gdb.sorted_chan_list(channels)]
+        if lines is None:
+            lines = list(gdb.list_lines(select=False))
+        else:
+            lines = [gdb.line_name_symb(ln)[0] for ln in lines]
+
+        self.clear()
+        os.makedirs(self._folder)
+
+        cs = gdb.coordinate_system
+        mtime, size = _file_state(gdb.file_name)
+        manifest = {'version': CACHE_VERSION,
+                    'gdb': gdb.file_name,
+                    'mtime': mtime,
+                    'size': size,
+                    'coordinate_system': cs.json if cs else None,
+                    'channels': {},
+                    'lines': {}}
+
+        for ch in channels:
+            details = gdb.channel_details(ch)
+            details['dtype'] = np.dtype(gdb.channel_dtype(ch)).str
+            manifest['channels'][ch] = details
+
+        for i, line in enumerate(lines):
+            ls = gdb.line_name_symb(line)[1]
+            line_manifest = {}
+            for ch in channels:
+                cs = gdb.channel_name_symb(ch)[1]
+                data, fid = gdb.read_channel(ls, cs)
+                file_name = '{}_{}.npy'.format(ls, cs)
+                np.save(os.path.join(self._folder, file_name), np.ascontiguousarray(data), allow_pickle=False)
+                line_manifest[ch] = {'file': file_name, 'fid': list(fid), 'length': int(data.shape[0])}
+            manifest['lines'][line] = line_manifest
+            if progress:
+                progress(_t('Caching line {}').format(line), ((i + 1) * 100.0) / len(lines))
+
+        with open(os.path.join(self._folder, MANIFEST_FILE), 'w') as f:
+            json.dump(manifest, f)
+        self._manifest = manifest
+
+    def read_channel(self, line, channel):
+        """
+        Read cached data for a line/channel as a read-only memory-mapped array.
+
+        :param line:    line name
+        :param channel: channel name
+        :returns:       (numpy.memmap, (fid_start, fid_increment))
+        :raises:        GdbCacheException if the line/channel is not cached
+
+        .. versionadded:: 2024.1
+        """
+        if not self.has(line, channel):
+            raise GdbCacheException(_t('Line \'{}\' channel \'{}\' is not cached').format(line, channel))
+        entry = self._manifest['lines'][str(line)][channel]
+        file_name = os.path.join(self._folder, entry['file'])
+        if entry['length'] == 0:
+            data = np.load(file_name, allow_pickle=False)
+        else:
+            data = np.load(file_name, mmap_mode='r', allow_pickle=False)
+        return data, tuple(entry['fid'])
+
+    def read_line(self, line, channels, fid=None):
+        """
+        Read cached channels of a line into a 2D array, consistent with `geosoft.gxpy.gdb.Geosoft_gdb.read_line`
+        for float data.  All channels must have the same fiducial, and `fid` must be the same or None.
+
+        :param line:        line name
+        :param channels:    list of channel names
+        :param fid:         required fiducial, None for the fiducial of the cached data
+        :returns:           (numpy array (records, columns), list of column names, fid), or None if the cached
+                            channels cannot be returned without resampling.
+
+        .. versionadded:: 2024.1
+        """
+
+        columns = []
+        names = []
+        line_fid = None
+        length = None
+        for ch in channels:
+            data, ch_fid = self.read_channel(line, ch)
+            if data.shape[0] == 0 or data.dtype.type is np.str_:
+                return None
+            if line_fid is None:
+                line_fid, length = ch_fid, data.shape[0]
+            elif ch_fid != line_fid or data.shape[0] != length:
+                return None
+            if data.ndim == 1:
+                columns.append(data.reshape((-1, 1)))
+                names.append(ch)
+            else:
+                columns.append(data)
+                for i in range(data.shape[1]):
+                    names.append('{}[{}]'.format(ch, str(i)))
+
+        if line_fid is None or (fid is not None and tuple(fid) != line_fid):
+            return None
+
+        npd = np.empty((length, len(names)), dtype=np.float64)
+        icol = 0
+        for data in columns:
+            w = data.shape[1]
+            npd[:, icol: icol + w] = data
+            if not (data.dtype == np.float32 or data.dtype == np.float64):
+                npd[:, icol: icol + w][gxu.dummy_mask(data, axis=None)] = np.nan
+            icol += w
+        return npd, names, line_fid
@@ -0,0 +1,313 @@
+"""
+Per-line channel statistics index for Geosoft databases.
+
+The index holds, for each line and channel, the minimum, maximum, number of valid values, number of
+dummies and the fiducial range.  Line bounding boxes are derived from the statistics of the x, y and z
+channels.  Statistics are computed from the data the first time they are needed, are kept up to date by
+`geosoft.gxpy.gdb.Geosoft_gdb` writes, and are saved to a JSON file next to the database so that they can
+be reused until the database is changed by another application.
+
+:Classes:
+
+    ================== ==============================================
+    :class:`LineIndex` per-line, per-channel database statistics index
+    ================== ==============================================
+
+.. seealso:: `geosoft.gxpy.gdb`, `geosoft.gxpy.gdb.Geosoft_gdb.use_index`
+
+.. note::
+
+    Regression tests provide usage examples:
+    `Tests <https://github.com/GeosoftInc/gxpy/blob/master/geosoft/gxpy/tests/test_gdb_index.py>`_
+
+"""
+import os
+import json
+import numpy as np
+
+import geosoft
+from . import utility as gxu
+
+__version__ = geosoft.__version__
+
+INDEX_VERSION = 1  #: index format version, indexes of a different version are rebuilt
+
+
+def _t(s):
+    return geosoft.gxpy.system.translate(s)
+
+
+def default_index_file(gdb_file_name):
+    """
+    Default index file for a database, "<database>.gdb.index.json" next to the database.
+
+    :param gdb_file_name:   database file name
+    :returns:               index file name
+
+    .. versionadded:: 2024.1
+    """
+    return os.path.normpath(gdb_file_name) + '.index.json'
+
+
+def channel_statistics(data, fid=(0.0, 1.0)):
+    """
+    Summary statistics of channel data.
+
+    :param data:    numpy array of channel data, 1D, or 2D for array channels.
+    :param fid:     data fiducial (start, increment)
+    :returns:       dictionary:
+
+        ============= ===========================================================
+        min           minimum valid value, None if no valid numeric data
+        max           maximum valid value, None if no valid numeric data
+        count         number of valid values
+        dummies       number of dummy values
+        length        number of rows
+        fid           (start, increment) fiducial
+        ============= ===========================================================
+
+    .. versionadded:: 2024.1
+    """
+
+    if not isinstance(data, np.ndarray):
+        data = np.array(data)
+    length = int(data.shape[0]) if data.ndim > 0 else 0
+    stats = {'min': None, 'max': None, 'count': 0, 'dummies': 0, 'length': length,
+             'fid': [float(fid[0]), float(fid[1])]}
+    if data.size == 0:
+        return stats
+
+    mask = gxu.dummy_mask(data, axis=None)
+    ndummy = int(np.count_nonzero(mask))
+    stats['dummies'] = ndummy
+    stats['count'] = int(data.size - ndummy)
+    if stats['count'] and data.dtype.type is not np.str_:
+        valid = data[~mask]
+        stats['min'] = float(valid.min())
+        stats['max'] = float(valid.max())
+    return stats
+
+
+def _file_state(file_name):
+    """(modification time, size) of a file"""
+    st = os.stat(file_name)
+    return st.st_mtime, st.st_size
+
+
+class LineIndex:
+    """
+    Per-line, per-channel statistics index of a `geosoft.gxpy.gdb.Geosoft_gdb` database.
+    Use `geosoft.gxpy.gdb.Geosoft_gdb.use_index` to attach an index to a database so that
+    it is kept up to date as data is written.
+
+    :param gdb:         `geosoft.gxpy.gdb.Geosoft_gdb` instance
+    :param file_name:   index file, default is `default_index_file` for the database. If the database
+                        has no file name the index is kept in memory only, and `file_name` is ignored.
+
+    A saved index is only loaded if the database has no uncommitted changes and the database file
+    modification time and size match those recorded when the index was saved, otherwise the index
+    starts empty.
+
+    .. versionadded:: 2024.1
+    """
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__, self.__dict__)
+
+    def __init__(self, gdb, file_name=None):
+
+        self._gdb = gdb
+        if not gdb.file_name:
+            file_name = None
+        elif file_name is None:
+            file_name = default_index_file(gdb.file_name)
+        self._file_name = file_name
+        self._lines = {}
+        self._dirty = set()
+        self._changed = False
+        self._state = None
+        self._load()
+
+    def _load(self):
+        if not (self._file_name and os.path.isfile(self._file_name)):
+            return
+        if self._gdb.data_has_changed:
+            return
+        try:
+            with open(self._file_name) as f:
+                index = json.load(f)
+            if index.get('version') != INDEX_VERSION:
+                return
+            state = _file_state(self._gdb.file_name)
+            if (index.get('mtime'), index.get('size')) != state:
+                return
+            self._lines = index['lines']
+            self._state = state
+        except (OSError, ValueError, KeyError):
+            self._lines = {}
+
+    @property
+    def file_name(self):
+        """index file name, None if the index is in memory only"""
+        return self._file_name
+
+    @property
+    def lines(self):
+        """list of lines that have indexed statistics"""
+        return list(self._lines)
+
+    def save(self):
+        """
+        Save the index, which should only be done when the database has no uncommitted changes.
+        `geosoft.gxpy.gdb.Geosoft_gdb.commit` saves the attached index.
+
+        .. versionadded:: 2024.1
+        """
+        self._dirty = set()
+        if not self._file_name:
+            return
+        try:
+            state = _file_state(self._gdb.file_name)
+        except OSError:
+            return
+        if not self._changed and state == self._state:
+            return
+        with open(self._file_name, 'w') as f:
+            json.dump({'version': INDEX_VERSION, 'mtime': state[0], 'size': state[1], 'lines': self._lines}, f)
+        self._changed = False
+        self._state = state
+
+    def discard(self):
+        """
+        Forget statistics of lines changed since the index was last saved, called when database changes
+        are discarded.
+
+        .. versionadded:: 2024.1
+        """
+        for line in self._dirty:
+            self._lines.pop(line, None)
+        self._dirty = set()
+
+    def clear(self):
+        """
+        Clear the index and delete the index file.
+
+        .. versionadded:: 2024.1
+        """
+        self._lines = {}
+        self._dirty = set()
+        self._changed = False
+        self._state = None
+        if self._file_name and os.path.isfile(self._file_name):
+            os.remove(self._file_name)
+
+    def update(self, line, channel, data, fid=(0.0, 1.0)):
+        """
+        Update the statistics of a line/channel from data written to the database.
+
+        :param line:    line name
+        :param channel: channel name
+        :param data:    numpy data written to the channel
+        :param fid:     fiducial of the data
+
+        .. versionadded:: 2024.1
+        """
+        line = str(line)
+        self._lines.setdefault(line, {})[channel] = channel_statistics(data, fid)
+        self._dirty.add(line)
+        self._changed = True
+
+    def remove(self, line=None, channel=None):
+        """
+        Remove statistics from the index.
+
+        :param line:    line name, None for all lines
+        :param channel: channel name, None for all channels
+
+        .. versionadded:: 2024.1
+        """
+        lines = list(self._lines) if line is None else [str(line)]
+        for ln in lines:
+            if ln not in self._lines:
+                continue
+            if channel is None:
+                del self._lines[ln]
+            else:
+                self._lines[ln].pop(channel, None)
+            self._changed = True
+
+    def is_indexed(self, line, channel):
+        """
+        `True` if statistics of a line/channel are in the index.
+
+        :param line:    line name
+        :param channel: channel name
+
+        .. versionadded:: 2024.1
+        """
+        return channel in self._lines.get(str(line), {})
+
+    def statistics(self, line, channel):
+        """
+        Statistics of a line/channel, computed from the database data if not yet indexed.
+
+        :param line:    line name or symbol
+        :param channel: channel name or symbol
+        :returns:       statistics dictionary, see `channel_statistics`
+
+        .. versionadded:: 2024.1
+        """
+        ln = self._gdb.line_name_symb(line)[0]
+        cn = self._gdb.channel_name_symb(channel)[0]
+        stats = self._lines.get(ln, {}).get(cn)
+        if stats is None:
+            data, fid = self._gdb.read_channel(ln, cn)
+            stats = channel_statistics(data, fid)
+            self._lines.setdefault(ln, {})[cn] = stats
+            self._changed = True
+        return stats
+
+    def build(self, lines=None, channels=None, progress=None):
+        """
+        Compute statistics for all lines and channels that are not yet indexed.
+
+        :param lines:       lines to index, default all lines
+        :param channels:    channels to index, default all channels
+        :param progress:    progress reporting function
+
+        .. versionadded:: 2024.1
+        """
+        if lines is None:
+            lines = list(self._gdb.list_lines(select=False))
+        if channels is None:
+            channels = self._gdb.sorted_chan_list()
+        for i, line in enumerate(lines):
+            for ch in channels:
+                self.statistics(line, ch)
+            if progress:
+                progress(_t('Indexing line {}').format(line), ((i + 1) * 100.0) / len(lines))
+
+    def line_extent(self, line, xyz=None):
+        """
+        Bounding box of a line from the statistics of the location channels.
+
+        :param line:    line name or symbol
+        :param xyz:     (x, y[, z]) channel names, default is the database `xyz_channels`
+        :returns:       (min_x, min_y, min_z, max_x, max_y, max_z), z values are None if there is no z
+                        channel. Returns None if the line has no valid locations.
+
+        .. versionadded:: 2024.1
+        """
+        if xyz is None:
+            xyz = self._gdb.xyz_channels
+        if xyz[0] is None or xyz[1] is None:
+            return None
+        sx = self.statistics(line, xyz[0])
+        sy = self.statistics(line, xyz[1])
+        if sx['min'] is None or sy['min'] is None:
+            return None
+        zmin = zmax = None
+        if len(xyz) > 2 and xyz[2] is not None:
+            sz = self.statistics(line, xyz[2])
+            zmin, zmax = sz['min'], sz['max']
+        return sx['min'], sy['min'], zmin, sx['max'], sy['max'], zmax
@@ -361,7 +361,7 @@ class Point(Geometry, Sequence):
             super().__init__(coordinate_system=coordinate_system, name=name, **kwargs)
 
             if coordinate_system != p.coordinate_system:
-                self.p = gxcs.Coordinate_translate(p.coordinate_system, coordinate_system).convert(p.p)
+                self.p = gxcs.coordinate_translate(p.coordinate_system, coordinate_system).convert(p.p)
             else:
                 self.p = p.p.copy()
 
@@ -731,81 +731,175 @@ class PPoint(Geometry, Sequence):
 
     :param coordinate_system:   coordinate system or `None`
     :param z:                   constant z value for (x, y) data, ignored for (x, y, z) data
+    :param attributes:          optional dictionary of attribute columns keyed by name, each a single value or
+                                an array-like of one value per point.
     :param kwargs:              passed to base class `Geometry`
 
+    Points are held in a single float64 `block` shaped (3 + number of attributes, number of points), in which
+    the rows are x, y, z followed by the attributes, so no `Point` instances are created unless points are
+    indexed or iterated. Points from a `PPoint` or `Point` instances in a different coordinate system are
+    reprojected when the locations are first read. Slices of a `PPoint` are `PPoint` views of the same block.
+    Use `from_block` to wrap an existing array or numpy.memmap without copying.
+
     Operators supported: = + - * /
 
     .. versionadded:: 9.2
 
     .. versionchanged:: 9.3.1 added coordinate_system parameter
 
+    .. versionchanged:: 2024.1 points are stored in a float64 block with optional attribute columns, and
+                        reprojection is deferred until locations are read.
     """
 
     def __str__(self):
         return "{}({} points)".format(self.name, len(self))
 
-    def __init__(self, xyz, coordinate_system=None, z=0.0, name=None, **kwargs):
+    def __init__(self, xyz, coordinate_system=None, z=0.0, name=None, attributes=None, **kwargs):
 
         if name is None:
             name = '_ppoint_'
         super().__init__(coordinate_system=coordinate_system, name=name, **kwargs)
 
+        if attributes is None:
+            attributes = {}
+        self._attributes = list(attributes.keys())
+        self._pending = []
+        translations = []
+
         def blankpp(length):
-            pp = np.empty(length * 3, dtype=np.float_).reshape((length, 3))
-            pp.fill(np.nan)
-            pp[:, 2] = z
+            pp = np.empty((3 + len(self._attributes), length), dtype=np.float64)
+            pp[2] = z
             return pp
 
         def np_setup(npxyz):
             pp = blankpp(npxyz.shape[0])
-            pp[:, 0] = npxyz[:, 0]
-            pp[:, 1] = npxyz[:, 1]
+            pp[0] = npxyz[:, 0]
+            pp[1] = npxyz[:, 1]
             if npxyz.shape[1] > 2:
-                pp[:, 2] = npxyz[:, 2]
-            else:
-                pp[:, 2] = z
+                pp[2] = npxyz[:, 2]
             return pp
 
         def vv_setup():
             pp = blankpp(xyz[0].length)
-            pp[:, 0] = xyz[0].get_data()[0][:]
-            xyz[1].refid(xyz[0].fid, pp.shape[0])
-            pp[:, 1] = xyz[1].get_data()[0][:]
+            pp[0] = xyz[0].get_data()[0][:]
+            xyz[1].refid(xyz[0].fid, pp.shape[1])
+            pp[1] = xyz[1].get_data()[0][:]
             if len(xyz) > 2:
-                xyz[2].refid(xyz[0].fid, pp.shape[0])
-                pp[:, 2] = xyz[2].np
-            else:
-                pp[:, 2] = z
+                xyz[2].refid(xyz[0].fid, pp.shape[1])
+                pp[2] = xyz[2].np
             return pp
 
         def point_setup(_xyz):
-            pp = blankpp(len(_xyz))
-            i = 0
             if isinstance(_xyz, Point):
                 _xyz = (_xyz,)
+            if not any(isinstance(pt, Geometry) for pt in _xyz):
+                try:
+                    npxyz = np.array(_xyz, dtype=np.float64)
+                    if npxyz.ndim == 2 and npxyz.shape[1] >= 2:
+                        return np_setup(npxyz)
+                except (ValueError, TypeError):
+                    pass
+            pp = blankpp(len(_xyz))
+            i = 0
             for pt in _xyz:
                 if isinstance(pt, Point):
-                    pp[i, :] = _geo_cs(pt, Point, coordinate_system, z=z).p
+                    pp[:3, i] = pt.p
+                    translations.append((i, pt.coordinate_system))
                 else:
+                    translations.append((i, None))
                     try:
-                        pp[i, :] = pt[:3]
+                        pp[:3, i] = pt[:3]
                     except:
-                        pp[i, :] = _geo_cs(pt, Point, coordinate_system, z=z).p
+                        pp[:3, i] = _geo_cs(pt, Point, coordinate_system, z=z).p
                 i += 1
             return pp
 
-        if isinstance(xyz, np.ndarray):
-            self.pp = np_setup(xyz)
+        if isinstance(xyz, PPoint):
+            if coordinate_system is None:
+                coordinate_system = xyz.coordinate_system
+            self._attributes = list(xyz._attributes)
+            translations.append((0, xyz.coordinate_system))
+            self._block = xyz.block.copy()
+        elif isinstance(xyz, np.ndarray):
+            self._block = np_setup(xyz)
         elif isinstance(xyz[0], gxvv.GXvv):
-            self.pp = vv_setup()
+            self._block = vv_setup()
         else:
             if coordinate_system is None:
                 coordinate_system = first_coordinate_system(xyz)
-            self.pp = point_setup(xyz)
+            self._block = point_setup(xyz)
 
         self.coordinate_system = coordinate_system
+        self._defer_translations(translations)
+        for name, values in attributes.items():
+            self.set_attribute(name, values)
         self._next = 0
 
+    def _defer_translations(self, translations, start=0, stop=None):
+        """
+        Record points to reproject to this coordinate system when the locations are read.
+
+        :param translations:    list of (index, coordinate_system) in point order, in which each coordinate system
+                                applies from the index to the next index.
+        :param start, stop:     range of points that the translations cover
+        """
+        if stop is None:
+            stop = len(self)
+        cs = self.coordinate_system
+        run = None
+        for index, cs_from in translations:
+            index += start
+            if run is not None and cs_from is run[1]:
+                continue
+            if run is not None:
+                self._add_pending(run[0], index, run[1], cs)
+            run = (index, cs_from)
+        if run is not None:
+            self._add_pending(run[0], stop, run[1], cs)
+
+    def _add_pending(self, start, stop, cs_from, cs_to):
+        if start >= stop or cs_from is None or cs_to is None or cs_from == cs_to:
+            return
+        if self._pending and self._pending[-1][1] == start and \
+                self._pending[-1][2] == cs_from and self._pending[-1][3] is cs_to:
+            self._pending[-1] = (self._pending[-1][0], stop, cs_from, cs_to)
+        else:
+            self._pending.append((start, stop, cs_from, cs_to))
+
+    def _resolve(self):
+        """reproject points deferred from other coordinate systems"""
+        while self._pending:
+            start, stop, cs_from, cs_to = self._pending.pop(0)
+            gxcs.coordinate_translate(cs_from, cs_to).convert_array(self._block[:3, start:stop].T)
+
+    @classmethod
+    def from_block(cls, block, coordinate_system=None, attributes=None, name=None):
+        """
+        Create a `PPoint` that uses an existing point block without copying.
+
+        :param block:               float64 numpy array or numpy.memmap shaped (3 + number of attributes, n) in
+                                    which the rows are x, y, z followed by attributes.
+        :param coordinate_system:   coordinate system or `None`
+        :param attributes:          list of attribute names, one for each row after z.
+        :param name:                name, default is '_ppoint_'
+        :returns:                   `PPoint` instance, which will change the block if the points are changed.
+
+        .. versionadded:: 2024.1
+        """
+        if attributes is None:
+            attributes = []
+        if not isinstance(block, np.ndarray) or block.dtype != np.float64 or block.ndim != 2 or \
+                block.shape[0] != 3 + len(attributes):
+            raise GeometryException(_t('Point block must be a float64 array shaped (3 + {}, n)')
+                                    .format(len(attributes)))
+        pp = cls.__new__(cls)
+        Geometry.__init__(pp, coordinate_system=coordinate_system, name='_ppoint_' if name is None else name)
+        pp._block = block
+        pp._attributes = list(attributes)
+        pp._pending = []
+        pp._next = 0
+        return pp
+
     @classmethod
     def from_list(cls, xyzlist, z=0.0):
         """
@@ -814,13 +908,13 @@ class PPoint(Geometry, Sequence):
         return cls(xyzlist, z=z)
 
     def __len__(self):
-        return self.pp.shape[0]
+        return self._block.shape[1]
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if self._next >= self.pp.shape[0]:
+        if self._next >= len(self):
             self._next = 0
             raise StopIteration
         else:
@@ -828,7 +922,9 @@ class PPoint(Geometry, Sequence):
             return self.__getitem__(self._next - 1)
 
     def __getitem__(self, item):
-        return Point(self.pp[item], self.coordinate_system)
+        if isinstance(item, (int, np.integer)):
+            return Point(self.pp[item], self.coordinate_system)
+        return PPoint.from_block(self.block[:, item], self.coordinate_system, self._attributes, self.name)
 
     def __add__(self, p):
         if isinstance(p, PPoint):
@@ -887,28 +983,124 @@ class PPoint(Geometry, Sequence):
         :param pp_list: list of `Point`, 'Point2` or `PPoint` instances or point arrays.
         :return:        `PPoint` instance that contains all points
 
+        Each source is copied once into the merged point block.  Attributes of `PPoint` sources are merged
+        by name, with numpy.nan for points from sources that do not have the attribute.  Points in a different
+        coordinate system are reprojected when the merged locations are first read.
+
         .. versionadded:: 9.4
+
+        .. versionchanged:: 2024.1 attributes are merged and reprojection is deferred.
         """
 
-        # count points, get first coordinate system
+        # count points, get first coordinate system and attribute names
         npt = 0
         cs = None
+        attributes = []
         for pp in pp_list:
             npt += len(pp)
             if cs is None and isinstance(pp, Geometry):
                 cs = pp.coordinate_system
+            if isinstance(pp, PPoint):
+                attributes.extend(a for a in pp.attributes if a not in attributes)
 
-        npp = np.zeros((npt, 3))
+        merged = cls.from_block(np.empty((3 + len(attributes), npt)), coordinate_system=cs, attributes=attributes)
+        block = merged._block
+        translations = []
         i = 0
         for pp in pp_list:
-            if not isinstance(pp, Geometry):
-                pp = PPoint(pp, coordinate_system=cs)
-            if pp.coordinate_system != cs:
-                pp = PPoint(pp, coordinate_system=cs)
-            npp[i:(i+len(pp))] = pp.pp
+            if isinstance(pp, PPoint):
+                pp._resolve()
+                block[:3, i:(i + len(pp))] = pp._block[:3]
+                for a in attributes:
+                    block[3 + attributes.index(a), i:(i + len(pp))] = \
+                        pp.attribute(a) if a in pp.attributes else np.nan
+                translations.append((i, pp.coordinate_system))
+            else:
+                if isinstance(pp, Geometry):
+                    translations.append((i, pp.coordinate_system))
+                    pp = pp.pp
+                else:
+                    translations.append((i, None))
+                    pp = PPoint(pp, coordinate_system=cs).pp
+                block[:3, i:(i + len(pp))] = pp.T
+                block[3:, i:(i + len(pp))] = np.nan
             i += len(pp)
 
-        return PPoint(npp, coordinate_system=cs)
+        merged._defer_translations(translations)
+        return merged
+
+    @property
+    def block(self):
+        """
+        float64 point block shaped (3 + number of attributes, number of points), rows are x, y, z then attributes.
+
+        .. versionadded:: 2024.1
+        """
+        self._resolve()
+        return self._block
+
+    @property
+    def pp(self):
+        """
+        (x, y, z) locations as a numpy array shaped (n, 3), which is a view of the point `block`. Can be set.
+
+        .. versionchanged:: 2024.1 a view of the point block.
+        """
+        self._resolve()
+        return self._block[:3].T
+
+    @pp.setter
+    def pp(self, pp):
+        pp = np.asarray(pp, dtype=np.float64)
+        if pp.shape[0] == self._block.shape[1]:
+            block = np.empty(self._block.shape, dtype=np.float64)
+            block[3:] = self._block[3:]
+        else:
+            self._attributes = []
+            block = np.empty((3, pp.shape[0]), dtype=np.float64)
+        block[:3] = pp.T
+        self._block = block
+        self._pending = []
+
+    @property
+    def attributes(self):
+        """
+        list of attribute names
+
+        .. versionadded:: 2024.1
+        """
+        return list(self._attributes)
+
+    def attribute(self, name):
+        """
+        Attribute values, as a view of the point block which can be changed.
+
+        :param name:    attribute name
+        :returns:       numpy float64 array of one value per point
+
+        .. versionadded:: 2024.1
+        """
+        if name not in self._attributes:
+            raise GeometryException(_t('There is no attribute \'{}\'').format(name))
+        return self._block[3 + self._attributes.index(name)]
+
+    def set_attribute(self, name, values):
+        """
+        Set or add an attribute.  Adding an attribute copies the point block.
+
+        :param name:    attribute name
+        :param values:  a single value or an array-like of one value per point
+
+        .. versionadded:: 2024.1
+        """
+        if name in self._attributes:
+            self._block[3 + self._attributes.index(name)] = values
+        else:
+            block = np.empty((self._block.shape[0] + 1, len(self)), dtype=np.float64)
+            block[:-1] = self._block
+            block[-1] = values
+            self._block = block
+            self._attributes.append(name)
 
     @property
     def length(self):
@@ -953,7 +1145,7 @@ class PPoint(Geometry, Sequence):
 
     @property
     def xyz(self):
-        """ xyz point array"""
+        """ xyz point array, a view of the point `block`"""
         return self.pp
 
     @property
@@ -1039,7 +1231,7 @@ class Mesh(Geometry, Sequence):
 
         if isinstance(mesh, Mesh):
             if coordinate_system and coordinate_system != mesh.coordinate_system:
-                t = gxcs.Coordinate_translate(mesh.coordinate_system, coordinate_system)
+                t = gxcs.coordinate_translate(mesh.coordinate_system, coordinate_system)
                 verticies = t.convert(mesh.verticies)
             else:
                 verticies = mesh.verticies.copy()
@@ -1107,7 +1299,7 @@ class Mesh(Geometry, Sequence):
             if self.coordinate_system == m.coordinate_system:
                 v2 = m.verticies
             else:
-                v2 = gxcs.Coordinate_translate(m.coordinate_system, self.coordinate_system).convert(m.verticies)
+                v2 = gxcs.coordinate_translate(m.coordinate_system, self.coordinate_system).convert(m.verticies)
             v2 = np.append(self._verticies, v2, axis=0)
             return Mesh((f2, v2), self.coordinate_system)
         if hasattr(m, '__iter__'):
@@ -6,6 +6,7 @@ Geometry utilities.
     :SPLINE_CUBIC: `geosoft.gxapi.VVU_SPL_CUBIC`
     :SPLINE_AKIMA: `geosoft.gxapi.VVU_SPL_AKIMA`
     :SPLINE_NEAREST: `geosoft.gxapi.VVU_SPL_NEAREST`
+    :RESAMPLE_CHUNK_SIZE: 1000000, samples calculated in each pass of `resample_lines`
 
 .. seealso:: `geosoft.gxpy.geometry`
 
@@ -29,6 +30,8 @@ SPLINE_CUBIC = gxapi.VVU_SPL_CUBIC
 SPLINE_AKIMA = gxapi.VVU_SPL_AKIMA
 SPLINE_NEAREST = gxapi.VVU_SPL_NEAREST
 
+RESAMPLE_CHUNK_SIZE = 1000000
+
 
 def _t(s):
     return geosoft.gxpy.system.translate(s)
@@ -160,3 +163,308 @@ def resample(pp, interval, spline=SPLINE_CUBIC, closed=None):
         return gxgeo.PPoint(xyz, coordinate_system=pp.coordinate_system)
     else:
         return xyz[:, :pp.shape[1]]
+
+
+def lines_to_ragged(lines):
+    """
+    Pack a list of lines into a ragged (offsets, xyz) pair.
+
+    :param lines:   list of `geosoft.gxpy.geometry.PPoint` instances or 2D numpy arrays of points.
+    :return:        (offsets, xyz), where line `i` is `xyz[offsets[i]: offsets[i + 1]]`.  Lines with fewer
+                    columns than the widest line are padded with 0.
+
+    .. seealso:: `lines_from_ragged`, `resample_lines`
+
+    .. versionadded:: 2024.1
+    """
+
+    arrays = []
+    for line in lines:
+        if isinstance(line, gxgeo.PPoint):
+            line = line.pp
+        else:
+            line = np.asarray(line, dtype=np.float64)
+            if line.ndim == 1:
+                line = line.reshape(len(line), 1)
+        arrays.append(line)
+
+    counts = np.array([len(a) for a in arrays], dtype=np.int64)
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    ncol = max([a.shape[1] for a in arrays], default=3)
+    xyz = np.zeros((offsets[-1], ncol), dtype=np.float64)
+    for i, a in enumerate(arrays):
+        xyz[offsets[i]: offsets[i + 1], :a.shape[1]] = a
+    return offsets, xyz
+
+
+def lines_from_ragged(offsets, xyz):
+    """
+    Split a ragged (offsets, xyz) pair into a list of lines.
+
+    :param offsets: line offsets, line `i` is `xyz[offsets[i]: offsets[i + 1]]`
+    :param xyz:     2D numpy array of the points of all lines
+    :return:        list of 2D numpy arrays, which are views of `xyz`
+
+    .. versionadded:: 2024.1
+    """
+
+    return [xyz[offsets[i]: offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def _ragged_index(counts):
+    # position of each element of a ragged array within its own row
+    starts = np.cumsum(counts) - counts
+    return np.arange(np.sum(counts), dtype=np.int64) - np.repeat(starts, counts)
+
+
+def _solve_tridiagonal(a, b, c, r, span):
+    # Parallel cyclic reduction of a set of independent tridiagonal systems laid end to end, in which
+    # a[i] couples x[i - 1], c[i] couples x[i + 1], and no system is longer than span.
+    a = a.copy()
+    b = b.copy()
+    c = c.copy()
+    r = r.copy()
+    s = 1
+    while s < span:
+        alpha = -a[s:] / b[:-s]
+        gamma = -c[:-s] / b[s:]
+        na = np.zeros_like(a)
+        nc = np.zeros_like(c)
+        na[s:] = alpha * a[:-s]
+        nc[:-s] = gamma * c[s:]
+        b[s:] += alpha * c[:-s]
+        b[:-s] += gamma * a[s:]
+        nr = r.copy()
+        nr[s:] += alpha[:, None] * r[:-s]
+        nr[:-s] += gamma[:, None] * r[s:]
+        a, c, r = na, nc, nr
+        s *= 2
+    return r / b[:, None]
+
+
+def resample_lines(offsets, xyz, interval, spline=SPLINE_CUBIC, closed=None):
+    """
+    Resample many lines at a constant separation in one pass.
+
+    This is the batch equivalent of calling `resample` for each line, calculated in numpy without
+    calls to the Geosoft engine.
+
+    :param offsets:     line offsets, line `i` is `xyz[offsets[i]: offsets[i + 1]]`.
+                        See `lines_to_ragged` to create offsets and xyz from a list of lines.
+    :param xyz:         2D numpy array of the points of all lines, (x), (x, y) or (x, y, z)
+    :param interval:    constant sampling interval
+    :param spline:      spline method, `SPLINE_LINEAR`, `SPLINE_CUBIC`, `SPLINE_AKIMA` or `SPLINE_NEAREST`,
+                        as for `resample`.  `SPLINE_CUBIC` is a natural cubic spline.
+    :param closed:      `True` to close all lines, or an array of `True`/`False` for each line. If not
+                        specified a line is closed if the first and last points are the same.
+    :return:            (offsets, xyz) of the resampled lines, with the number of columns of `xyz` up to 3.
+
+    Repeated points are ignored, and lines with fewer than two distinct points are returned unchanged.
+    As for `resample`, closed lines are extended around the join so that smooth splines are continuous
+    at the join, and lines with only two points are resampled with `SPLINE_LINEAR`.
+
+    .. versionadded:: 2024.1
+    """
+
+    if interval <= 0:
+        raise GeometryUtilityException(_t('Interval must be > 0'))
+
+    offsets = np.asarray(offsets, dtype=np.int64)
+    xyz = np.asarray(xyz, dtype=np.float64)
+    if xyz.ndim == 1:
+        xyz = xyz.reshape(len(xyz), 1)
+    ncol = min(xyz.shape[1], 3)
+    if ncol < 3:
+        points = np.zeros((len(xyz), 3), dtype=np.float64)
+        points[:, :ncol] = xyz
+    else:
+        points = xyz[:, :3]
+    nlines = len(offsets) - 1
+    counts = np.diff(offsets)
+    if nlines == 0 or offsets[-1] == 0:
+        return offsets.copy(), xyz[:, :ncol].copy()
+
+    # distinct points of each line
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = np.any(points[1:] != points[:-1], axis=1)
+    keep[offsets[:-1][counts > 0]] = True
+    pts = points[keep]
+    n = np.bincount(np.repeat(np.arange(nlines), counts)[keep], minlength=nlines)
+    first = np.cumsum(n) - n
+    active = n >= 2
+    if not active.any():
+        return offsets.copy(), xyz[:, :ncol].copy()
+    already_closed = np.zeros(nlines, dtype=bool)
+    already_closed[active] = np.all(pts[first[active]] == pts[(first + n - 1)[active]], axis=1)
+    if closed is None:
+        closed = already_closed
+    else:
+        closed = np.array(np.broadcast_to(np.asarray(closed, dtype=bool), (nlines,))) & active
+    linear = active & (n == 2)
+
+    # knots, with closed lines wrapped around the join: 2 points before the start and 3 after
+    period = np.where(already_closed, n - 1, n)
+    smooth_closed = closed & (n > 2)
+    pre = np.where(smooth_closed, 2, 0)
+    nknot = np.where(smooth_closed, period + 5, np.where(closed, 3, n))
+    nknot[~active] = 0
+    last = np.where(closed, pre + period, n - 1)
+    kstart = np.cumsum(nknot) - nknot
+    kline = np.repeat(np.arange(nlines), nknot)
+    knots = pts[first[kline] + (_ragged_index(nknot) - pre[kline]) % period[kline]]
+
+    # distance along each line
+    step = np.zeros(len(knots), dtype=np.float64)
+    step[1:] = np.sqrt(np.sum((knots[1:] - knots[:-1]) ** 2, axis=1))
+    step[kstart[active]] = 0.
+    d = np.cumsum(step)
+    d -= d[kstart[kline]]
+
+    # sample distances
+    d_start = np.zeros(nlines, dtype=np.float64)
+    d_start[active] = d[(kstart + pre)[active]]
+    d_span = np.zeros(nlines, dtype=np.float64)
+    d_span[active] = d[(kstart + last)[active]] - d_start[active]
+    nsample = (d_span / interval).astype(np.int64) + 1 + closed
+    nsample[~active] = 0
+    sline = np.repeat(np.arange(nlines), nsample)
+    ds = d_start[sline] + _ragged_index(nsample) * interval
+
+    # lines are separated along the distance axis so that all samples are located in one search
+    d_end = np.zeros(nlines, dtype=np.float64)
+    d_end[active] = d[(kstart + nknot - 1)[active]]
+    separation = np.maximum(d_end, d_start + nsample * interval) + interval
+    shift = np.cumsum(separation) - separation
+    d_key = d + shift[kline]
+
+    slope = np.zeros_like(knots)
+    slope[:-1] = (knots[1:] - knots[:-1]) / np.where(step[1:] == 0., 1., step[1:])[:, None]
+    kpos = _ragged_index(nknot)
+    kend = (kpos == 0) | (kpos == nknot[kline] - 1)
+
+    if spline == SPLINE_CUBIC:
+
+        # second derivatives of a natural spline at each knot
+        hr = np.zeros_like(step)
+        hr[:-1] = step[1:]
+        a = np.where(kend, 0., step)
+        c = np.where(kend, 0., hr)
+        b = np.where(kend, 1., 2. * (step + hr))
+        r = np.zeros_like(knots)
+        r[1:] = 6. * (slope[1:] - slope[:-1])
+        r[kend] = 0.
+        deriv = _solve_tridiagonal(a, b, c, r, nknot.max())
+        deriv[linear[kline]] = 0.
+
+    elif spline == SPLINE_AKIMA:
+
+        # Akima slopes at each knot from the slopes of the 2 segments either side, with slopes
+        # beyond the ends of a line extrapolated from the first and last 2 segments.
+        nseg = np.maximum(nknot - 1, 0)
+        pstart = np.cumsum(nseg + 4) - (nseg + 4)
+        padded = np.zeros((pstart[-1] + nseg[-1] + 4, 3), dtype=np.float64)
+        segline = np.repeat(np.arange(nlines), nseg)
+        spos = _ragged_index(nseg)
+        padded[pstart[segline] + 2 + spos] = slope[kstart[segline] + spos]
+        ends = active & (nseg >= 2)
+        p = pstart[ends]
+        e = p + 2 + nseg[ends]
+        padded[p + 1] = 2. * padded[p + 2] - padded[p + 3]
+        padded[p] = 2. * padded[p + 1] - padded[p + 2]
+        padded[e] = 2. * padded[e - 1] - padded[e - 2]
+        padded[e + 1] = 2. * padded[e] - padded[e - 1]
+        i = pstart[kline] + kpos
+        w1 = np.abs(padded[i + 3] - padded[i + 2])
+        w2 = np.abs(padded[i + 1] - padded[i])
+        w = w1 + w2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            deriv = np.where(w == 0., 0.5 * (padded[i + 1] + padded[i + 2]),
+                             (w1 * padded[i + 1] + w2 * padded[i + 2]) / w)
+        del padded, w1, w2, w
+
+    sampled = np.empty((len(ds), 3), dtype=np.float64)
+    for c0 in range(0, len(ds), RESAMPLE_CHUNK_SIZE):
+        c1 = min(c0 + RESAMPLE_CHUNK_SIZE, len(ds))
+        sl = sline[c0: c1]
+        seg = np.searchsorted(d_key, ds[c0: c1] + shift[sl], side='right') - 1
+        np.clip(seg, kstart[sl], (kstart + nknot - 2)[sl], out=seg)
+        h = step[seg + 1]
+        u = ((ds[c0: c1] - d[seg]) / h)[:, None]
+        y0 = knots[seg]
+        y1 = knots[seg + 1]
+
+        if spline == SPLINE_NEAREST:
+            sampled[c0: c1] = np.where(u <= 0.5, y0, y1)
+            continue
+
+        y = y0 + u * (y1 - y0)
+        if spline == SPLINE_CUBIC:
+            v = 1. - u
+            y += ((v ** 3 - v) * deriv[seg] + (u ** 3 - u) * deriv[seg + 1]) * (h * h / 6.)[:, None]
+
+        elif spline == SPLINE_AKIMA:
+
+            # cubic Hermite between knots, lines of 2 points stay linear
+            s = slope[seg]
+            hermite = u * (1. - u) ** 2 * (deriv[seg] - s) + u * u * (u - 1.) * (deriv[seg + 1] - s)
+            y += hermite * np.where(linear[sl], 0., h)[:, None]
+
+        sampled[c0: c1] = y
+
+    # closed lines end on the first point, unless the last sample is already there
+    out_n = np.where(active, nsample, counts)
+    sstart = np.cumsum(nsample) - nsample
+    ends = np.flatnonzero(closed)
+    sampled[(sstart + nsample - 1)[ends]] = sampled[sstart[ends]]
+    drop = np.zeros(len(sampled), dtype=bool)
+    ends = ends[np.all(sampled[(sstart + nsample - 1)[ends]] == sampled[(sstart + nsample - 2)[ends]], axis=1)]
+    drop[(sstart + nsample - 1)[ends]] = True
+    out_n[ends] -= 1
+    out_offsets = np.zeros(nlines + 1, dtype=np.int64)
+    np.cumsum(out_n, out=out_offsets[1:])
+
+    result = np.empty((out_offsets[-1], 3), dtype=np.float64)
+    put = np.repeat(active, out_n)
+    result[put] = sampled[~drop]
+    result[~put] = points[np.repeat(~active, counts)]
+    return out_offsets, result[:, :ncol]
+
+
+def points_in_polygon(xy, polygon):
+    """
+    Test which points are inside a polygon.
+
+    :param xy:      points as a 2D numpy array, the first two columns are (x, y)
+    :param polygon: polygon as a `geosoft.gxpy.geometry.PPoint` instance or array-like of (x, y) vertices.
+                    The polygon is implicitly closed.
+    :return:        numpy boolean array, `True` for points inside the polygon.  Points with NaN coordinates
+                    are outside.
+
+    Points are tested using the even-odd rule, so self-intersecting polygons have holes.
+
+    .. versionadded:: 2024.1
+    """
+
+    if isinstance(polygon, gxgeo.PPoint):
+        vertices = polygon.xy
+    else:
+        vertices = np.asarray(polygon, dtype=np.float64)[:, :2]
+    if len(vertices) < 3:
+        raise GeometryUtilityException(_t('A polygon needs at least 3 vertices'))
+
+    xy = np.asarray(xy, dtype=np.float64)
+    x = xy[:, 0]
+    y = xy[:, 1]
+    inside = np.zeros(len(xy), dtype=bool)
+
+    x0, y0 = vertices[-1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for x1, y1 in vertices:
+            crosses = (y1 > y) != (y0 > y)
+            if crosses.any():
+                xcross = x1 + (y - y1) * (x0 - x1) / (y0 - y1)
+                inside ^= crosses & (x < xcross)
+            x0, y0 = x1, y1
+
+    return inside
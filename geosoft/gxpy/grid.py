@@ -9,6 +9,8 @@ Geosoft grid and image handling, including all
    :FILE_READ:       0 open for read, files are not changed
    :FILE_READWRITE:  1 open for read and write, files can be changed
    :FILE_NEW:        2 new grid file, accompanied by `overwrite=` parameter
+   :TILE_SIZE:       256 default tile size for tiled grid access
+   :TILE_CACHE_SIZE: 64 default maximum number of tiles in a grid's tile cache
 
 .. seealso:: :mod:`geosoft.gxpy.grid_utility`, :mod:`geosoft.gxpy.grid_fft`,
     :class:`geosoft.gxapi.GXIMG`, :class:`geosoft.gxapi.GXIMU`
@@ -20,6 +22,7 @@ Geosoft grid and image handling, including all
 
 """
 import os
+import collections
 import numpy as np
 import math
 
@@ -33,6 +36,8 @@ from . import agg as gxagg
 from . import geometry as gxgm
 from . import map as gxmap
 from . import grid_utility as gxgrdu
+from . import grid_statistics as gxgrdst
+from . import grid_overview as gxgrdov
 from . import view as gxview
 from . import gdb as gxgdb
 
@@ -43,6 +48,9 @@ FILE_READ = 0
 FILE_READWRITE = 1
 FILE_NEW = 2
 
+TILE_SIZE = 256
+TILE_CACHE_SIZE = 64
+
 
 def _t(s):
     return geosoft.gxpy.system.translate(s)
@@ -182,16 +190,21 @@ def delete_files(file_name):
                 gxu.delete_file(file_name + str(i))
 
 
-def _transform_color_int_to_rgba(np_values):
+def _transform_color_int_to_rgba(np_values, out=None):
+    """
+    RGBA bytes from color ints of any shape, returned with shape np_values.shape + (4,).  Dummies are
+    changed to 0 in np_values.
+    """
     np_values[np_values == gxapi.iDUMMY] = 0
-    a = (np.right_shift(np_values, 24) & 0xFF).astype(np.uint8)
-    b = (np.right_shift(np_values, 16) & 0xFF).astype(np.uint8)
-    g = (np.right_shift(np_values, 8) & 0xFF).astype(np.uint8)
-    r = (np_values & 0xFF).astype(np.uint8)
+    if out is None:
+        out = np.empty(np_values.shape + (4,), dtype=np.uint8)
+    out[..., 0] = np_values & 0xFF
+    out[..., 1] = np.right_shift(np_values, 8) & 0xFF
+    out[..., 2] = np.right_shift(np_values, 16) & 0xFF
     # the values for color grids actually do not contain alphas but just
     # 0 or 1 to indicate if the color is valid or not
-    a[a > 0] = 255
-    return np.array([r, g, b, a]).transpose()
+    out[..., 3] = np.where((np.right_shift(np_values, 24) & 0xFF) > 0, 255, 0)
+    return out
 
 
 class Grid(gxgm.Geometry):
@@ -302,9 +315,9 @@ class Grid(gxgm.Geometry):
                 if pop:
                     gx.pop_resource(self._open)
                 self._open = None
-                self._buffer_np = None
-                self._buffer_x = None
-                self._buffer_y = None
+                self._tiles = None
+                self._statistics = None
+                self._buffer_xyz = None
                 self._cs = None
                 self._gxpg = None
 
@@ -336,11 +349,13 @@ class Grid(gxgm.Geometry):
         self._metadata_changed = False
         self._metadata_root = ''
         self._img = None
-        self._buffered_row = None
-        self._buffer_np = None
+        self._tile_size = TILE_SIZE
+        self._tile_cache_size = TILE_CACHE_SIZE
+        self._tiles = collections.OrderedDict()
+        self._statistics = {}
+        self._overviews_cleared = False
         self._buffered_xy = None
-        self._buffer_x = None
-        self._buffer_y = None
+        self._buffer_xyz = None
         self._cs = None
         self._gxpg = None
 
@@ -744,11 +759,7 @@ class Grid(gxgm.Geometry):
 
         x, y, z = self.xyz((ix, iy))
 
-        if self._buffered_row != iy:
-            self._buffered_row = iy
-            self._buffer_np = self.read_row(self._buffered_row).np
-
-        v = self._buffer_np[ix]
+        v = self._cached_value(ix, iy)
         if self._is_int:
             v = int(v)
             if v == gxapi.iDUMMY:
@@ -759,26 +770,42 @@ class Grid(gxgm.Geometry):
             v = float(v)
         return x, y, z, v
 
-    def gxpg(self, copy=False):
+    def gxpg(self, copy=False, read_only=False):
         """
         Get a copy of the `geosoft.gxapi.GXPG` instance for the grid.
 
         :param copy:    `True` to return a copy of the grids pager. The default is `False`, which
                         returns the shared grid pager, such that changes to the pager change the grid
                         and the pager is invalid when thr grid is closed or loses context.
+        :param read_only: `True` if the shared pager will only be read.
+
+        The caller may change a writable grid through the shared pager, so unless `read_only` is `True` cached
+        tiles and statistics are dropped.  Files on disk are not changed, overviews built before the grid file
+        is changed through the pager are no longer valid, see `overviews`.
 
         .. versionadded:: 9.1
 
         .. versionchanged:: 9.4 added `copy` parameter
-        """
 
-        if self._gxpg is None:
-            self._gxpg = self._img.geth_pg()
+        .. versionchanged:: 2024.1 grid caches are cleared when the shared pager is returned, added `read_only`
+        """
 
         if copy:
-            pg = gxapi.GXPG.create(self._gxpg.n_rows(), self._gxpg.n_cols(), self._gxpg.e_type())
-            pg.copy(self._gxpg)
+            source = self._pager()
+            pg = gxapi.GXPG.create(source.n_rows(), source.n_cols(), source.e_type())
+            pg.copy(source)
             return pg
+
+        if not (read_only or self._readonly):
+            self.clear_tile_cache()
+            self._statistics = {}
+            self._buffered_xy = None
+        return self._pager()
+
+    def _pager(self):
+        """shared grid pager for reading, which does not clear the grid caches"""
+        if self._gxpg is None:
+            self._gxpg = self._img.geth_pg()
         return self._gxpg
 
     def get_value(self, x, y):
@@ -790,9 +817,194 @@ class Grid(gxgm.Geometry):
         :param x: X location on the grid plane 
         :param y: Y location on the grid plane
         :returns: grid value, or None if outside of grid area
-        
+
+        Scalar values are bi-linearly interpolated from the 4 surrounding grid points, or the nearest
+        point if any of the surrounding points is a dummy.  Grid values are read from the grid's tile cache,
+        see `set_tile_cache`.
+
+        .. versionchanged:: 2024.1 values are from the tile cache
+        """
+
+        u = x - self.x0
+        v = y - self.y0
+        if self.rot != 0.:
+            u, v = u * self._cos_rot - v * self._sin_rot, u * self._sin_rot + v * self._cos_rot
+        fx = u / self.dx
+        fy = v / self.dy
+        if fx < -0.5 or fy < -0.5 or fx > (self.nx - 0.5) or fy > (self.ny - 0.5):
+            return None
+
+        ix = min(max(int(round(fx)), 0), self.nx - 1)
+        iy = min(max(int(round(fy)), 0), self.ny - 1)
+        nearest = self._cached_value(ix, iy)
+        if self.is_color:
+            return None if nearest == gxapi.iDUMMY else int(nearest)
+
+        ix0 = min(max(int(math.floor(fx)), 0), max(self.nx - 2, 0))
+        iy0 = min(max(int(math.floor(fy)), 0), max(self.ny - 2, 0))
+        ix1 = min(ix0 + 1, self.nx - 1)
+        iy1 = min(iy0 + 1, self.ny - 1)
+        v00 = float(self._cached_value(ix0, iy0))
+        v10 = float(self._cached_value(ix1, iy0))
+        v01 = float(self._cached_value(ix0, iy1))
+        v11 = float(self._cached_value(ix1, iy1))
+        corners = (v00, v10, v01, v11)
+        if self._is_int:
+            valid = self._dummy not in corners
+        else:
+            valid = not any(np.isnan(corners))
+        if not valid:
+            if self._is_int:
+                return None if nearest == self._dummy else float(nearest)
+            return None if np.isnan(nearest) else float(nearest)
+
+        wx = min(max(fx - ix0, 0.), 1.)
+        wy = min(max(fy - iy0, 0.), 1.)
+        return float((v00 * (1. - wx) + v10 * wx) * (1. - wy) + (v01 * (1. - wx) + v11 * wx) * wy)
+
+    def set_tile_cache(self, tile_size=None, max_tiles=None):
+        """
+        Set the tile size and maximum number of tiles kept in the grid's tile cache, which is shared by
+        indexed access (grid[ix, iy]), `get_value` and `read_window`.  Existing cached tiles are dropped.
+
+        :param tile_size:   tile size in grid cells, tiles are square. Default is `TILE_SIZE`.
+        :param max_tiles:   maximum number of tiles to keep, the least-recently used tiles are dropped.
+                            Default is `TILE_CACHE_SIZE`.
+
+        .. versionadded:: 2024.1
+        """
+        if tile_size is None:
+            tile_size = TILE_SIZE
+        if max_tiles is None:
+            max_tiles = TILE_CACHE_SIZE
+        if tile_size < 1 or max_tiles < 1:
+            raise GridException(_t('Tile size and tile cache size must be > 0'))
+        self._tile_size = int(tile_size)
+        self._tile_cache_size = int(max_tiles)
+        self.clear_tile_cache()
+
+    def clear_tile_cache(self):
+        """
+        Drop all cached tiles.  This is called when data is written to the grid.
+
+        .. versionadded:: 2024.1
+        """
+        self._tiles = collections.OrderedDict()
+
+    def _tile(self, tx, ty):
+        """cached tile (tx, ty) as a numpy array in the grid dtype, float dummies are numpy.nan"""
+        key = (tx, ty)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        ts = self._tile_size
+        ix0 = tx * ts
+        iy0 = ty * ts
+        tile = np.empty((min(ts, self.ny - iy0), min(ts, self.nx - ix0)), dtype=self.dtype)
+        self._read_window(tile, iy0, tile.shape[0], ix0=ix0)
+        self._tiles[key] = tile
+        if len(self._tiles) > self._tile_cache_size:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def _cached_value(self, ix, iy):
+        """grid value at (ix, iy) from the tile cache"""
+        ts = self._tile_size
+        return self._tile(ix // ts, iy // ts)[iy % ts, ix % ts]
+
+    def read_window(self, ix0=0, iy0=0, nx=None, ny=None, dtype=None, out=None):
+        """
+        Read a window of the grid into a numpy array.  The window is assembled from tiles in the
+        grid's tile cache, see `set_tile_cache`.
+
+        :param ix0:     first column
+        :param iy0:     first row
+        :param nx:      number of columns, default to the last column
+        :param ny:      number of rows, default to the last row
+        :param dtype:   data type, default is the grid dtype
+        :param out:     optional array shape (ny, nx) to receive the data
+        :returns:       numpy array shape (ny, nx), float dummies are numpy.nan.  Color grids are returned as
+                        color ints.
+
+        .. versionadded:: 2024.1
         """
-        return gxu.dummy_none(self.gximg.get_z(x, y))
+
+        if nx is None:
+            nx = self.nx - ix0
+        if ny is None:
+            ny = self.ny - iy0
+        if ix0 < 0 or iy0 < 0 or nx < 0 or ny < 0 or (ix0 + nx) > self.nx or (iy0 + ny) > self.ny:
+            raise GridException(_t('Window ({}, {}, {}, {}) is outside the grid ({}, {})').
+                                format(ix0, iy0, nx, ny, self.nx, self.ny))
+        if out is None:
+            out = np.empty((ny, nx), dtype=self.dtype if dtype is None else dtype)
+        elif out.shape != (ny, nx):
+            raise GridException(_t('Output array shape {} does not match window shape {}').
+                                format(out.shape, (ny, nx)))
+
+        # integer grid tiles hold dummies, which are numpy.nan in a float result
+        nan_dummies = out.dtype.kind == 'f' and np.dtype(self.dtype).kind != 'f' and not self.is_color
+
+        ts = self._tile_size
+        for ty in range(iy0 // ts, (iy0 + ny - 1) // ts + 1 if ny else 0):
+            for tx in range(ix0 // ts, (ix0 + nx - 1) // ts + 1 if nx else 0):
+                tile = self._tile(tx, ty)
+                gx0 = max(ix0, tx * ts)
+                gy0 = max(iy0, ty * ts)
+                gx1 = min(ix0 + nx, tx * ts + tile.shape[1])
+                gy1 = min(iy0 + ny, ty * ts + tile.shape[0])
+                window = out[gy0 - iy0: gy1 - iy0, gx0 - ix0: gx1 - ix0]
+                source = tile[gy0 - ty * ts: gy1 - ty * ts, gx0 - tx * ts: gx1 - tx * ts]
+                window[:] = source
+                if nan_dummies:
+                    window[source == self._dummy] = np.nan
+        return out
+
+    def tiles(self, tile_nx=TILE_SIZE, tile_ny=None, halo=0, dtype=None):
+        """
+        Iterate over the grid in tiles.
+
+        :param tile_nx: tile size in columns
+        :param tile_ny: tile size in rows, default is `tile_nx`
+        :param halo:    number of overlapping cells around each tile, clipped at the grid edges
+        :param dtype:   data type, default is the grid dtype
+        :returns:       yields (ix0, iy0, data, core), where data is a numpy array of the tile including the
+                        halo, (ix0, iy0) is the grid index of data[0, 0], and core is a (row slice, column slice)
+                        tuple of the part of data that is the tile without the halo.
+
+        Each cell is in the core of exactly one tile.  For example, a 3x3 smoothing filter:
+
+        .. code::
+
+            with gxgrd.Grid.open('some.grd') as g:
+                with gxgrd.Grid.new('smooth.grd', properties=g.properties()) as gs:
+                    for ix0, iy0, data, core in g.tiles(512, halo=1):
+                        smooth = data.copy()
+                        smooth[1:-1, 1:-1] = sum(data[1 + j: data.shape[0] - 1 + j, 1 + i: data.shape[1] - 1 + i]
+                                                 for i in (-1, 0, 1) for j in (-1, 0, 1)) / 9.
+                        gs.write_rows(smooth[core], ix0 + core[1].start, iy0 + core[0].start)
+
+        .. versionadded:: 2024.1
+        """
+
+        if tile_ny is None:
+            tile_ny = tile_nx
+        if tile_nx < 1 or tile_ny < 1 or halo < 0:
+            raise GridException(_t('Invalid tile size ({}, {}) or halo {}').format(tile_nx, tile_ny, halo))
+
+        for ty0 in range(0, self.ny, tile_ny):
+            ty1 = min(ty0 + tile_ny, self.ny)
+            iy0 = max(ty0 - halo, 0)
+            iy1 = min(ty1 + halo, self.ny)
+            for tx0 in range(0, self.nx, tile_nx):
+                tx1 = min(tx0 + tile_nx, self.nx)
+                ix0 = max(tx0 - halo, 0)
+                ix1 = min(tx1 + halo, self.nx)
+                data = self.read_window(ix0, iy0, ix1 - ix0, iy1 - iy0, dtype=dtype)
+                core = (slice(ty0 - iy0, ty1 - iy0), slice(tx0 - ix0, tx1 - ix0))
+                yield ix0, iy0, data, core
 
     @classmethod
     def copy(cls, grd, file_name=None, dtype=None, overwrite=False, in_memory=False, mode=FILE_READWRITE):
@@ -898,7 +1110,7 @@ class Grid(gxgm.Geometry):
             p['y0'] = grd.y0 - dy * cos + dx * sin
 
         window_grid = cls.new(name, p, overwrite=overwrite)
-        source_pager = grd.gxpg(copy=False)
+        source_pager = grd.gxpg(read_only=True)
         window_pager = window_grid.gxpg(copy=False)
         window_pager.copy_subset(source_pager, 0, 0, y0, x0, ny, nx)
 
@@ -1156,6 +1368,15 @@ class Grid(gxgm.Geometry):
         """ returns True if grid contains colors. is_int will also be True"""
         return bool(self._img.is_colour())
 
+    @property
+    def read_only(self):
+        """
+        `True` if the grid was opened read-only.
+
+        .. versionadded:: 2024.1
+        """
+        return self._readonly
+
     @property
     def file_name(self):
         """
@@ -1239,6 +1460,7 @@ class Grid(gxgm.Geometry):
     def coordinate_system(self, cs):
         self._cs = gxcs.Coordinate_system(cs)
         self._img.set_ipj(self._cs.gxipj)
+        self._buffered_xy = None
 
     def properties(self):
         """
@@ -1267,6 +1489,122 @@ class Grid(gxgm.Geometry):
 
         return properties
 
+    @property
+    def statistics_cache(self):
+        """
+        `geosoft.gxpy.grid_statistics.StatisticsCache` for this grid, or None if the grid is not a read-only
+        grid file.  Statistics results are cached next to the grid file and reused until the grid file changes.
+
+        .. versionadded:: 2024.1
+        """
+        if not self._readonly or not self.file_name or not os.path.isfile(self.file_name):
+            return None
+        return gxgrdst.StatisticsCache(self.file_name)
+
+    def data_statistics(self, exact=False, threads=None):
+        """
+        Grid data statistics accumulated tile by tile in parallel.
+
+        :param exact:   `True` for exact percentiles and histograms, which holds the valid grid data in memory.
+                        The default estimates percentiles and histograms from a sketch, see
+                        `geosoft.gxpy.grid_statistics.Statistics`.
+        :param threads: number of threads, default is the number of cores
+
+        :returns: `geosoft.gxpy.grid_statistics.Statistics` instance
+
+        Statistics are kept with the grid until data is written to the grid.  Sketch statistics of read-only
+        grid files are also cached in the `statistics_cache`.
+
+        .. versionadded:: 2024.1
+        """
+
+        stats = self._statistics.get(exact)
+        if stats is not None:
+            return stats
+
+        cache = None if exact else self.statistics_cache
+        if cache:
+            cached = cache.get('statistics')
+            if cached:
+                stats = gxgrdst.Statistics.from_dict(cached)
+
+        if stats is None:
+            stats = gxgrdst.tile_statistics((data for _, _, data, _ in
+                                             self.tiles(self._tile_size, dtype=np.float64)),
+                                            exact=exact, threads=threads)
+            if cache:
+                cache.set('statistics', stats.to_dict())
+
+        self._statistics[exact] = stats
+        return stats
+
+    def _clear_overviews(self):
+        """delete overviews of the grid file when the grid data changes"""
+        if self._overviews_cleared or self._readonly:
+            return
+        self._overviews_cleared = True
+        if self.file_name and os.path.isdir(gxgrdov.default_overview_folder(self.file_name)):
+            gxgrdov.GridOverviews(self).clear()
+
+    @property
+    def overviews(self):
+        """
+        `geosoft.gxpy.grid_overview.GridOverviews` of this grid, or None if the grid does not have valid
+        overviews.  See `build_overviews`.
+
+        .. versionadded:: 2024.1
+        """
+        if not self.file_name or not os.path.isdir(gxgrdov.default_overview_folder(self.file_name)):
+            return None
+        overviews = gxgrdov.GridOverviews(self)
+        if not overviews.is_valid:
+            return None
+        return overviews
+
+    def build_overviews(self, levels=gxgrdov.OVERVIEW_LEVELS, method=gxgrdov.OVERVIEW_MEAN):
+        """
+        Build decimated overview levels of the grid, which are saved next to the grid file and used by
+        `read_overview`, `image_file`, `figure_map` and `geosoft.gxpy.grid_utility.sample` for coarse
+        resolution access to the grid.
+
+        :param levels:  overview reduction factors, default is 2, 4, 8 and 16 times the grid cell size
+        :param method:  `geosoft.gxpy.grid_overview.OVERVIEW_MEAN` (default),
+                        `geosoft.gxpy.grid_overview.OVERVIEW_NEAREST` or
+                        `geosoft.gxpy.grid_overview.OVERVIEW_MAX`
+        :returns:       `geosoft.gxpy.grid_overview.GridOverviews` instance
+
+        Overviews can only be built for grids opened read-only, see `geosoft.gxpy.grid_overview.GridOverviews.build`.
+        Overviews are deleted when data is written to the grid.
+
+        .. versionadded:: 2024.1
+        """
+        if not self.file_name or not os.path.isfile(self.file_name):
+            raise GridException(_t('Overviews require a grid file.'))
+        overviews = gxgrdov.GridOverviews(self)
+        overviews.build(levels, method)
+        self._overviews_cleared = False
+        return overviews
+
+    def read_overview(self, cell_size):
+        """
+        Read the grid at a coarser resolution from the overview closest to a cell size.
+
+        :param cell_size:   desired cell size.  The overview level with the largest cell size that is not
+                            greater than this cell size is read, or the grid itself if there is no such level.
+        :returns:           (data, properties), where data is a numpy array shape (ny, nx) with dummies as
+                            numpy.nan and properties is a dictionary of 'nx', 'ny', 'x0', 'y0', 'dx', 'dy'
+                            and 'rot' of the data.
+
+        .. versionadded:: 2024.1
+        """
+        overviews = self.overviews
+        factor = overviews.level(cell_size) if overviews else 1
+        if factor == 1:
+            properties = {k: v for k, v in self.properties().items()
+                          if k in ('nx', 'ny', 'x0', 'y0', 'dx', 'dy', 'rot')}
+            return self.np(), properties
+        return overviews.read(factor), overviews.properties(factor)
+
     def statistics(self, gxst=None):
         """
         Calculate and return current grid data statistics as a dictionary.
@@ -1293,6 +1631,9 @@ class Grid(gxgm.Geometry):
         =============== ============================
 
         .. versionadded:: 9.4
+
+        .. versionchanged:: 2024.1 unless `gxst` is provided, or the grid is an integer grid, statistics are
+            from `data_statistics`, which reuses the statistics of unchanged grids.
         """
 
         def get_st(what):
@@ -1302,7 +1643,10 @@ class Grid(gxgm.Geometry):
             return v
 
         if gxst is None:
+            if not self._is_int:
+                return self.data_statistics().statistics()
             gxst = gxapi.GXST.create()
+
         vv = gxvv.GXvv()
         for iv in range(self.gximg.nv()):
             self.gximg.read_v(iv, 0, 0, vv.gxvv)
@@ -1326,25 +1670,55 @@ class Grid(gxgm.Geometry):
 
         return st
 
+    def percentile(self, q, exact=False):
+        """
+        Grid data percentiles.
+
+        :param q:       percentile, or a sequence of percentiles, in the range 0 to 100.
+        :param exact:   `True` for exact percentiles, default estimates percentiles from the statistics sketch.
+        :returns:       percentile value, or a numpy array for a sequence of percentiles.
+
+        .. versionadded:: 2024.1
+        """
+        return self.data_statistics(exact=exact).percentile(q)
+
+    def histogram(self, bins=256, range=None, exact=False):
+        """
+        Grid data histogram.
+
+        :param bins:    number of equal-width bins, or a sequence of bin edges, see `numpy.histogram`.
+        :param range:   (min, max) range of the bins, default is the data range
+        :param exact:   `True` for an exact histogram, default is from the statistics sketch.
+        :returns:       (counts, bin_edges) numpy arrays, see `numpy.histogram`
+
+        .. versionadded:: 2024.1
+        """
+        return self.data_statistics(exact=exact).histogram(bins=bins, range=range)
+
     @x0.setter
     def x0(self, v):
         self._img.set_info(self.dx, self.dy, v, self.y0, -self.rot)
+        self._buffered_xy = None
 
     @y0.setter
     def y0(self, v):
         self._img.set_info(self.dx, self.dy, self.x0, v, -self.rot)
+        self._buffered_xy = None
 
     @dx.setter
     def dx(self, v):
         self._img.set_info(v, self.dy, self.x0, self.y0, -self.rot)
+        self._buffered_xy = None
 
     @dy.setter
     def dy(self, v):
         self._img.set_info(self.dx, v, self.x0, self.y0, -self.rot)
+        self._buffered_xy = None
 
     @rot.setter
     def rot(self, v):
         self._img.set_info(self.dx, self.dy, self.x0, self.y0, -v)
+        self._buffered_xy = None
         self._cos_rot = math.cos(math.radians(v))
         self._sin_rot = math.sin(math.radians(v))
 
@@ -1428,6 +1802,9 @@ class Grid(gxgm.Geometry):
                 dvv.set_data(data[i, :])
             self._img.write_y(iy, ix0, 0, dvv.gxvv)
             iy += order
+        self.clear_tile_cache()
+        self._statistics = {}
+        self._clear_overviews()
 
     def read_row(self, row=None, start=0, length=None):
         """
@@ -1504,6 +1881,9 @@ class Grid(gxgm.Geometry):
         if length is None:
             length = 0
         self._img.write_y(row, start, length, data.gxvv)
+        self.clear_tile_cache()
+        self._statistics = {}
+        self._clear_overviews()
 
     def write_column(self, data, column=None, start=0, length=None):
         """
@@ -1530,6 +1910,9 @@ class Grid(gxgm.Geometry):
         if length is None:
             length = 0
         self._img.write_x(column, start, length, data.gxvv)
+        self.clear_tile_cache()
+        self._statistics = {}
+        self._clear_overviews()
 
     def reset_read_write(self):
         """ Reset the default read/write to the grid row 0, column 0. """
@@ -1680,83 +2063,175 @@ class Grid(gxgm.Geometry):
         """
         return gxgm.Point2((self.extent_3d()), coordinate_system=self.coordinate_system)
 
-    def np(self, dtype=None):
+    def _row_window(self, iy0, ny):
+        """validated (iy0, ny) row window"""
+        if ny is None:
+            ny = self.ny - iy0
+        if iy0 < 0 or ny < 0 or (iy0 + ny) > self.ny:
+            raise GridException(_t('Row window ({}, {}) is outside the grid rows (0, {})').format(iy0, ny, self.ny))
+        return iy0, ny
+
+    def _read_window(self, out, iy0, ny, ix0=0):
+        """
+        Read grid rows iy0 to iy0 + ny - 1 into a 2D array of shape (ny, nx) through the grid pager, where
+        nx is the width of `out` starting at column ix0.
+        Reads are by column for grids that are stored by column.  A single VV is reused for all reads,
+        and dummies are changed to numpy.nan in one pass over the data if `out` is float.
+        """
+
+        nx = out.shape[1]
+        dtype = np.dtype(self.dtype)
+        if out.dtype == dtype:
+            buffer = out
+        else:
+            buffer = np.empty((ny, nx), dtype=dtype)
+
+        pg = self._pager()
+        gvv = gxvv.GXvv(dtype=dtype).gxvv
+        if self.gximg.query_kx() == -1:
+            for i in range(nx):
+                pg.read_col(ix0 + i, iy0, ny, gvv)
+                buffer[:, i] = gvv.get_data_np(0, ny, dtype)
+        else:
+            for i in range(ny):
+                pg.read_row(iy0 + i, ix0, nx, gvv)
+                buffer[i, :] = gvv.get_data_np(0, nx, dtype)
+
+        if out.dtype == np.float32 or out.dtype == np.float64:
+            mask = buffer == self._dummy
+            if buffer is not out:
+                out[:] = buffer
+            out[mask] = np.nan
+        elif buffer is not out:
+            out[:] = buffer
+        return out
+
+    def np(self, dtype=None, out=None, iy0=0, ny=None):
         """
         Return a numpy array of grid values in the working dtype.
 
         :param dtype:   desired data type, default is the work_dtype, ignored for color grids
+        :param out:     optional array to receive the data, shape (ny, nx), or (ny, nx, 4) for color grids
+        :param iy0:     first row to read, default is 0
+        :param ny:      number of rows to read, default is to the last row
 
-        :returns: numpy array shape (nx, ny) or (nx, ny, 4) containing RGBA bytes in case of color grids
+        :returns: numpy array shape (ny, nx) or (ny, nx, 4) containing RGBA bytes in case of color grids.
+                  If `out` is provided `out` is returned.
 
         .. versionadded:: 9.3.1
+
+        .. versionchanged:: 2024.1
+            added `out`, `iy0` and `ny`.  Data is read through the grid pager into the result without
+            intermediate arrays, and color transforms are done over the whole array.
         """
 
         nx = self.nx
-        ny = self.ny
+        iy0, ny = self._row_window(iy0, ny)
         if self.is_color:
-            data = np.zeros((ny, nx, 4), np.dtype(np.uint8))
+            shape = (ny, nx, 4)
+            dtype = np.dtype(np.uint8)
         else:
-            if dtype is None:
-                dtype = self.dtype
-            data = np.zeros((ny, nx), dtype=dtype)
-        if self.gximg.query_kx() == -1:
-            for i in range(self.nx):
-                column = self.read_column(i).np
-                if self.is_color:
-                    column = _transform_color_int_to_rgba(column)
-                data[:, i] = column
+            shape = (ny, nx)
+            dtype = np.dtype(self.dtype if dtype is None else dtype)
+
+        if out is not None:
+            if out.shape != shape:
+                raise GridException(_t('Output array shape {} does not match required shape {}').
+                                    format(out.shape, shape))
+            if self.is_color and out.dtype != dtype:
+                raise GridException(_t('Color grid output array must be {}').format(dtype))
         else:
-            for i in range(self.ny):
-                row = self.read_row(i).np
-                if self.is_color:
-                    row = _transform_color_int_to_rgba(row)
-                data[i, :] = row
+            out = np.empty(shape, dtype=dtype)
+
+        if self.is_color:
+            values = self._read_window(np.empty((ny, nx), dtype=self.dtype), iy0, ny)
+            return _transform_color_int_to_rgba(values, out=out)
 
-        return data
+        return self._read_window(out, iy0, ny)
 
-    def xyzv(self):
+    def xyzv(self, out=None, iy0=0, ny=None):
         """
         Return a numpy float array of (x, y, z, v) grid points.
 
         x, y, z) is the location of each grid point in 3D space and v is the grid value at that location.
         Dummies will be numpy.nan.
 
-        :returns: numpy array shape (nx, ny, 4)
+        :param out:     optional float64 array shape (ny, nx, 4) to receive the data
+        :param iy0:     first row, default is 0
+        :param ny:      number of rows, default is to the last row
+
+        :returns: numpy array shape (ny, nx, 4)
 
         .. versionadded:: 9.2
+
+        .. versionchanged:: 2024.1
+            added `out`, `iy0` and `ny`, and grid values are read through the grid pager.
         """
 
         nx = self.nx
-        ny = self.ny
-        dx = self.dx
-        dy = self.dy
-        cs = self.coordinate_system
-        xyzv = np.zeros((ny, nx, 4))
-        xyzv[:, :, 0:2] = np.mgrid[0: (nx - 0.5) * dx: dx, 0: (ny - 0.5) * dy: dy].swapaxes(0, 2)
+        iy0, ny = self._row_window(iy0, ny)
 
-        if self.rot != 0.:
-            x = xyzv[:, :, 0]
-            cosx = x * self._cos_rot
-            sinx = x * self._sin_rot
-            y = xyzv[:, :, 1]
-            cosy = y * self._cos_rot
-            siny = y * self._sin_rot
-            xyzv[:, :, 0] = cosx + siny
-            xyzv[:, :, 1] = cosy - sinx
+        if out is not None:
+            if out.shape != (ny, nx, 4) or out.dtype != np.float64:
+                raise GridException(_t('Output array must be float64 shape {}').format((ny, nx, 4)))
+            xyzv = out
+        else:
+            xyzv = np.empty((ny, nx, 4))
+        self.xyz_window(0, iy0, nx, ny, out=xyzv[:, :, :3])
 
-        xyzv += (self.x0, self.y0, 0, 0)
+        self._read_window(xyzv[:, :, 3], iy0, ny)
 
-        if cs.is_oriented:
-            xyzv[:, :, :3] = cs.xyz_from_oriented(xyzv[:, :, :3].reshape((-1, 3))).reshape((ny, nx, 3))
+        return xyzv
 
-        if self.gximg.query_kx() == -1:
-            for i in range(self.nx):
-                xyzv[:, i, 3] = self.read_column(i).np
+    def xyz_window(self, ix0=0, iy0=0, nx=None, ny=None, out=None):
+        """
+        Return the (x, y, z) locations of a window of grid points.
+
+        :param ix0:     first column
+        :param iy0:     first row
+        :param nx:      number of columns, default to the last column
+        :param ny:      number of rows, default to the last row
+        :param out:     optional float64 array shape (ny, nx, 3) to receive the locations
+
+        :returns: numpy array shape (ny, nx, 3)
+
+        Locations are calculated for the whole window at once, including the grid rotation, and for
+        grids in an oriented coordinate system locations are oriented in 3D with a single call to
+        `geosoft.gxpy.coordinate_system.Coordinate_system.xyz_from_oriented`.  Grids that are not oriented
+        have z = 0.
+
+        .. versionadded:: 2024.1
+        """
+
+        if nx is None:
+            nx = self.nx - ix0
+        if ny is None:
+            ny = self.ny - iy0
+        if ix0 < 0 or iy0 < 0 or nx < 0 or ny < 0 or (ix0 + nx) > self.nx or (iy0 + ny) > self.ny:
+            raise GridException(_t('Window ({}, {}, {}, {}) is outside the grid ({}, {})').
+                                format(ix0, iy0, nx, ny, self.nx, self.ny))
+        if out is None:
+            out = np.empty((ny, nx, 3))
+        elif out.shape != (ny, nx, 3) or out.dtype != np.float64:
+            raise GridException(_t('Output array must be float64 shape {}').format((ny, nx, 3)))
+
+        u = np.arange(ix0, ix0 + nx) * self.dx
+        v = (np.arange(iy0, iy0 + ny) * self.dy).reshape((-1, 1))
+        if self.rot != 0.:
+            out[:, :, 0] = u * self._cos_rot + v * self._sin_rot
+            out[:, :, 1] = v * self._cos_rot - u * self._sin_rot
         else:
-            for i in range(self.ny):
-                xyzv[i, :, 3] = self.read_row(i).np
+            out[:, :, 0] = u
+            out[:, :, 1] = v
+        out[:, :, 0] += self.x0
+        out[:, :, 1] += self.y0
+        out[:, :, 2] = 0.
 
-        return xyzv
+        cs = self.coordinate_system
+        if cs.is_oriented and out.size:
+            out[:] = cs.xyz_from_oriented(out.reshape((-1, 3))).reshape((ny, nx, 3))
+
+        return out
 
     def xyz(self, item):
         """
@@ -1766,6 +2241,8 @@ class Grid(gxgm.Geometry):
         :return: tuple (x, y, z) location
 
         .. versionadded:: 9.2.1
+
+        .. versionchanged:: 2024.1 locations of the row are calculated together by `xyz_window`
         """
 
         if isinstance(item, int):
@@ -1775,29 +2252,46 @@ class Grid(gxgm.Geometry):
             ix, iy = item
 
         if self._buffered_xy != iy:
+            self._buffer_xyz = self.xyz_window(0, iy, self.nx, 1)[0]
             self._buffered_xy = iy
-            self._buffer_x = np.arange(self.nx, dtype=np.float64)
-            self._buffer_x *= self.dx
-            self._buffer_y = np.zeros(self.nx, dtype=np.float64)
-            self._buffer_y += iy * self.dy
 
-            if self.rot != 0.:
-                rx = self._buffer_x * self._cos_rot + self._buffer_y * self._sin_rot
-                self._buffer_y *= self._buffer_y * self._cos_rot
-                self._buffer_y -= self._buffer_x * self._sin_rot
-                self._buffer_x = rx
+        x, y, z = self._buffer_xyz[ix]
+        return float(x), float(y), float(z)
+
+    def xyzv_rows(self, rows=1):
+        """
+        Iterate over the grid in strips of rows.
+
+        :param rows:    number of rows in each strip, the last strip may have fewer rows
+        :returns:       yields (iy0, xyzv), where iy0 is the first row of the strip and xyzv is a numpy array
+                        shape (rows, nx, 4) as returned by `xyzv`.
 
-            self._buffer_x += self.x0
-            self._buffer_y += self.y0
+        .. versionadded:: 2024.1
+        """
 
-        ggx = self._buffer_x[ix]
-        ggy = self._buffer_y[ix]
-        ggz = 0.
+        if rows < 1:
+            raise GridException(_t('rows must be > 0'))
+        for iy0 in range(0, self.ny, rows):
+            yield iy0, self.xyzv(iy0=iy0, ny=min(rows, self.ny - iy0))
 
-        if self.coordinate_system.is_oriented:
-            ggx, ggy, ggz = self.coordinate_system.xyz_from_oriented((ggx, ggy, ggz))
+    def xyzv_tiles(self, tile_nx=TILE_SIZE, tile_ny=None):
+        """
+        Iterate over the grid in tiles of (x, y, z, v) grid points.
 
-        return ggx, ggy, ggz
+        :param tile_nx: tile size in columns
+        :param tile_ny: tile size in rows, default is `tile_nx`
+        :returns:       yields (ix0, iy0, xyzv), where (ix0, iy0) is the grid index of xyzv[0, 0] and
+                        xyzv is a float64 numpy array shape (ny, nx, 4).  Dummies are numpy.nan.
+
+        .. versionadded:: 2024.1
+        """
+
+        for ix0, iy0, data, _ in self.tiles(tile_nx, tile_ny, dtype=np.float64):
+            ny, nx = data.shape
+            xyzv = np.empty((ny, nx, 4))
+            self.xyz_window(ix0, iy0, nx, ny, out=xyzv[:, :, :3])
+            xyzv[:, :, 3] = data
+            yield ix0, iy0, xyzv
 
     def image_file(self, image_file_name=None, image_type=gxmap.RASTER_FORMAT_PNG, pix_width=None,
                    shade=False, color_map=None, contour=None, display_area=None, pix_32_bit=False):
@@ -1859,7 +2353,21 @@ class Grid(gxgm.Geometry):
         :return:    A `geosoft.gxpy.group.Color_map` instance.
 
         .. versionadded:: 9.4.0
+
+        .. versionchanged:: 2024.1 linear, normal and log-linear colour maps use the grid `statistics`.
         """
+        if method in (gxapi.ITR_ZONE_LINEAR, gxapi.ITR_ZONE_NORMAL, gxapi.ITR_ZONE_LOGLINEAR):
+            st = self.statistics()
+            if st['num_data'] and not (method == gxapi.ITR_ZONE_LOGLINEAR and st['min'] <= 0.):
+                cmap = geosoft.gxpy.group.Color_map()
+                if method == gxapi.ITR_ZONE_LINEAR:
+                    cmap.set_linear(st['min'], st['max'], inner_limits=False)
+                elif method == gxapi.ITR_ZONE_NORMAL:
+                    cmap.set_normal(st['sd'], st['mean'])
+                else:
+                    cmap.set_logarithmic(st['min'], st['max'])
+                return cmap
+
         itr = gxapi.GXITR.create_img(self._img, "", method, gxapi.rDUMMY)
         return geosoft.gxpy.group.Color_map(itr)
 
@@ -1940,7 +2448,26 @@ def grid_bool(*args, **kwargs):
     return gxgrdu.grid_bool(*args, **kwargs)
 
 
-def figure_map(grid_file, map_file=None, shade=True, color_map=None, contour=None, **kwargs):
+def _overview_grid(grid_file, cell_size):
+    """temporary grid file of the overview closest to a cell size, None if there is no coarser overview"""
+    with Grid.open(grid_file) as g:
+        overviews = g.overviews
+        if overviews is None:
+            return None
+        factor = overviews.level(cell_size)
+        if factor == 1:
+            return None
+        data = overviews.read(factor)
+        properties = overviews.properties(factor)
+        properties['dtype'] = data.dtype
+        properties['coordinate_system'] = g.coordinate_system
+        properties['unit_of_measure'] = g.unit_of_measure
+        with Grid.new(gx.gx().temp_file('.grd(GRD)'), properties=properties) as og:
+            og.write_rows(data)
+            return og.file_name_decorated
+
+
+def figure_map(grid_file, map_file=None, shade=True, color_map=None, contour=None, cell_size=None, **kwargs):
     """
     Create a map figure from a grid file.
 
@@ -1949,14 +2476,23 @@ def figure_map(grid_file, map_file=None, shade=True, color_map=None, contour=Non
     :param shade:       `True` to add shading effect
     :param color_map:   `geosoft.gxpy.group.Color_map` instance, or a colour ramp file name, default is user's default
     :param contour:     colour contour interval if colours need to break at exact levels
+    :param cell_size:   display cell size, if the grid has overviews (see `Grid.build_overviews`) the figure is
+                        made from the closest overview.  The default displays the grid at full resolution.
     :param kwargs:      passed to  `geosoft.gxpy.agg.Aggregate_image.figure_map` and `geosoft.gxpy.map.Map.new`
     :return:            `geosoft.gxpy.map.Map` instance
 
     .. versionadded:: 9.3
+
+    .. versionchanged:: 2024.1 added `cell_size`
     """
 
-    with gxagg.Aggregate_image.new(grid_file, shade=shade, color_map=color_map, contour=contour) as agg:
-        return agg.figure_map(file_name=map_file, **kwargs)
+    overview = _overview_grid(grid_file, cell_size) if cell_size else None
+    try:
+        with gxagg.Aggregate_image.new(overview or grid_file, shade=shade, color_map=color_map,
+                                       contour=contour) as agg:
+            return agg.figure_map(file_name=map_file, **kwargs)
+    finally:
+        delete_files(overview)
 
 
 def image_file(grid_file, image_file=None, image_type=gxmap.RASTER_FORMAT_PNG, pix_width=None,
@@ -1978,13 +2514,29 @@ def image_file(grid_file, image_file=None, image_type=gxmap.RASTER_FORMAT_PNG, p
 
     :return:            image file name.
 
+    If `pix_width` is specified and the grid has overviews (see `Grid.build_overviews`), the image is made from
+    the closest overview that has at least `pix_width` points across the grid, or display area.
+
     .. versionadded:: 9.3.1
+
+    .. versionchanged:: 2024.1 images are made from grid overviews if available
     """
 
-    if color_map is None:
-        with Grid.open(grid_file) as g:
+    overview = None
+    with Grid.open(grid_file) as g:
+        if color_map is None:
             color_map = g.get_default_color_map()
-
-    with gxagg.Aggregate_image.new(grid_file, shade=shade, color_map=color_map, contour=contour) as agg:
-        return agg.image_file(image_file, image_type=image_type, pix_width=pix_width,
-                              display_area=display_area, pix_32_bit=pix_32_bit)
+        if pix_width and g.overviews:
+            if display_area is None:
+                width = g.extent_2d()[2] - g.extent_2d()[0]
+            else:
+                width = gxgm.Point2(display_area, coordinate_system=g.coordinate_system).dimension_xy[0]
+            overview = _overview_grid(grid_file, width / pix_width)
+
+    try:
+        with gxagg.Aggregate_image.new(overview or grid_file, shade=shade, color_map=color_map,
+                                       contour=contour) as agg:
+            return agg.image_file(image_file, image_type=image_type, pix_width=pix_width,
+                                  display_area=display_area, pix_32_bit=pix_32_bit)
+    finally:
+        delete_files(overview)
@@ -7,6 +7,21 @@ Geosoft Fast Fourier Transform processes for 2D gridded data.
 Note that 'wavenumber' in this module refers to cycles/unit_distance. Multiply by 2*math.pi for the
 angular wavenumber.
 
+Transforms and filters use the Geosoft FFT2 engine by default. The `GridFFT` methods prefixed `np_` are a
+numpy backend that works on a cached numpy transform of the expanded and filled grid, which avoids transform
+and filter file I/O and allows many filter chains to be applied to one forward transform in parallel.
+The numpy backend supports the following filters, specified the same way as for `GridFFT.filter`:
+
+    ============================ =============================================================
+    'CNUP height'                upward continuation
+    'CNDN depth'                 downward continuation
+    'DRVX order'                 derivative in the grid X direction
+    'DRVY order'                 derivative in the grid Y direction
+    'DRVZ order'                 vertical derivative
+    'REDP [inc [dec [ainc]]]'    reduction to the pole, with optional amplitude-correction
+                                 inclination `ainc` for low magnetic latitudes
+    ============================ =============================================================
+
 .. seealso:: :class:`geosoft.gxapi.GXFFT2`
 
 .. note::
@@ -15,6 +30,7 @@ angular wavenumber.
     `Tests <https://github.com/GeosoftInc/gxpy/blob/master/geosoft/gxpy/tests/test_grid_fft.py>`_
     
 """
+import os
 import numpy as np
 import math
 
@@ -25,6 +41,7 @@ from . import grid as gxgrd
 from . import grid_utility as gxgrdu
 from . import utility as gxu
 from . import vv as gxvv
+from . import system as gxsys
 
 __version__ = geosoft.__version__
 
@@ -45,6 +62,9 @@ I_LOG_POWER = 2
 I_DEPTH_3 = 3
 I_DEPTH_5 = 4
 
+_CONTINUATION_FILTERS = ('CNUP', 'CNDN')
+_NP_FILTERS = ('CNUP', 'CNDN', 'DRVX', 'DRVY', 'DRVZ', 'REDP')
+
 
 class GridFFTException(geosoft.GXRuntimeError):
     """ Exceptions from this module. """
@@ -170,7 +190,7 @@ class GridFFT:
             # expand for periodic function
             gxc.log(_t('Expand from ({}, {})').format(grid.nx, grid.ny))
             xpg = gxapi.GXPG.create(1, 1, tpg.e_type())
-            gxapi.GXPGU.expand(buffer_grid.gxpg(), xpg, expand, 1, 0, 0)
+            gxapi.GXPGU.expand(buffer_grid.gxpg(read_only=True), xpg, expand, 1, 0, 0)
 
             xnx = xpg.n_cols()
             xny = xpg.n_rows()
@@ -228,8 +248,9 @@ class GridFFT:
         method = _t('edge') if trend_edge == 1 else _t('all')
         gxc.log(_t('Remove {} order trend determined from {} data ...').format(trend_order, method))
         self._trend = gxapi.GXTR.create(trend_order)
+        self._trend_order = trend_order
         tpg = gxapi.GXPG.create(grid.ny, grid.nx, self._source_grid.gxtype)
-        gxapi.GXPGU.trend(grid.gxpg(), tpg, self._trend, 0,
+        gxapi.GXPGU.trend(grid.gxpg(read_only=True), tpg, self._trend, 0,
                           trend_edge,
                           grid.x0, grid.y0,
                           grid.dx, grid.dy)
@@ -243,7 +264,7 @@ class GridFFT:
 
             gxc.log(_t('Expand from ({}, {})').format(grid.nx, grid.ny))
             ppg = gxapi.GXPG.create(1, 1, tpg.e_type())
-            gxapi.GXPGU.expand(grid.gxpg(), ppg, expand, 1, 0, 0)
+            gxapi.GXPGU.expand(grid.gxpg(read_only=True), ppg, expand, 1, 0, 0)
             gxc.log(_t('         to ({}, {})...').format(ppg.n_cols(), ppg.n_rows()))
             props = grid.properties()
             xx, xy = (ppg.n_cols() - grid.nx) // 2, (ppg.n_rows() - grid.ny) // 2
@@ -274,6 +295,11 @@ class GridFFT:
         self._filtered_spectrum = None
         self._source_average_spectral_density = None
         self._filtered_average_spectral_density = None
+        self._np_source = None
+        self._np_uv = None
+        self._np_mask = None
+        self._np_trend = None
+        self._np_source_spectrum = None
 
         # track
         self._open = gx.track_resource(self.__class__.__name__, str(self))
@@ -549,7 +575,7 @@ class GridFFT:
             gxapi.GXFFT2.rad_spc(tr.gximg, spec_file)
         except geosoft.gxapi.GXAPIError:
             tpg = gxapi.GXPG.create(tr.ny, tr.nx, gxapi.GS_FLOAT)
-            tpg.copy(tr.gxpg())
+            tpg.copy(tr.gxpg(read_only=True))
             with gxgrd.Grid.from_data_array(tpg, properties=tr.properties()) as tgd:
                 tgd.delete_files()
                 gxapi.GXFFT2.rad_spc(tgd.gximg, spec_file)
@@ -739,3 +765,273 @@ class GridFFT:
         result.mask(self.source_grid)
 
         return result
+
+    @property
+    def np_source_transform(self):
+        """
+        Numpy transform of the expanded and filled grid, a complex numpy array shaped (ny, nx // 2 + 1)
+        from `numpy.fft.rfft2`. The transform is calculated once and cached.
+
+        .. versionadded:: 2024.1
+        """
+        if self._np_source is None:
+            data = self._prep_grid.np(dtype=np.float64)
+            data[np.isnan(data)] = 0.
+            self._np_source = np.fft.rfft2(data)
+        return self._np_source
+
+    def np_wavenumbers(self):
+        """
+        Wavenumbers of the numpy transform in cycles/unit_distance.
+
+        :returns: (u, v), u shaped (1, nx // 2 + 1) in the grid X direction and v shaped (ny, 1) in the
+                  grid Y direction, which broadcast to the shape of `np_source_transform`.
+
+        .. versionadded:: 2024.1
+        """
+        if self._np_uv is None:
+            u = np.fft.rfftfreq(self._prep_grid.nx, self._prep_grid.dx).reshape((1, -1))
+            v = np.fft.fftfreq(self._prep_grid.ny, self._prep_grid.dy).reshape((-1, 1))
+            self._np_uv = (u, v)
+        return self._np_uv
+
+    @staticmethod
+    def _np_filter_list(filters):
+        """parse filters to a list of (name, [parameters])"""
+        if filters is None:
+            return []
+        if isinstance(filters, str):
+            filters = [filters]
+        parsed = []
+        for f in filters:
+            if isinstance(f, str):
+                f = f.split()
+            name = str(f[0]).upper()
+            if name not in _NP_FILTERS:
+                raise GridFFTException(_t('Filter "{}" is not supported by the numpy backend.').format(name))
+            parsed.append((name, [float(p) for p in f[1:]]))
+        return parsed
+
+    def np_filter(self, filters=None, transform=None, mag_inclination=None, mag_declination=None):
+        """
+        Apply filters to the numpy transform.
+
+        :param filters:         list of filters, see the module documentation for the supported filters.
+        :param transform:       transform to filter, default is `np_source_transform`, which is not changed.
+        :param mag_inclination: default magnetic field inclination for 'REDP'
+        :param mag_declination: default magnetic field declination for 'REDP'
+        :returns:               filtered transform as a complex numpy array
+
+        This method only works on numpy arrays and may be called from multiple threads once
+        `np_wavenumbers` has been called.
+
+        .. versionadded:: 2024.1
+        """
+
+        if transform is None:
+            transform = self.np_source_transform
+        u, v = self.np_wavenumbers()
+        k = np.sqrt(u**2 + v**2)
+
+        transform = transform.copy()
+        for name, params in self._np_filter_list(filters):
+
+            if name in ('CNUP', 'CNDN'):
+                if not params:
+                    raise GridFFTException(_t('{} requires a distance').format(name))
+                sign = -1. if name == 'CNUP' else 1.
+                transform *= np.exp(sign * 2. * math.pi * params[0] * k)
+
+            elif name == 'DRVZ':
+                transform *= (2. * math.pi * k) ** (params[0] if params else 1.)
+
+            elif name in ('DRVX', 'DRVY'):
+                w = u if name == 'DRVX' else v
+                transform *= (2j * math.pi * w) ** int(params[0] if params else 1)
+
+            else:
+                inc = params[0] if len(params) > 0 else mag_inclination
+                dec = params[1] if len(params) > 1 else mag_declination
+                if inc is None or dec is None:
+                    raise GridFFTException(_t('REDP requires a magnetic inclination and declination'))
+                ainc = params[2] if len(params) > 2 else inc
+                inc = math.radians(inc)
+                dec = math.radians(dec)
+                ainc = math.radians(ainc)
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    kh = np.where(k > 0., (u * math.sin(dec) + v * math.cos(dec)) / k, 0.)
+                theta = (math.sin(ainc) + 1j * math.cos(inc) * kh) * (math.sin(inc) + 1j * math.cos(inc) * kh)
+                theta[np.abs(theta) < 1.0e-6] = 1.0e-6
+                theta[0, 0] = 1.
+                transform /= theta
+
+        return transform
+
+    def _np_trend_surface(self):
+        """trend removed from the source grid on the source grid footprint, cached"""
+        if self._np_trend is None:
+            sg = self._source_grid
+            trend = gxapi.GXTR.create(self._trend_order)
+            self._source_transform.gximg.get_tr(trend)
+            with gxgrd.Grid.from_data_array(np.zeros((sg.ny, sg.nx))) as zero:
+                zero.delete_files()
+                tpg = gxapi.GXPG.create(sg.ny, sg.nx, gxapi.GS_DOUBLE)
+                gxapi.GXPGU.trend(zero.gxpg(read_only=True), tpg, trend, 2, 1, sg.x0, sg.y0, sg.dx, sg.dy)
+            with gxgrd.Grid.from_data_array(tpg) as tg:
+                tg.delete_files()
+                self._np_trend = tg.np(dtype=np.float64)
+        return self._np_trend
+
+    def _np_source_mask(self):
+        """dummy mask of the source grid, cached"""
+        if self._np_mask is None:
+            self._np_mask = np.isnan(self._source_grid.np(dtype=np.float64))
+        return self._np_mask
+
+    def _np_footprint(self):
+        """(prep_ny, prep_nx), (iy0, ix0, ny, nx) of the source grid footprint in the expanded grid"""
+        sg = self._source_grid
+        pny = self._prep_grid.ny
+        pnx = self._prep_grid.nx
+        return (pny, pnx), ((pny - sg.ny) // 2, (pnx - sg.nx) // 2, sg.ny, sg.nx)
+
+    @staticmethod
+    def _np_inverse(transform, shape, footprint):
+        """inverse numpy transform cropped to the source grid footprint, no engine calls"""
+        data = np.fft.irfft2(transform, s=shape)
+        iy0, ix0, ny, nx = footprint
+        return data[iy0: iy0 + ny, ix0: ix0 + nx]
+
+    def np_results(self, filter_chains, threads=None, mag_inclination=None, mag_declination=None):
+        """
+        Apply a list of filter chains to the numpy source transform in parallel.
+
+        :param filter_chains:   list of filter chains, each a list of filters as for `np_filter`.
+        :param threads:         number of threads, default is the number of cores
+        :param mag_inclination: default magnetic field inclination for 'REDP'
+        :param mag_declination: default magnetic field declination for 'REDP'
+        :returns:               list of numpy arrays shaped (source_ny, source_nx) of the filtered results,
+                                dummies (numpy.nan) where the source grid is dummy.
+
+        The trend removed from the source grid is added back to the results of chains that contain only
+        continuation filters.  Other results are of the de-trended data.
+
+        Example of a sweep of upward continuation heights:
+
+        .. code::
+
+            import geosoft.gxpy.grid_fft as gxfft
+
+            heights = [50. * (i + 1) for i in range(50)]
+            with gxfft.GridFFT('some_mag_grid_file.grd') as fft:
+                results = fft.np_results([[('CNUP', h)] for h in heights])
+
+        .. versionadded:: 2024.1
+        """
+
+        chains = [self._np_filter_list(chain) for chain in filter_chains]
+
+        # engine reads on this thread, numpy filtering in parallel
+        _ = self.np_source_transform
+        _ = self.np_wavenumbers()
+        shape, footprint = self._np_footprint()
+        mask = self._np_source_mask()
+        trend = None
+        if any(all(name in _CONTINUATION_FILTERS for name, _ in chain) for chain in chains):
+            trend = self._np_trend_surface()
+
+        def apply(chain):
+            data = self._np_inverse(self.np_filter(chain,
+                                                   mag_inclination=mag_inclination,
+                                                   mag_declination=mag_declination),
+                                     shape, footprint)
+            if trend is not None and all(name in _CONTINUATION_FILTERS for name, _ in chain):
+                data = data + trend
+            data[mask] = np.nan
+            return data
+
+        if threads is None:
+            threads = os.cpu_count() or 1
+        if len(chains) > 1 and threads > 1:
+            return gxsys.parallel_map(apply, chains, threads=threads)
+        return [apply(chain) for chain in chains]
+
+    def np_result_grid(self, filters=None, file_name=None, overwrite=False,
+                       mag_inclination=None, mag_declination=None):
+        """
+        Filter result grid from the numpy backend.
+
+        :param filters:         list of filters, see the module documentation for the supported filters.
+        :param file_name:       result grid file, default creates a temporary grid
+        :param overwrite:       `True` to overwrite an existing grid
+        :param mag_inclination: default magnetic field inclination for 'REDP'
+        :param mag_declination: default magnetic field declination for 'REDP'
+        :return:                `geosoft.gxpy.grid.Grid` instance
+
+        .. versionadded:: 2024.1
+        """
+        data = self.np_results([filters], threads=1,
+                               mag_inclination=mag_inclination, mag_declination=mag_declination)[0]
+        return gxgrd.Grid.from_data_array(data.astype(self._source_grid.dtype),
+                                          properties=self._source_grid.properties(),
+                                          file_name=file_name, overwrite=overwrite)
+
+    def np_radially_averaged_spectrum(self, filters=None, mag_inclination=None, mag_declination=None):
+        """
+        Radially averaged spectrum of the numpy transform as a Numpy array shaped (n_wavenumbers, 5).
+
+        :param filters:         filters to apply before calculating the spectrum, default is the spectrum of the
+                                source transform, which is cached.
+        :param mag_inclination: default magnetic field inclination for 'REDP'
+        :param mag_declination: default magnetic field declination for 'REDP'
+
+        Columns are as for `radially_averaged_spectrum`, wavenumber in cycles per 1000 * distance unit of
+        measure.  Power is the squared transform amplitude divided by the number of points in the transform,
+        averaged in rings of width equal to the coarser of the u and v wavenumber increments, and the point
+        depths are the negative local slope of the log_power divided by (4 * pi).
+
+        .. versionadded:: 2024.1
+        """
+
+        if not filters and self._np_source_spectrum is not None:
+            return self._np_source_spectrum
+
+        transform = self.np_filter(filters, mag_inclination=mag_inclination, mag_declination=mag_declination)
+        u, v = self.np_wavenumbers()
+        nx = self._prep_grid.nx
+        ny = self._prep_grid.ny
+
+        # folded columns other than 0 and the x Nyquist represent two points of the full transform
+        weight = np.full(u.shape, 2.)
+        weight[0, 0] = 1.
+        if nx % 2 == 0:
+            weight[0, -1] = 1.
+        weight = np.broadcast_to(weight, transform.shape)
+
+        dk = max(1.0 / (nx * self._prep_grid.dx), 1.0 / (ny * self._prep_grid.dy))
+        kmax = min(0.5 / self._prep_grid.dx, 0.5 / self._prep_grid.dy)
+        ring = np.rint(np.sqrt(u**2 + v**2) / dk).astype(np.int64)
+        ring = np.broadcast_to(ring, transform.shape).ravel()
+        length = int(kmax / dk) + 1
+        inside = ring < length
+        power = (transform.real**2 + transform.imag**2).ravel() / (nx * ny)
+
+        count = np.bincount(ring[inside], weights=weight.ravel()[inside], minlength=length)
+        total = np.bincount(ring[inside], weights=(weight.ravel() * power)[inside], minlength=length)
+
+        spectrum = np.full((length, 5), np.nan)
+        spectrum[:, I_WAVENUMBER] = np.arange(length) * dk * 1000.
+        spectrum[:, I_SAMPLE_COUNT] = count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            spectrum[:, I_LOG_POWER] = np.log(np.clip(total / count, 1.0e-20, None))
+
+        log_power = spectrum[:, I_LOG_POWER]
+        k = spectrum[:, I_WAVENUMBER]
+        if length > 2:
+            spectrum[1:-1, I_DEPTH_3] = -(log_power[2:] - log_power[:-2]) / (k[2:] - k[:-2]) / (4. * math.pi)
+        if length > 4:
+            spectrum[2:-2, I_DEPTH_5] = -(log_power[4:] - log_power[:-4]) / (k[4:] - k[:-4]) / (4. * math.pi)
+
+        if not filters:
+            self._np_source_spectrum = spectrum
+        return spectrum
@@ -0,0 +1,353 @@
+"""
+Decimated overview levels of a grid.
+
+Overviews are reduced copies of a grid at 2x, 4x, 8x, ... the grid cell size, built in one pass through the
+grid and saved as numpy `.npy` files in a folder next to the grid so that previews and coarse sampling of large
+grids can read a small overview rather than decode the whole grid.  A JSON manifest records the geometry of
+each level and the grid file modification time and size used to decide if the overviews are still valid.
+
+Each overview point is reduced from a block of grid points:
+
+    =================== ==============================================================
+    OVERVIEW_MEAN       mean of the valid points in the block, located at the block centre
+    OVERVIEW_NEAREST    the first point of the block
+    OVERVIEW_MAX        maximum of the valid points in the block, located at the block centre
+    =================== ==============================================================
+
+:Classes:
+
+    ======================= ==============================
+    :class:`GridOverviews`  overview levels of a grid file
+    ======================= ==============================
+
+.. seealso:: `geosoft.gxpy.grid.Grid.build_overviews`, `geosoft.gxpy.grid.Grid.read_overview`
+
+.. note::
+
+    Regression tests provide usage examples:
+    `Tests <https://github.com/GeosoftInc/gxpy/blob/master/geosoft/gxpy/tests/test_grid_overview.py>`_
+
+.. versionadded:: 2024.1
+"""
+import os
+import json
+import math
+import shutil
+import functools
+import warnings
+import numpy as np
+
+import geosoft
+
+__version__ = geosoft.__version__
+
+OVERVIEW_MEAN = 0
+OVERVIEW_NEAREST = 1
+OVERVIEW_MAX = 2
+OVERVIEW_LEVELS = (2, 4, 8, 16)  #: default overview reduction factors
+MANIFEST_FILE = 'manifest.json'  #: name of the overview manifest file
+OVERVIEW_VERSION = 1  #: overview format version, overviews of a different version are rebuilt
+
+
+def _t(s):
+    return geosoft.gxpy.system.translate(s)
+
+
+class GridOverviewException(geosoft.GXRuntimeError):
+    """
+    Exceptions from :mod:`geosoft.gxpy.grid_overview`.
+
+    .. versionadded:: 2024.1
+    """
+    pass
+
+
+def default_overview_folder(grid_file_name):
+    """
+    Default overview folder for a grid, which is a folder named "<grid>.overviews" next to the grid.
+
+    :param grid_file_name:  grid file name, without decorations
+    :returns:               overview folder name
+
+    .. versionadded:: 2024.1
+    """
+    return os.path.normpath(grid_file_name) + '.overviews'
+
+
+def _file_state(file_name):
+    """(modification time, size) of a file"""
+    st = os.stat(file_name)
+    return st.st_mtime, st.st_size
+
+
+def _reduce(data, factor, method):
+    """reduce blocks of factor x factor points of 2D data, partial blocks at the end are padded with nan"""
+    ny, nx = data.shape
+    py = -ny % factor
+    px = -nx % factor
+    if py or px:
+        data = np.pad(data, ((0, py), (0, px)), mode='constant', constant_values=np.nan)
+    blocks = data.reshape((data.shape[0] // factor, factor, data.shape[1] // factor, factor))
+    if method == OVERVIEW_NEAREST:
+        return blocks[:, 0, :, 0]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        if method == OVERVIEW_MAX:
+            return np.nanmax(blocks, axis=(1, 3))
+        return np.nanmean(blocks, axis=(1, 3))
+
+
+class GridOverviews:
+    """
+    Overview levels of a `geosoft.gxpy.grid.Grid` file.
+
+    :param grid:    `geosoft.gxpy.grid.Grid` instance, which must be a grid file
+    :param folder:  overview folder, default is `default_overview_folder` of the grid.
+
+    Overviews are valid while the grid file modification time and size are the same as when the overviews were
+    built.  `geosoft.gxpy.grid.Grid` deletes the overviews of a grid when data is written to the grid.
+
+    Examples:
+
+    .. code::
+
+        import geosoft.gxpy.grid as gxgrd
+
+        with gxgrd.Grid.open('big.grd') as g:
+            g.build_overviews()
+
+        with gxgrd.Grid.open('big.grd') as g:
+            data, properties = g.read_overview(cell_size=g.dx * 10)
+
+    .. versionadded:: 2024.1
+    """
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__, self.__dict__)
+
+    def __str__(self):
+        return self._folder
+
+    def __init__(self, grid, folder=None):
+
+        if not grid.file_name:
+            raise GridOverviewException(_t('Overviews require a grid file.'))
+        self._grid = grid
+        if folder is None:
+            folder = default_overview_folder(grid.file_name)
+        self._folder = os.path.normpath(folder)
+        self._manifest = None
+        self._load_manifest()
+
+    def _load_manifest(self):
+        manifest_file = os.path.join(self._folder, MANIFEST_FILE)
+        self._manifest = None
+        if os.path.isfile(manifest_file):
+            try:
+                with open(manifest_file) as f:
+                    manifest = json.load(f)
+                if manifest.get('version') == OVERVIEW_VERSION:
+                    self._manifest = manifest
+            except (OSError, ValueError):
+                self._manifest = None
+
+    @property
+    def folder(self):
+        """overview folder"""
+        return self._folder
+
+    @property
+    def manifest(self):
+        """overview manifest dictionary, None if overviews have not been built"""
+        return self._manifest
+
+    @property
+    def is_valid(self):
+        """
+        `True` if the overviews exist and match the grid file.
+
+        .. versionadded:: 2024.1
+        """
+        if self._manifest is None:
+            return False
+        try:
+            mtime, size = _file_state(self._grid.file_name)
+        except OSError:
+            return False
+        return mtime == self._manifest['mtime'] and size == self._manifest['size']
+
+    @property
+    def levels(self):
+        """sorted list of overview reduction factors, empty if there are no overviews"""
+        if self._manifest is None:
+            return []
+        return sorted(int(f) for f in self._manifest['levels'])
+
+    @property
+    def method(self):
+        """overview reduction method, None if there are no overviews"""
+        if self._manifest is None:
+            return None
+        return self._manifest['method']
+
+    def clear(self):
+        """
+        Delete the overview folder and all overviews.
+
+        .. versionadded:: 2024.1
+        """
+        if os.path.isdir(self._folder):
+            shutil.rmtree(self._folder, ignore_errors=True)
+        self._manifest = None
+
+    def build(self, levels=OVERVIEW_LEVELS, method=OVERVIEW_MEAN, progress=None):
+        """
+        Build overviews from the grid, replacing existing overviews.
+
+        :param levels:      overview reduction factors, each > 1, default is `OVERVIEW_LEVELS`
+        :param method:      `OVERVIEW_MEAN`, `OVERVIEW_NEAREST` or `OVERVIEW_MAX`
+        :param progress:    progress reporting function
+
+        The grid is read once in strips of rows, from which all levels are reduced.  The grid must be open
+        read-only, because the overviews record the state of the grid file, which is only final once a grid
+        open for writing is closed.
+
+        .. versionadded:: 2024.1
+        """
+
+        levels = sorted(set(int(f) for f in levels))
+        if not levels or levels[0] < 2:
+            raise GridOverviewException(_t('Overview levels must be > 1'))
+        if method not in (OVERVIEW_MEAN, OVERVIEW_NEAREST, OVERVIEW_MAX):
+            raise GridOverviewException(_t('Invalid overview method {}').format(method))
+
+        g = self._grid
+        if not g.read_only:
+            raise GridOverviewException(_t('Grid {} is open for writing, overviews can only be built for grids '
+                                           'opened read-only.').format(g.file_name))
+        nx = g.nx
+        ny = g.ny
+        dtype = np.float32 if np.dtype(g.dtype) == np.float32 else np.float64
+
+        self.clear()
+        os.makedirs(self._folder)
+
+        mtime, size = _file_state(g.file_name)
+        manifest = {'version': OVERVIEW_VERSION,
+                    'grid': g.file_name,
+                    'mtime': mtime,
+                    'size': size,
+                    'method': method,
+                    'dtype': np.dtype(dtype).str,
+                    'levels': {}}
+
+        arrays = {}
+        for f in levels:
+            file_name = 'level_{}.npy'.format(f)
+            shape = ((ny + f - 1) // f, (nx + f - 1) // f)
+            arrays[f] = np.lib.format.open_memmap(os.path.join(self._folder, file_name), mode='w+',
+                                                  dtype=dtype, shape=shape)
+            offset = 0. if method == OVERVIEW_NEAREST else (f - 1) * 0.5
+            x0, y0 = g.xy_from_index(offset, offset)
+            manifest['levels'][str(f)] = {'file': file_name, 'nx': shape[1], 'ny': shape[0],
+                                          'x0': x0, 'y0': y0, 'dx': g.dx * f, 'dy': g.dy * f, 'rot': g.rot}
+
+        # strips are a multiple of all reduction factors
+        lcm = functools.reduce(lambda a, b: a * b // math.gcd(a, b), levels)
+        rows = lcm * max(1, 256 // lcm)
+        for iy0 in range(0, ny, rows):
+            strip = g.np(dtype=np.float64, iy0=iy0, ny=min(rows, ny - iy0))
+            for f in levels:
+                reduced = _reduce(strip, f, method)
+                arrays[f][iy0 // f: iy0 // f + reduced.shape[0]] = reduced
+            if progress:
+                progress(_t('Building overviews'), (min(iy0 + rows, ny) * 100.0) / ny)
+
+        for a in arrays.values():
+            a.flush()
+        with open(os.path.join(self._folder, MANIFEST_FILE), 'w') as f:
+            json.dump(manifest, f)
+        self._manifest = manifest
+
+    def level(self, cell_size):
+        """
+        The overview level closest to a cell size that is not coarser than the cell size.
+
+        :param cell_size:   desired cell size in grid units
+        :returns:           overview reduction factor, 1 for the grid itself
+
+        .. versionadded:: 2024.1
+        """
+        base = min(abs(self._grid.dx), abs(self._grid.dy))
+        best = 1
+        for f in self.levels:
+            if f * base <= cell_size * (1. + 1.0e-9):
+                best = f
+        return best
+
+    def properties(self, factor):
+        """
+        Geometry of an overview level.
+
+        :param factor:  overview reduction factor
+        :returns:       dictionary with 'nx', 'ny', 'x0', 'y0', 'dx', 'dy', 'rot'
+
+        .. versionadded:: 2024.1
+        """
+        if factor not in self.levels:
+            raise GridOverviewException(_t('There is no overview level {}').format(factor))
+        p = dict(self._manifest['levels'][str(factor)])
+        del p['file']
+        return p
+
+    def read(self, factor):
+        """
+        Read an overview level as a read-only memory-mapped array.
+
+        :param factor:  overview reduction factor
+        :returns:       numpy.memmap shape (ny, nx), dummies are numpy.nan
+
+        .. versionadded:: 2024.1
+        """
+        if factor not in self.levels:
+            raise GridOverviewException(_t('There is no overview level {}').format(factor))
+        file_name = os.path.join(self._folder, self._manifest['levels'][str(factor)]['file'])
+        return np.load(file_name, mmap_mode='r', allow_pickle=False)
+
+    def sample(self, xy, factor):
+        """
+        Sample an overview level at locations on the grid plane.
+
+        :param xy:      numpy array shape (n, 2) or (n, 3) of locations on the grid plane
+        :param factor:  overview reduction factor
+        :returns:       numpy float64 array of n values bi-linearly interpolated between overview points, nan
+                        outside the overview or next to dummies.
+
+        .. versionadded:: 2024.1
+        """
+
+        p = self.properties(factor)
+        data = self.read(factor)
+        xy = np.asarray(xy, dtype=np.float64)
+        u = xy[:, 0] - p['x0']
+        v = xy[:, 1] - p['y0']
+        if p['rot'] != 0.:
+            c = math.cos(math.radians(p['rot']))
+            s = math.sin(math.radians(p['rot']))
+            u, v = u * c - v * s, u * s + v * c
+        fx = u / p['dx']
+        fy = v / p['dy']
+
+        result = np.full(len(xy), np.nan)
+        inside = (fx >= 0.) & (fy >= 0.) & (fx <= p['nx'] - 1) & (fy <= p['ny'] - 1)
+        fx = fx[inside]
+        fy = fy[inside]
+        ix = np.minimum(np.floor(fx).astype(np.int64), max(p['nx'] - 2, 0))
+        iy = np.minimum(np.floor(fy).astype(np.int64), max(p['ny'] - 2, 0))
+        ix1 = np.minimum(ix + 1, p['nx'] - 1)
+        iy1 = np.minimum(iy + 1, p['ny'] - 1)
+        wx = fx - ix
+        wy = fy - iy
+        result[inside] = ((data[iy, ix] * (1. - wx) + data[iy, ix1] * wx) * (1. - wy) +
+                          (data[iy1, ix] * (1. - wx) + data[iy1, ix1] * wx) * wy)
+        return result
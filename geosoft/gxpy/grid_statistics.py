@@ -0,0 +1,529 @@
+"""
+Streaming grid data statistics.
+
+Statistics are accumulated from blocks of data, such as the tiles of a grid, into a `Statistics`
+instance, and partial `Statistics` from different blocks or threads can be merged.  Moments are
+accumulated with pairwise updates so that results do not depend on the order of the blocks.  Percentiles and
+histograms are either exact, which requires the valid data to be held in memory, or estimated from a
+mergeable logarithmic-bucket sketch, which limits the relative error of percentile values to `SKETCH_ACCURACY`.
+
+Sketch statistics of a grid file are cached in a JSON file next to the grid, see `StatisticsCache`, and
+are reused until the grid file is changed.
+
+:Classes:
+
+    ========================== ======================================================
+    :class:`Statistics`        mergeable data statistics, percentiles and histograms
+    :class:`StatisticsCache`   statistics cache file for a grid
+    ========================== ======================================================
+
+.. seealso:: `geosoft.gxpy.grid.Grid.statistics`, `geosoft.gxpy.grid.Grid.histogram`
+
+.. note::
+
+    Regression tests provide usage examples:
+    `Tests <https://github.com/GeosoftInc/gxpy/blob/master/geosoft/gxpy/tests/test_grid_statistics.py>`_
+
+.. versionadded:: 2024.1
+"""
+import os
+import json
+import math
+import numpy as np
+
+import geosoft
+from . import system as gxsys
+
+__version__ = geosoft.__version__
+
+SKETCH_ACCURACY = 0.001  #: relative accuracy of sketch percentiles
+CACHE_VERSION = 2  #: statistics cache format version, caches of a different version are ignored
+
+_SKETCH_MIN_VALUE = 1.0e-300
+
+
+def _t(s):
+    return geosoft.gxpy.system.translate(s)
+
+
+class GridStatisticsException(geosoft.GXRuntimeError):
+    """
+    Exceptions from :mod:`geosoft.gxpy.grid_statistics`.
+
+    .. versionadded:: 2024.1
+    """
+    pass
+
+
+def _add_counts(counts, keys, n):
+    for k, c in zip(keys.tolist(), n.tolist()):
+        counts[k] = counts.get(k, 0) + c
+
+
+class Statistics:
+    """
+    Mergeable statistics of numeric data.
+
+    :param exact:   `True` to keep the valid data for exact percentiles and histograms. The default uses a
+                    sketch, which needs much less memory and can be cached.
+    :param accuracy:    relative accuracy of sketch percentiles, default is `SKETCH_ACCURACY`.
+
+    Examples:
+
+    .. code::
+
+        import geosoft.gxpy.grid_statistics as gxgrdst
+
+        stats = gxgrdst.Statistics()
+        for data in blocks:
+            stats.add(data)
+        print(stats.statistics()['sd'], stats.percentile((5, 50, 95)))
+
+    .. versionadded:: 2024.1
+    """
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__, self.__dict__)
+
+    def __init__(self, exact=False, accuracy=SKETCH_ACCURACY):
+
+        if not (0. < accuracy < 1.):
+            raise GridStatisticsException(_t('Accuracy must be between 0 and 1'))
+        self._exact = bool(exact)
+        self._accuracy = accuracy
+        self._log_gamma = math.log((1. + accuracy) / (1. - accuracy))
+
+        self.num_data = 0
+        self.num_dummy = 0
+        self.min = None
+        self.max = None
+        self._mean = 0.
+        self._m2 = 0.
+        self._m3 = 0.
+        self._m4 = 0.
+        self._log_sum = 0.
+        self._num_non_positive = 0
+
+        self._positive = {}
+        self._negative = {}
+        self._zeros = 0
+        self._values = []
+
+    @property
+    def exact(self):
+        """`True` if percentiles and histograms are exact"""
+        return self._exact
+
+    @property
+    def accuracy(self):
+        """relative accuracy of sketch percentiles"""
+        return self._accuracy
+
+    def _merge_moments(self, n, mean, m2, m3, m4):
+        na = self.num_data
+        if na == 0:
+            self._mean, self._m2, self._m3, self._m4 = mean, m2, m3, m4
+            return
+        nb = n
+        nn = na + nb
+        d = mean - self._mean
+        d_n = d / nn
+        m2a = self._m2
+        m3a = self._m3
+        self._mean += d_n * nb
+        self._m4 += (m4 + d * d_n ** 3 * na * nb * (na * na - na * nb + nb * nb) +
+                     6. * d_n * d_n * (na * na * m2 + nb * nb * m2a) + 4. * d_n * (na * m3 - nb * m3a))
+        self._m3 += m3 + d * d_n * d_n * na * nb * (na - nb) + 3. * d_n * (na * m2 - nb * m2a)
+        self._m2 += m2 + d * d_n * na * nb
+
+    def add(self, data):
+        """
+        Add data to the statistics.
+
+        :param data:    numpy array of any shape, numpy.nan values are dummies.
+        :returns:       self
+
+        .. versionadded:: 2024.1
+        """
+
+        data = np.asarray(data, dtype=np.float64).ravel()
+        valid = data[~np.isnan(data)]
+        self.num_dummy += data.size - valid.size
+        n = valid.size
+        if n == 0:
+            return self
+
+        vmin = float(valid.min())
+        vmax = float(valid.max())
+        self.min = vmin if self.min is None else min(self.min, vmin)
+        self.max = vmax if self.max is None else max(self.max, vmax)
+
+        mean = float(valid.mean())
+        d = valid - mean
+        d2 = d * d
+        self._merge_moments(n, mean, float(d2.sum()), float((d2 * d).sum()), float((d2 * d2).sum()))
+        self.num_data += n
+
+        positive = valid > 0.
+        npos = int(np.count_nonzero(positive))
+        self._num_non_positive += n - npos
+        if npos:
+            self._log_sum += float(np.log(valid[positive]).sum())
+
+        if self._exact:
+            self._values.append(valid)
+        else:
+            mag = np.abs(valid)
+            zero = mag < _SKETCH_MIN_VALUE
+            self._zeros += int(np.count_nonzero(zero))
+            keys = np.ceil(np.log(mag[~zero]) / self._log_gamma).astype(np.int64)
+            negative = valid[~zero] < 0.
+            _add_counts(self._positive, *np.unique(keys[~negative], return_counts=True))
+            _add_counts(self._negative, *np.unique(keys[negative], return_counts=True))
+
+        return self
+
+    def merge(self, other):
+        """
+        Merge statistics from another `Statistics` instance, which must have the same `exact` and
+        `accuracy` settings.
+
+        :param other:   `Statistics` instance
+        :returns:       self
+
+        .. versionadded:: 2024.1
+        """
+
+        if other.exact != self._exact or other.accuracy != self._accuracy:
+            raise GridStatisticsException(_t('Statistics must have the same exact and accuracy settings to merge.'))
+
+        self.num_dummy += other.num_dummy
+        if other.num_data == 0:
+            return self
+
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._merge_moments(other.num_data, other._mean, other._m2, other._m3, other._m4)
+        self.num_data += other.num_data
+        self._log_sum += other._log_sum
+        self._num_non_positive += other._num_non_positive
+
+        self._values.extend(other._values)
+        for k, c in other._positive.items():
+            self._positive[k] = self._positive.get(k, 0) + c
+        for k, c in other._negative.items():
+            self._negative[k] = self._negative.get(k, 0) + c
+        self._zeros += other._zeros
+        return self
+
+    def statistics(self):
+        """
+        Statistics as a dictionary, consistent with `geosoft.gxpy.grid.Grid.statistics`:
+
+        =============== ============================
+        min             minimum
+        max             maximum
+        mean            mean
+        geometric_mean  geometric mean, None unless all data is > 0
+        variance        variance
+        sd              standard deviation
+        skew            skew
+        kurtosis        kurtosis
+        sum             sum of all data
+        sum_power_2     sum of data**2
+        sum_power_3     sum of data**3
+        sum_power_4     sum of data**4
+        num_data        number of valid data values
+        num_dummy       number of dummy values
+        =============== ============================
+
+        Values that cannot be calculated from the data are None.
+
+        .. versionadded:: 2024.1
+        """
+
+        n = self.num_data
+        st = {'min': self.min, 'max': self.max,
+              'mean': None, 'geometric_mean': None, 'variance': None, 'sd': None, 'skew': None, 'kurtosis': None,
+              'sum': None, 'sum_power_2': None, 'sum_power_3': None, 'sum_power_4': None,
+              'num_data': n, 'num_dummy': self.num_dummy}
+        if n == 0:
+            return st
+
+        m = self._mean
+        m2 = self._m2
+        m3 = self._m3
+        m4 = self._m4
+        st['mean'] = m
+        st['sum'] = n * m
+        st['sum_power_2'] = m2 + n * m * m
+        st['sum_power_3'] = m3 + 3. * m * m2 + n * m ** 3
+        st['sum_power_4'] = m4 + 4. * m * m3 + 6. * m * m * m2 + n * m ** 4
+        if self._num_non_positive == 0:
+            st['geometric_mean'] = math.exp(self._log_sum / n)
+        if n > 1:
+            variance = m2 / (n - 1)
+            st['variance'] = variance
+            st['sd'] = math.sqrt(variance)
+            if variance > 0.:
+                st['skew'] = (m3 / n) / st['sd'] ** 3
+                st['kurtosis'] = (m4 / n) / (variance * variance) - 3.
+        return st
+
+    def _sketch(self):
+        """(values, counts) of the sketch buckets in increasing value order"""
+        gamma = math.exp(self._log_gamma)
+        scale = 2. / (1. + gamma)
+
+        def bucket_values(counts, sign):
+            if not counts:
+                return np.empty(0), np.empty(0, dtype=np.int64)
+            keys = np.array(sorted(counts, reverse=(sign < 0)), dtype=np.float64)
+            n = np.array([counts[int(k)] for k in keys], dtype=np.int64)
+            return sign * scale * np.exp(keys * self._log_gamma), n
+
+        nv, nn = bucket_values(self._negative, -1.)
+        pv, pn = bucket_values(self._positive, 1.)
+        values = np.concatenate((nv, np.zeros(1 if self._zeros else 0), pv))
+        counts = np.concatenate((nn, np.full(1 if self._zeros else 0, self._zeros, dtype=np.int64), pn))
+        return np.clip(values, self.min, self.max), counts
+
+    def percentile(self, q):
+        """
+        Data percentiles.
+
+        :param q:   percentile, or a sequence of percentiles, in the range 0 to 100.
+        :returns:   percentile value, or a numpy array of values for a sequence of percentiles. None if there
+                    is no data.
+
+        Exact percentiles interpolate linearly between data values, like `numpy.percentile`.  Sketch
+        percentiles are the value of the sketch bucket that holds the data value of that rank, which is
+        within `accuracy` relative error of the exact data value, except that the 0 and 100 percentiles are the
+        exact minimum and maximum.
+
+        .. versionadded:: 2024.1
+        """
+
+        if self.num_data == 0:
+            return None
+        qa = np.asarray(q, dtype=np.float64)
+        if np.any((qa < 0.) | (qa > 100.)):
+            raise GridStatisticsException(_t('Percentiles must be between 0 and 100'))
+
+        if self._exact:
+            if len(self._values) > 1:
+                self._values = [np.concatenate(self._values)]
+            p = np.percentile(self._values[0], qa)
+        else:
+            values, counts = self._sketch()
+            rank = np.rint(qa / 100. * (self.num_data - 1))
+            p = values[np.minimum(np.searchsorted(np.cumsum(counts), rank, side='right'), len(values) - 1)]
+            p = np.where(qa <= 0., self.min, np.where(qa >= 100., self.max, p))
+
+        if qa.ndim == 0:
+            return float(p)
+        return p
+
+    def histogram(self, bins=256, range=None):
+        """
+        Data histogram.
+
+        :param bins:    number of equal-width bins, or a sequence of bin edges, see `numpy.histogram`.
+        :param range:   (min, max) range of the bins, default is the data range
+        :returns:       (counts, bin_edges) numpy arrays, see `numpy.histogram`
+
+        Sketch histograms count the sketch bucket values, which can place data close to a bin edge in the
+        neighbouring bin.
+
+        .. versionadded:: 2024.1
+        """
+
+        if range is None and self.num_data:
+            range = (self.min, self.max)
+        if self._exact:
+            data = np.concatenate(self._values) if self._values else np.empty(0)
+            return np.histogram(data, bins=bins, range=range)
+        values, counts = self._sketch() if self.num_data else (np.empty(0), np.empty(0))
+        hist, edges = np.histogram(values, bins=bins, range=range, weights=counts)
+        return hist.astype(np.int64), edges
+
+    def to_dict(self):
+        """
+        Sketch statistics as a JSON-serializable dictionary, see `from_dict`.
+
+        .. versionadded:: 2024.1
+        """
+
+        if self._exact:
+            raise GridStatisticsException(_t('Exact statistics cannot be serialized.'))
+        return {'accuracy': self._accuracy,
+                'num_data': self.num_data,
+                'num_dummy': self.num_dummy,
+                'min': self.min,
+                'max': self.max,
+                'moments': [self._mean, self._m2, self._m3, self._m4],
+                'log_sum': self._log_sum,
+                'num_non_positive': self._num_non_positive,
+                'positive': [list(self._positive.keys()), list(self._positive.values())],
+                'negative': [list(self._negative.keys()), list(self._negative.values())],
+                'zeros': self._zeros}
+
+    @classmethod
+    def from_dict(cls, d):
+        """
+        Create `Statistics` from a dictionary returned by `to_dict`.
+
+        .. versionadded:: 2024.1
+        """
+
+        stats = cls(accuracy=d['accuracy'])
+        stats.num_data = d['num_data']
+        stats.num_dummy = d['num_dummy']
+        stats.min = d['min']
+        stats.max = d['max']
+        stats._mean, stats._m2, stats._m3, stats._m4 = d['moments']
+        stats._log_sum = d['log_sum']
+        stats._num_non_positive = d['num_non_positive']
+        stats._positive = dict(zip(*d['positive']))
+        stats._negative = dict(zip(*d['negative']))
+        stats._zeros = d['zeros']
+        return stats
+
+
+def tile_statistics(tiles, exact=False, accuracy=SKETCH_ACCURACY, threads=None):
+    """
+    Accumulate `Statistics` from blocks of data in parallel.
+
+    :param tiles:       iterable of numpy data arrays, numpy.nan values are dummies. Tiles are consumed on
+                        the calling thread, so this can be a grid tile iterator.
+    :param exact:       `True` for exact percentiles and histograms, see `Statistics`
+    :param accuracy:    relative accuracy of sketch percentiles
+    :param threads:     number of threads, default is the number of cores
+    :returns:           `Statistics` instance
+
+    .. versionadded:: 2024.1
+    """
+
+    if threads is None:
+        threads = os.cpu_count() or 1
+
+    def accumulate(data):
+        return Statistics(exact, accuracy).add(data)
+
+    def merge(batch):
+        if len(batch) > 1 and threads > 1:
+            partials = gxsys.parallel_map(accumulate, batch, threads=threads)
+        else:
+            partials = [accumulate(data) for data in batch]
+        for partial in partials:
+            stats.merge(partial)
+
+    # read a tile for each thread on this thread, accumulate in parallel
+    stats = Statistics(exact, accuracy)
+    batch = []
+    for data in tiles:
+        batch.append(data)
+        if len(batch) >= threads:
+            merge(batch)
+            batch = []
+    merge(batch)
+    return stats
+
+
+def default_cache_file(grid_file_name):
+    """
+    Default statistics cache file for a grid, "<grid>.stats.json" next to the grid.
+
+    :param grid_file_name:  grid file name, without decorations
+    :returns:               cache file name
+
+    .. versionadded:: 2024.1
+    """
+    return os.path.normpath(grid_file_name) + '.stats.json'
+
+
+def _file_state(file_name):
+    """(modification time, size) of a file"""
+    st = os.stat(file_name)
+    return st.st_mtime, st.st_size
+
+
+class StatisticsCache:
+    """
+    Cache of named statistics results for a grid file.  Cached results are only returned while the grid file
+    modification time and size are the same as when the results were saved.
+
+    :param grid_file_name:  grid file name, without decorations
+    :param file_name:       cache file name, default is `default_cache_file` for the grid.
+
+    .. versionadded:: 2024.1
+    """
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__, self.__dict__)
+
+    def __init__(self, grid_file_name, file_name=None):
+
+        self._grid_file_name = grid_file_name
+        if file_name is None:
+            file_name = default_cache_file(grid_file_name)
+        self._file_name = file_name
+
+    @property
+    def file_name(self):
+        """cache file name"""
+        return self._file_name
+
+    def _load(self):
+        try:
+            with open(self._file_name) as f:
+                cache = json.load(f)
+            if cache.get('version') == CACHE_VERSION and \
+                    (cache.get('mtime'), cache.get('size')) == _file_state(self._grid_file_name):
+                return cache['results']
+        except (OSError, ValueError, KeyError):
+            pass
+        return {}
+
+    def get(self, key):
+        """
+        Cached result.
+
+        :param key: result name
+        :returns:   cached result, or None if not cached or the grid has changed
+
+        .. versionadded:: 2024.1
+        """
+        if not os.path.isfile(self._file_name):
+            return None
+        return self._load().get(key)
+
+    def set(self, key, value):
+        """
+        Save a result to the cache.
+
+        :param key:     result name
+        :param value:   JSON-serializable result
+
+        .. versionadded:: 2024.1
+        """
+        try:
+            mtime, size = _file_state(self._grid_file_name)
+        except OSError:
+            return
+        results = self._load() if os.path.isfile(self._file_name) else {}
+        results[key] = value
+        try:
+            with open(self._file_name, 'w') as f:
+                json.dump({'version': CACHE_VERSION, 'mtime': mtime, 'size': size, 'results': results}, f)
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Delete the cache file.
+
+        .. versionadded:: 2024.1
+        """
+        if os.path.isfile(self._file_name):
+            os.remove(self._file_name)
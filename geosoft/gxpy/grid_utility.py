@@ -10,6 +10,7 @@ Geosoft grid and image utilities.
     
 """
 import os
+import ast
 import numpy as np
 import math
 
@@ -18,14 +19,12 @@ import geosoft.gxapi as gxapi
 from . import gx as gx
 from . import vv as gxvv
 from . import grid as gxgrd
-from . import map as gxmap
-from . import view as gxv
-from . import group as gxgrp
 from . import gdb as gxgdb
 from . import geometry as gxgeo
 from . import utility as gxu
 from . import geometry_utility as gxgeou
 from . import grid_fft as gxfft
+from . import system as gxsys
 
 __version__ = geosoft.__version__
 
@@ -52,6 +51,12 @@ TILT_ANGLE = 5
 RETURN_PPOINT = 0
 RETURN_LIST_OF_PPOINT = 1
 RETURN_GDB = 2
+EXPRESSION_ROWS = 256
+MOSAIC_LAST = 0
+MOSAIC_AVERAGE = 1
+MOSAIC_FEATHER = 2
+MOSAIC_ROWS = 256
+CONTOUR_MIN_EXTENT = 1.6
 
 
 def _t(s):
@@ -313,7 +318,7 @@ def tilt_depth(grid, resolution=None, return_as=RETURN_PPOINT, gdb=None, overwri
     return gxgeo.PPoint.merge(pplist)
 
 
-def sample(grid, xyz):
+def sample(grid, xyz, cell_size=None):
     """
     Return grid values sampled at the point locations.
 
@@ -321,11 +326,16 @@ def sample(grid, xyz):
     :param xyz:     `geosoft.gxpy.geometry.PPoint` instance, or a numpy array shapped (-1, 3) that holds
                     the desired (x, y, z) locations. If a PPoint instance is passed it will be reporjected to the
                     grid coordinate system if necessary.
+    :param cell_size:   sampling resolution.  If specified and the grid has overviews (see
+                    `geosoft.gxpy.grid.Grid.build_overviews`), values are sampled from the closest overview
+                    that is not coarser than this cell size.
     :return:        1-dimensional numpy array of grid data values that match the passes PPoint or XYZ.
 
     .. note:: Sampled data values use linear interpolation between grid points.
 
     .. versionadded:: 9.1
+
+    .. versionchanged:: 2024.1 added `cell_size`
     """
 
     if not isinstance(grid, gxgrd.Grid):
@@ -338,115 +348,182 @@ def sample(grid, xyz):
             xyz = xyz.coordinate_system.oriented_from_xyz(xyz)
         xyz = xyz.pp
 
+    if cell_size:
+        overviews = grid.overviews
+        if overviews:
+            factor = overviews.level(cell_size)
+            if factor > 1:
+                return overviews.sample(np.asarray(xyz, dtype=np.float64).reshape((-1, 3)), factor)
+
     vvx, vvy, vvz = gxvv.vvset_from_np(xyz)
     gxapi.GXIMU.get_zvv(grid.gximg, vvx.gxvv, vvy.gxvv, vvz.gxvv)
     return vvz.np
 
 
-def grid_mosaic(mosaic, grid_list, type_decorate=''):
+def grid_mosaic(mosaic, grid_list, type_decorate='', blend=MOSAIC_LAST, feather_width=10,
+                rows=MOSAIC_ROWS, threads=None):
     """
-    Combine a set of grids into a single grid.  Raises an error if the resulting grid is too large.
+    Combine a set of grids into a single grid.
 
     :param mosaic:          name of the output grid, returned.  Decorate with '(HGD)' to get an HGD
     :param grid_list:       list of input grid names
     :param type_decorate:   decoration for input grids if not default
+    :param blend:           how to combine data where grids overlap:
+
+        ================= ===================================================================
+        MOSAIC_LAST       valid data of later grids in the list replaces earlier data
+        MOSAIC_AVERAGE    average of the valid data of overlapping grids
+        MOSAIC_FEATHER    average weighted by distance from the grid edges up to feather_width
+        ================= ===================================================================
+
+    :param feather_width:   for `MOSAIC_FEATHER`, width in cells over which grid edges are feathered
+    :param rows:            number of rows in each output strip, default is `MOSAIC_ROWS`
+    :param threads:         number of threads, default is the number of cores
     :returns:               `geosoft.gxpy.grid.Grid` instance
 
-    .. note:: If the coordinate systems are different the grids are
-        reprojected to the coordinate system of the first grid.
+    The input grids are first opened to establish the mosaic extent, and the mosaic is written in strips of rows,
+    composed in parallel from the input grids that overlap each strip, such that memory use depends on the
+    strip size and not on the size of the mosaic.  Input grids are only open while strips overlap them.
+
+    .. note:: If the coordinate systems or cell sizes are different the grids are
+        reprojected to the coordinate system and cell size of the first grid.
 
     .. versionadded:: 9.4
-    """
 
-    def props(gn, repro=None):
-        with gxgrd.Grid.open(gn) as gg:
-            if repro:
-                gg.gximg.create_projected2(repro[0], repro[1])
-            return gg.properties()
-
-    def dimension(glist):
-
-        def dimg(_gd, _rep=None):
-            prp = props(_gd, _rep)
-            _x0 = prp.get('x0')
-            _y0 = prp.get('y0')
-            _xm = _x0 + (prp.get('nx') - 1) * prp.get('dx')
-            _ym = _y0 + (prp.get('ny') - 1) * prp.get('dy')
-            _ipj = prp.get('coordinate_system').gxipj
-            cell = prp.get('dx')
-            return _x0, _y0, _xm, _ym, (_ipj, cell)
-
-        def ndim(_x0, _xm, _dx):
-            return int((_xm - _x0 + _dx / 2.0) / _dx) + 1
-
-        dx0, dy0, dxm, dym, drepro = dimg(glist[0])
-        for gd in glist[1:]:
-            xx0, yy0, xxm, yym, r = dimg(gd, drepro)
-            if xx0 < dx0:
-                dx0 = xx0
-            if yy0 < dy0:
-                dy0 = yy0
-            if xxm > dxm:
-                dxm = xxm
-            if yym > dym:
-                dym = yym
-
-        # calculate new grid dimension
-        _p = props(glist[0])
-        nnx = ndim(dx0, dxm, _p.get('dx'))
-        nny = ndim(dy0, dym, _p.get('dy'))
-
-        return dx0, dy0, nnx, nny, dxm, dym
-
-    def locate(_x0, _y0, _p):
-
-        _dx = _p.get('dx')
-        _dy = _p.get('dy')
-        dsx = round((p.get('x0') - _x0) / _dx)
-        dsy = round((p.get('y0') - _y0) / _dy)
-
-        return dsx, dsy
-
-    def paste(gn, _mpg):
-        with gxgrd.Grid.open(gn) as _g:
-            _p = _g.properties()
-            _nx = _p.get('nx')
-            _ny = _p.get('ny')
-            gpg = _g.gxpg()
-            destx, desty = locate(x0, y0, _p)
-            gxc.log('    +{} nx,ny({},{})'.format(_g, _nx, _ny))
-            gxc.log('     Copy ({},{}) -> ({},{}) of ({},{})'.format(_nx, _ny, destx, desty, mnx, mny))
-            _mpg.copy_subset(gpg, desty, destx, 0, 0, _ny, _nx)
-            return
+    .. versionchanged:: 2024.1 streaming mosaic in strips with `blend` options.  Dummies in later grids no longer
+        replace data of earlier grids.
+    """
 
     gxc = gx.gx()
     if len(grid_list) == 0:
         raise GridUtilityException(_t('At least one grid is required'))
+    if blend not in (MOSAIC_LAST, MOSAIC_AVERAGE, MOSAIC_FEATHER):
+        raise GridUtilityException(_t('Invalid blend {}').format(blend))
+    if rows < 1:
+        raise GridUtilityException(_t('rows must be > 0'))
+    if threads is None:
+        threads = os.cpu_count() or 1
+
+    # the location of each grid, matching the coordinate system and cell size of the first grid
+    cs = cell_size = None
+    placed = []
+    for gn in grid_list:
+        gn = gxgrd.decorate_name(gn, type_decorate)
+        with gxgrd.Grid.open(gn, coordinate_system=cs, cell_size=cell_size) as g:
+            if g.rot != 0.:
+                raise GridUtilityException(_t('Grid {} is rotated, mosaic grids cannot be rotated.').format(gn))
+            if cs is None:
+                cs = g.coordinate_system
+                cell_size = g.dx
+                p = g.properties()
+            placed.append([gn, g.x0, g.y0, g.nx, g.ny])
+
+    dx = p['dx']
+    dy = p['dy']
+    x0 = min(gp[1] for gp in placed)
+    y0 = min(gp[2] for gp in placed)
+    xm = max(gp[1] + (gp[3] - 1) * dx for gp in placed)
+    ym = max(gp[2] + (gp[4] - 1) * dy for gp in placed)
+    nx = int((xm - x0 + dx / 2.0) / dx) + 1
+    ny = int((ym - y0 + dy / 2.0) / dy) + 1
+
+    # grid offsets and extent in the mosaic
+    for gp in placed:
+        gp[1] = int(round((gp[1] - x0) / dx))
+        gp[2] = int(round((gp[2] - y0) / dy))
+        gp.extend((min(gp[3], nx - gp[1]), min(gp[4], ny - gp[2])))
 
-    # create list of grids, all matching on coordinate system of first grid
-    grids = []
-    for i in range(len(grid_list)):
-        grids.append(gxgrd.decorate_name(grid_list[i], type_decorate))
-
-    # output grid
-    x0, y0, nx, ny, xm, ym = dimension(grids)
-    p = props(grids[0])
     p['x0'] = x0
     p['y0'] = y0
     p['nx'] = nx
     p['ny'] = ny
     gxc.log('')
-    gxc.log('Mosaic: dim({},{}) x({},{}) y({},{}), cell({})...'.format(nx, ny, x0, xm, y0, ym, p.get('dx')))
-    master = gxgrd.Grid.new(mosaic, p)
-    gxc.log('Memory image ready ({}) dim({},{}) x0,y0({},{})'.
-            format(master, master.nx, master.ny, master.x0, master.y0))
-
-    # paste grids onto master
-    mnx = master.nx
-    mny = master.ny
-    mpg = master.gxpg()
-    for g in grids:
-        paste(g, mpg)
+    gxc.log('Mosaic: dim({},{}) x({},{}) y({},{}), cell({})...'.format(nx, ny, x0, xm, y0, ym, dx))
+
+    def edge_weights(gnx, gny, gx0, gy0, bnx, bny):
+        """feather weights of a block of a gnx by gny grid, rising from the grid edge over feather_width cells"""
+        wx = np.minimum(np.arange(gx0, gx0 + bnx) + 1, gnx - np.arange(gx0, gx0 + bnx))
+        wy = np.minimum(np.arange(gy0, gy0 + bny) + 1, gny - np.arange(gy0, gy0 + bny))
+        w = np.minimum(wy.reshape((-1, 1)), wx)
+        return np.minimum(w, feather_width) / float(max(feather_width, 1))
+
+    def compose(strip):
+        iy0, nrows, blocks = strip
+        if blend == MOSAIC_LAST:
+            result = np.full((nrows, nx), np.nan)
+            for data, r0, c0, _ in blocks:
+                target = result[r0: r0 + data.shape[0], c0: c0 + data.shape[1]]
+                np.copyto(target, data, where=~np.isnan(data))
+        else:
+            total = np.zeros((nrows, nx))
+            weight = np.zeros((nrows, nx))
+            for data, r0, c0, w in blocks:
+                valid = ~np.isnan(data)
+                if w is None:
+                    w = valid.astype(np.float64)
+                else:
+                    w = np.where(valid, w, 0.)
+                total[r0: r0 + data.shape[0], c0: c0 + data.shape[1]] += np.where(valid, data, 0.) * w
+                weight[r0: r0 + data.shape[0], c0: c0 + data.shape[1]] += w
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result = np.where(weight > 0., total / weight, np.nan)
+        if is_int:
+            result = np.where(np.isnan(result), gxu.gx_dummy(dtype), np.rint(result))
+        return iy0, result
+
+    # grids are open only while strips overlap them
+    opened = {}
+    master = None
+    try:
+        master = gxgrd.Grid.new(mosaic, p)
+        dtype = master.dtype
+        is_int = np.dtype(dtype).kind in 'iu'
+
+        # read the overlapping part of each grid for a batch of strips, compose in parallel, write in order
+        gxc.log('Memory strips ready ({}) dim({},{}) x0,y0({},{})'.format(master, master.nx, master.ny,
+                                                                           master.x0, master.y0))
+        iy0 = 0
+        while iy0 < ny:
+            batch = []
+            while iy0 < ny and len(batch) < threads:
+                nrows = min(rows, ny - iy0)
+                blocks = []
+                for i, (gn, gx0, gy0, gnx, gny, bnx, bny) in enumerate(placed):
+                    r0 = max(iy0, gy0)
+                    r1 = min(iy0 + nrows, gy0 + bny)
+                    if r0 >= r1 or bnx <= 0:
+                        continue
+                    g = opened.get(i)
+                    if g is None:
+                        g = gxgrd.Grid.open(gn, coordinate_system=None if i == 0 else cs,
+                                            cell_size=None if i == 0 else cell_size)
+                        opened[i] = g
+                    data = g.np(dtype=np.float64, iy0=r0 - gy0, ny=r1 - r0)[:, :bnx]
+                    w = edge_weights(gnx, gny, 0, r0 - gy0, bnx, r1 - r0) if blend == MOSAIC_FEATHER else None
+                    blocks.append((data, r0 - iy0, gx0, w))
+                batch.append((iy0, nrows, blocks))
+                iy0 += nrows
+
+            # close grids below the next strip
+            for i in [i for i in opened if placed[i][2] + placed[i][6] <= iy0]:
+                opened.pop(i).close()
+
+            if len(batch) > 1 and threads > 1:
+                results = gxsys.parallel_map(compose, batch, threads=threads)
+            else:
+                results = [compose(strip) for strip in batch]
+            for siy0, result in results:
+                master.write_rows(result, iy0=siy0)
+            gxc.log('    rows {} of {}'.format(iy0, ny))
+
+    except Exception:
+        if master is not None:
+            master.close(discard=True)
+        raise
+
+    finally:
+        for g in opened.values():
+            g.close()
 
     gxc.log('Mosaic completed: {}'.format(mosaic))
 
@@ -515,13 +592,244 @@ def grid_bool(g1, g2, joined_grid=None, opt=1, size=3, olap=1):
     return gxgrd.Grid.open(joined_grid)
 
 
+# cell edges, numbered bottom, right, top, left, crossed by each marching-squares case
+_CONTOUR_EDGES = {1: ((3, 0),), 2: ((0, 1),), 3: ((3, 1),), 4: ((1, 2),), 6: ((0, 2),), 7: ((3, 2),),
+                  8: ((2, 3),), 9: ((0, 2),), 11: ((1, 2),), 12: ((3, 1),), 13: ((0, 1),), 14: ((3, 0),)}
+
+# saddle cases (5, 10) resolved by the cell centre value (low, high)
+_CONTOUR_SADDLES = {5: (((3, 0), (1, 2)), ((0, 1), (2, 3))),
+                    10: (((0, 1), (2, 3)), ((3, 0), (1, 2)))}
+
+
+def _contour_crossings(data, level, cy, cx, edge):
+    """
+    Index locations at which a contour level crosses cell edges.
+
+    :param data:    grid data, numpy.nan for dummies
+    :param level:   contour level
+    :param cy:      cell row indices in data
+    :param cx:      cell column indices in data
+    :param edge:    cell edge, 0 bottom, 1 right, 2 top, 3 left
+    :returns:       (x, y) local index locations of the crossings
+    """
+    if edge in (0, 2):
+        iy = cy + (edge == 2)
+        v0 = data[iy, cx]
+        v1 = data[iy, cx + 1]
+        return cx + (level - v0) / (v1 - v0), iy.astype(np.float64)
+    ix = cx + (edge == 1)
+    v0 = data[cy, ix]
+    v1 = data[cy + 1, ix]
+    return ix.astype(np.float64), cy + (level - v0) / (v1 - v0)
+
+
+def _contour_cell_segments(data, level, gx0, gy0, nx, ny):
+    """
+    Marching-squares contour segments through the cells of a block of grid data.
+
+    :param data:    block of grid data, numpy.nan for dummies
+    :param level:   contour level
+    :param gx0:     grid column of data[0, 0]
+    :param gy0:     grid row of data[0, 0]
+    :param nx:      grid columns
+    :param ny:      grid rows
+    :returns:       (edge_a, edge_b, points_a, points_b), where edges are global grid edge identifiers of
+                    the segment ends and points are (n, 2) arrays of the grid index locations of the ends.
+    """
+
+    a = data[:-1, :-1]
+    b = data[:-1, 1:]
+    c = data[1:, 1:]
+    d = data[1:, :-1]
+    with np.errstate(invalid='ignore'):
+        case = ((a >= level).astype(np.uint8) | ((b >= level) << 1) | ((c >= level) << 2) | ((d >= level) << 3))
+    case[np.isnan(a) | np.isnan(b) | np.isnan(c) | np.isnan(d)] = 0
+    cy, cx = np.nonzero((case != 0) & (case != 15))
+    case = case[cy, cx]
+    high_centre = ((a[cy, cx] + b[cy, cx] + c[cy, cx] + d[cy, cx]) * 0.25) >= level
+
+    # global edge identifiers: horizontal edges first, then vertical edges
+    nh = ny * (nx - 1)
+    gy = cy + gy0
+    gx = cx + gx0
+    edge_id = (gy * (nx - 1) + gx,
+               nh + gy * nx + gx + 1,
+               (gy + 1) * (nx - 1) + gx,
+               nh + gy * nx + gx)
+
+    ea = []
+    eb = []
+    pa = []
+    pb = []
+
+    def add(sel, edges):
+        if not np.any(sel):
+            return
+        for e0, e1 in edges:
+            ea.append(edge_id[e0][sel])
+            eb.append(edge_id[e1][sel])
+            pa.append(np.column_stack(_contour_crossings(data, level, cy[sel], cx[sel], e0)))
+            pb.append(np.column_stack(_contour_crossings(data, level, cy[sel], cx[sel], e1)))
+
+    for k, edges in _CONTOUR_EDGES.items():
+        add(case == k, edges)
+    for k, (low, high) in _CONTOUR_SADDLES.items():
+        sel = case == k
+        add(sel & ~high_centre, low)
+        add(sel & high_centre, high)
+
+    if not ea:
+        return None
+    offset = np.array((gx0, gy0), dtype=np.float64)
+    return np.concatenate(ea), np.concatenate(eb), np.concatenate(pa) + offset, np.concatenate(pb) + offset
+
+
+def _stitch_segments(segments):
+    """
+    Stitch contour segments that share edges into polylines.
+
+    :param segments:    list of segments from `_contour_cell_segments`
+    :returns:           list of (n, 2) arrays of grid index locations, closed lines repeat the first point.
+    """
+
+    neighbours = {}
+    location = {}
+    for ea, eb, pa, pb in segments:
+        for a, b in zip(ea.tolist(), eb.tolist()):
+            neighbours.setdefault(a, []).append(b)
+            neighbours.setdefault(b, []).append(a)
+        location.update(zip(ea.tolist(), pa))
+        location.update(zip(eb.tolist(), pb))
+
+    # open lines start at edges with one neighbour, what is left are closed loops
+    starts = [e for e, n in neighbours.items() if len(n) == 1]
+    starts.extend(neighbours)
+    visited = set()
+    lines = []
+    for start in starts:
+        if start in visited:
+            continue
+        visited.add(start)
+        chain = [start]
+        current = start
+        while True:
+            following = None
+            for e in neighbours[current]:
+                if e not in visited:
+                    following = e
+                    break
+            if following is None:
+                if len(chain) > 2 and start in neighbours[current]:
+                    chain.append(start)
+                break
+            visited.add(following)
+            chain.append(following)
+            current = following
+        if len(chain) > 1:
+            lines.append(np.array([location[e] for e in chain], dtype=np.float64))
+    return lines
+
+
+def _contour_extent(line):
+    """
+    Extent of a contour line in grid cells.  Closed contours cross a feature twice and count twice
+    the extent of the loop.
+    """
+    extent = float(np.max(np.ptp(line, axis=0)))
+    if np.array_equal(line[0], line[-1]):
+        extent *= 2.
+    return extent
+
+
+def contours(grid, levels, resolution=0., min_extent=0., tile_size=gxgrd.TILE_SIZE):
+    """
+    Trace contours through a grid and return the contour lines as `geosoft.gxpy.geometry.PPoint` instances.
+
+    :param grid:        `geosoft.gxpy.grid.Grid` instance or a grid file name
+    :param levels:      contour level, or a list of contour levels, which are all traced in one pass
+                        through the grid.
+    :param resolution:  the separation between points along the contours, default 0 returns the points where
+                        contours cross the grid cell edges.
+    :param min_extent:  minimum contour extent in grid cells, default 0 returns all contours. Closed contours
+                        must extend at least half of `min_extent` cells.
+    :param tile_size:   grid is processed in tiles of this size, default is `geosoft.gxpy.grid.TILE_SIZE`
+    :return:            dictionary of lists of `geosoft.gxpy.geometry.PPoint` instances keyed by level.  Closed
+                        contours repeat the first point at the end.
+
+    Contours are traced with marching squares, with saddle cells resolved by the average of the cell corners.
+    Contours end at the grid edge and at dummies, and contours that only touch grid points at the contour level
+    are dropped.  Locations are rotated to match rotated grids, and
+    contours through 3D oriented grids are oriented in 3D. Grids that are not 3D oriented will have a z value 0.0.
+
+    .. versionadded:: 2024.1
+    """
+
+    close_g = False
+    if not isinstance(grid, gxgrd.Grid):
+        grid = gxgrd.Grid.open(grid, mode=gxgrd.FILE_READ)
+        close_g = True
+
+    try:
+        levels = [float(v) for v in np.atleast_1d(levels)]
+        nx = grid.nx
+        ny = grid.ny
+
+        segments = {v: [] for v in levels}
+        if nx > 1 and ny > 1:
+            for ix0, iy0, data, core in grid.tiles(tile_size, halo=1, dtype=np.float64):
+
+                # cells with a lower-left corner in the core of this tile
+                r0 = core[0].start
+                c0 = core[1].start
+                block = data[r0: core[0].stop + 1, c0: core[1].stop + 1]
+                if block.shape[0] < 2 or block.shape[1] < 2:
+                    continue
+                for v in levels:
+                    seg = _contour_cell_segments(block, v, ix0 + c0, iy0 + r0, nx, ny)
+                    if seg is not None:
+                        segments[v].append(seg)
+
+        # locate, resample and orient the contours of all levels together
+        lines = []
+        nlines = []
+        for v in levels:
+            # drop degenerate lines that only touch grid points at the contour level, and small contours
+            stitched = [line for line in _stitch_segments(segments[v]) if np.any(line != line[0])]
+            if min_extent > 0.:
+                stitched = [line for line in stitched if _contour_extent(line) >= min_extent]
+            lines.extend(stitched)
+            nlines.append(len(stitched))
+        offsets, index = gxgeou.lines_to_ragged(lines)
+        xyz = np.zeros((len(index), 3), dtype=np.float64)
+        if len(index):
+            xyz[:, 0], xyz[:, 1] = grid.xy_from_index(index[:, 0], index[:, 1])
+        if resolution > 0.:
+            offsets, xyz = gxgeou.resample_lines(offsets, xyz, resolution)
+        cs = grid.coordinate_system
+        if cs.is_oriented and len(xyz):
+            xyz = cs.xyz_from_oriented(xyz, in_place=True)
+
+        pplist = [gxgeo.PPoint(line, coordinate_system=cs) for line in gxgeou.lines_from_ragged(offsets, xyz)]
+
+    finally:
+        if close_g:
+            grid.close()
+
+    result = {}
+    start = 0
+    for v, n in zip(levels, nlines):
+        result[v] = pplist[start: start + n]
+        start += n
+    return result
+
+
 def contour_points(grid, value, max_segments=1000, resolution=None,
-                   return_as=RETURN_LIST_OF_PPOINT, gdb=None, overwrite=False):
+                   return_as=RETURN_LIST_OF_PPOINT, gdb=None, overwrite=False, min_extent=CONTOUR_MIN_EXTENT):
     """
     Return a set of point segments that represent the spatial locations of contours threaded through the grid.
 
     :param grid:            grid file of `geosoft.gxpy.grid.Grid` instance
-    :param value:           contour value
+    :param value:           contour value, or a list of contour values
     :param max_segments:    maximum expected number of segments, raises error if there are more actual segments.
     :param resolution:      the separation between points along the contours. If not specified the minimum
                             grid cell size is used.  Set `resolution=0`, for use the locations as returned by the
@@ -537,89 +845,60 @@ def contour_points(grid, value, max_segments=1000, resolution=None,
     :param gdb:         return database name, or a `geosoft.gxpy.gdv.Geosoft_database` instance. If not
                         specified and `return_as=RETURN_GDB`, a temporary database is created.
     :param overwrite:   `True` to overwrite gdb if it exists.
+    :param min_extent:  contours that extend less than this many grid cells are dropped, closed contours
+                        must extend at least half as far.  The default is `CONTOUR_MIN_EXTENT`, which drops
+                        the small contours around single grid points, set to 0 for all contours.
     :return:            depends on `return_as` setting
 
     .. note::   Contours through 3D oriented grids will be oriented in 3D. Grids that are not 3D oriented
         will have a z value 0.0.
 
     .. versionadded:: 9.4
-    """
-
-    if isinstance(grid, gxgrd.Grid):
-        extent = grid.extent
-        with grid.copy(grid) as g:
-            temp_grid = g.file_name
-            grid = g.file_name_decorated
-            if resolution is None:
-                resolution = min(g.dx, g.dy)
-
-    else:
-        with gxgrd.Grid.open(grid) as g:
-            extent = g.extent
-            if resolution is None:
-                resolution = min(g.dx, g.dy)
-        temp_grid = None
-
-    # create a contour group for this value, export to a shape file
-    with gxmap.Map.new(data_area=extent.extent_xy, overwrite=True) as gmap:
-        map_file = gmap.file_name
-        with gxv.View.open(gmap, "data") as v:
-            gxgrp.contour(v, '_', grid, parameters=(',0,0', '', '', '', '', '1',
-                                                    str(value) + ',,,0'))
-        shp_file = gx.gx().temp_file('shp')
-        gmap.gxmap.export_all_in_view(shp_file, 'data', 1.0, 1.0,
-                                      gxapi.MAP_EXPORT_BITS_24,
-                                      gxapi.MAP_EXPORT_METHOD_STANDARD,
-                                      gxapi.MAP_EXPORT_FORMAT_SHP, '')
-        shp_file = shp_file[:-4] + '_lnz.shp'
-
-    if not os.path.exists(shp_file):
-        raise GridUtilityException(_t('The grid data does not intersect value {}').format(value))
-
-    if gdb is not None:
-        return_as = RETURN_GDB
 
-    # import shape to database
-    if not isinstance(gdb, gxgdb.Geosoft_gdb):
-        gdb = gxgdb.Geosoft_gdb.new(name=gdb, max_lines=max_segments, max_channels=10, overwrite=overwrite)
-
-    gis = gxapi.GXGIS.create(shp_file, '', gxapi.GIS_TYPE_ARCVIEW)
-    gis.load_shapes_gdb(gdb.gxdb)
-    gdb.coordinate_system = extent.coordinate_system
-
-    # discard the temp files
-    gxu.delete_files_by_root(temp_grid)
-    gxu.delete_files_by_root(map_file)
-    gxu.delete_files_by_root(shp_file[:-4])
-
-    # resample to resolution
-    if resolution > 0.:
-        for ln in gdb.list_lines():
-            xyz, chlist, _ = gdb.read_line(ln, channels=('X', 'Y', 'Z'))
-            xyz = gxgeou.resample(xyz, resolution)
-            gdb.write_line(ln, xyz, chlist)
-
-    if return_as == RETURN_GDB:
-        return gdb
+    .. versionchanged:: 2024.1 contours are traced in memory by `contours` rather than through a contour map,
+        `value` can be a list of contour values, and added `min_extent`.
+    """
 
-    # make points from segments
-    pplist = []
-    for ln in gdb.list_lines():
-        xyz = gdb.read_line(ln, channels=('X', 'Y', 'Z'))[0]
-        xyz[:, 2] = 0.
-        if resolution > 0.:
-            xyz = gxgeou.resample(xyz, resolution)
-        if extent.coordinate_system.is_oriented:
-            xyz = extent.coordinate_system.xyz_from_oriented(xyz)
-        pplist.append(gxgeo.PPoint(xyz, coordinate_system=extent.coordinate_system))
+    close_g = False
+    if not isinstance(grid, gxgrd.Grid):
+        grid = gxgrd.Grid.open(grid, mode=gxgrd.FILE_READ)
+        close_g = True
 
-    # discard the database
-    gdb.close(discard=True)
+    try:
+        if resolution is None:
+            resolution = min(grid.dx, grid.dy)
+
+        pplist = []
+        for pp in contours(grid, value, resolution=resolution, min_extent=min_extent).values():
+            pplist.extend(pp)
+
+        if not pplist:
+            raise GridUtilityException(_t('The grid data does not intersect value {}').format(value))
+        if len(pplist) > max_segments:
+            raise GridUtilityException(_t('There are {} contour segments, which is more than max_segments {}').
+                                       format(len(pplist), max_segments))
+
+        if gdb is not None:
+            return_as = RETURN_GDB
+
+        if return_as == RETURN_GDB:
+            if not isinstance(gdb, gxgdb.Geosoft_gdb):
+                gdb = gxgdb.Geosoft_gdb.new(name=gdb, max_lines=max_segments, max_channels=10,
+                                            overwrite=overwrite)
+            gdb.coordinate_system = grid.coordinate_system
+            for i, pp in enumerate(pplist):
+                gdb.write_line(gxgdb.create_line_name(i, gxgdb.LINE_TYPE_RANDOM), pp.xyz, ('X', 'Y', 'Z'))
+            gdb.xyz_channels = ('X', 'Y', 'Z')
+            return gdb
+
+        if return_as == RETURN_PPOINT:
+            return gxgeo.PPoint.merge(pplist)
 
-    if return_as == RETURN_PPOINT:
-        return gxgeo.PPoint.merge(pplist)
+        return pplist
 
-    return pplist
+    finally:
+        if close_g:
+            grid.close()
 
 
 def calculate_slope_standard_deviation(grid):
@@ -638,7 +917,12 @@ def calculate_slope_standard_deviation(grid):
 
         The cell sizes are used to determine the slopes.
 
+        The result for a read-only grid file is kept in the grid's
+        `geosoft.gxpy.grid.Grid.statistics_cache`.
+
     .. versionadded:: 9.4
+
+    .. versionchanged:: 2024.1 results are cached
     """
 
     close_g = False
@@ -647,7 +931,15 @@ def calculate_slope_standard_deviation(grid):
         close_g = True
 
     try:
-        return gxapi.GXIMU.slope_standard_deviation(grid.gximg)
+        cache = grid.statistics_cache
+        if cache:
+            sd = cache.get('slope_standard_deviation')
+            if sd is not None:
+                return sd
+        sd = gxapi.GXIMU.slope_standard_deviation(grid.gximg)
+        if cache:
+            cache.set('slope_standard_deviation', sd)
+        return sd
     finally:
         if close_g:
             grid.close()
@@ -682,7 +974,7 @@ def flood(grid, file_name=None, overwrite=False, tolerance=None, max_iterations=
     if not isinstance(grid, gxgrd.Grid):
         grid = gxgrd.Grid.open(grid)
 
-    pg = grid.gxpg(False)
+    pg = grid.gxpg(read_only=True)
     rvv = gxvv.GXvv(dtype=grid.dtype)
     rvv.length = grid.nx
     xyv = np.empty((grid.nx, 3))
@@ -736,7 +1028,7 @@ def feather(grid, width, edge_value=None, file_name=None, overwrite=False):
     if edge_value is None:
         edge_value = grid.statistics()['mean']
 
-    pg = grid.gxpg()
+    pg = grid.gxpg(read_only=True)
     pgf = gxapi.GXPG.create(pg.n_rows(), pg.n_cols(), pg.e_type())
     vv = gxvv.GXvv(dtype=gxu.dtype_gx(pg.e_type()))
 
@@ -827,3 +1119,157 @@ def expression(grids, expr, result_file_name=None, overwrite=False):
         g.delete_files()
 
     return gxgrd.reopen(result)
+
+
+# names available to `expression_np` expressions in addition to the operands
+_EXPRESSION_NAMESPACE = {name: getattr(np, name) for name in (
+    'abs', 'absolute', 'sqrt', 'exp', 'log', 'log10', 'log2', 'sin', 'cos', 'tan', 'arcsin', 'arccos',
+    'arctan', 'arctan2', 'sinh', 'cosh', 'tanh', 'hypot', 'power', 'floor', 'ceil', 'round', 'clip',
+    'where', 'minimum', 'maximum', 'fmin', 'fmax', 'isnan', 'isfinite', 'sign', 'degrees', 'radians',
+    'nan', 'pi', 'e')}
+_EXPRESSION_NAMESPACE.update({'asin': np.arcsin, 'acos': np.arccos, 'atan': np.arctan, 'atan2': np.arctan2,
+                              'min': np.fmin, 'max': np.fmax})
+
+
+def _compile_expression(expr):
+    """
+    Compile an expression of one or more statements separated by ';' or new lines. The value of the
+    final statement, which must be an expression, is assigned to '_'.
+    """
+
+    try:
+        statements = '\n'.join(line.strip() for line in expr.replace(';', '\n').splitlines())
+        tree = ast.parse(statements, '<expression>', 'exec')
+    except SyntaxError as e:
+        raise GridUtilityException(_t('Invalid expression "{}": {}').format(expr, str(e)))
+    if len(tree.body) == 0 or not isinstance(tree.body[-1], ast.Expr):
+        raise GridUtilityException(_t('The last statement of expression "{}" must be an expression').format(expr))
+    last = tree.body[-1]
+    tree.body[-1] = ast.copy_location(ast.Assign(targets=[ast.Name(id='_', ctx=ast.Store())],
+                                                 value=last.value), last)
+    ast.fix_missing_locations(tree)
+    return compile(tree, '<expression>', 'exec')
+
+
+def expression_np(grids, expr, result_file_name=None, overwrite=False, dtype=np.float64,
+                  rows=EXPRESSION_ROWS, threads=None):
+    """
+    Apply a numpy expression to grids.  This is an alternative to `expression` that evaluates the expression
+    with numpy in parallel over strips of rows, such that memory use is bounded by the strip size and
+    the number of threads, and operands are read in their stored type without copies to temporary grids.
+
+    :param grids:       dictionary of named grid operands, or a list of grids. If a list is provided the operand
+                        names will be 'g1', 'g2', 'g3', etc... Grids can be `geosoft.gxpy.grid.Grid` instances or
+                        grid file names. All grids must have the same dimensions and location.
+    :param expr:        Python expression using the operand names, numpy-style functions (abs, sqrt, exp, log,
+                        sin, cos, tan, asin, acos, atan, atan2, hypot, where, min, max, clip, isnan, etc.) and the
+                        constants nan, pi and e.  Statements can be separated by ';' or new lines, and
+                        the value of the last statement is the result.
+    :param result_file_name:    optional result grid file name, if `None` a temporary grid is created.
+    :param overwrite:   True to overwrite existing grid
+    :param dtype:       result grid data type, default is np.float64
+    :param rows:        number of rows in each strip, default is `EXPRESSION_ROWS`
+    :param threads:     number of threads, default is the number of cores
+    :return:            `geosoft.gxpy.grid.Grid` instance that contains the result of the expression.
+
+    Operands are presented to the expression as float64 arrays in which dummies are numpy.nan, and
+    numpy.nan values in the result are written as dummies.
+
+    *Example*
+
+    .. code::
+
+        import geosoft.gxpy.grid_utility as gxgrdu
+
+        ratio = gxgrdu.expression_np({'k': 'k.grd', 'th': 'th.grd'}, 'where(th > 0, k / th, nan)')
+        scaled = gxgrdu.expression_np(('a.grd', 'b.grd'), 'd = g1 - g2; sqrt(abs(d)) * sign(d)')
+
+    .. versionadded:: 2024.1
+    """
+
+    code = _compile_expression(expr)
+
+    if not isinstance(grids, dict):
+        grids = {'g{}'.format(i + 1): g for i, g in enumerate(grids)}
+    if len(grids) == 0:
+        raise GridUtilityException(_t('No grid operands'))
+
+    # grids opened here from file names are closed when done
+    opened = []
+    result = None
+    try:
+        operands = {}
+        properties = None
+        for k, g in grids.items():
+            if not isinstance(g, gxgrd.Grid):
+                g = gxgrd.Grid.open(g)
+                opened.append(g)
+            operands[k] = g
+            if properties is None:
+                properties = g.properties()
+            else:
+                if g.nx != properties['nx'] or g.ny != properties['ny']:
+                    raise GridUtilityException(_t('Grid "{}" dimensions ({}, {}) do not match ({}, {})').
+                                               format(k, g.nx, g.ny, properties['nx'], properties['ny']))
+                tol = 1.0e-6 * max(abs(properties['dx']), abs(properties['dy']))
+                for key in ('x0', 'y0', 'dx', 'dy'):
+                    if abs(g.properties()[key] - properties[key]) > tol:
+                        raise GridUtilityException(_t('Grid "{}" {} does not match the other grids').
+                                                   format(k, key))
+
+        if rows < 1:
+            raise GridUtilityException(_t('rows must be > 0'))
+        if threads is None:
+            threads = os.cpu_count() or 1
+
+        if result_file_name is None:
+            result_file_name = gx.gx().temp_file('.grd(GRD)')
+        properties['dtype'] = dtype
+        result = gxgrd.Grid.new(file_name=result_file_name, properties=properties, overwrite=overwrite)
+
+        nx = properties['nx']
+        ny = properties['ny']
+
+        def evaluate(strip):
+            namespace = dict(_EXPRESSION_NAMESPACE)
+            namespace.update(strip[1])
+            try:
+                with np.errstate(all='ignore'):
+                    exec(code, {'__builtins__': {}}, namespace)
+                value = np.broadcast_to(np.asarray(namespace['_'], dtype=np.float64), (strip[2], nx))
+            except Exception as e:
+                raise GridUtilityException(_t('Expression "{}" failed: {}').format(expr, str(e)))
+            if np.dtype(dtype).kind in 'iu':
+                value = np.where(np.isnan(value), gxu.gx_dummy(dtype), np.rint(value))
+            return strip[0], value
+
+        # read strips for each batch of threads on this thread, evaluate in parallel, write in order
+        strips_per_batch = max(1, threads)
+        iy0 = 0
+        while iy0 < ny:
+            batch = []
+            while iy0 < ny and len(batch) < strips_per_batch:
+                nrows = min(rows, ny - iy0)
+                data = {k: g.np(dtype=np.float64, iy0=iy0, ny=nrows) for k, g in operands.items()}
+                batch.append((iy0, data, nrows))
+                iy0 += nrows
+
+            if len(batch) > 1 and threads > 1:
+                results = gxsys.parallel_map(evaluate, batch, threads=threads)
+            else:
+                results = [evaluate(strip) for strip in batch]
+
+            for strip_iy0, value in results:
+                result.write_rows(np.asarray(value, dtype=dtype), iy0=strip_iy0)
+
+        return gxgrd.reopen(result)
+
+    except Exception:
+        if result is not None:
+            result.close(discard=True)
+        raise
+
+    finally:
+        for g in opened:
+            g.close()
+
@@ -312,6 +312,10 @@ class GXpyContext:
 
             del self._tkframe
 
+            # cached coordinate systems hold GX objects of this context
+            from . import coordinate_system as gxcs
+            gxcs.clear_cache()
+
             self._gxapi.__del__()
             del self._gxapi
             GXpyContext._set_instance(None)
@@ -0,0 +1,658 @@
+"""
+Spatial index for nearest-neighbour, radius and box queries.
+
+A `SpatialIndex` is a static, balanced KD-tree over 2D (x, y) or 3D (x, y, z) items, which can be the points of a
+`geosoft.gxpy.geometry.PPoint`, the verticies or faces of a `geosoft.gxpy.geometry.Mesh`, or the locations of
+the data in a `geosoft.gxpy.gdb.Geosoft_gdb` database.  Items are split at the median of the axis of greatest
+extent until leaves hold no more than `LEAF_SIZE` items, and every node records the bounding box of its items.
+Items can have a bounding box of their own, such as mesh faces, in which case the index behaves as an R-tree
+of item boxes: box queries return items whose boxes overlap and distances are measured to the item boxes.
+
+The tree is built and searched with numpy operations on all nodes of a tree level at a time, and queries are
+processed in batches of query points, so there is no per-point Python overhead.  An index can be saved to a
+numpy `.npz` file next to the dataset and loaded later, in which case the dataset file modification time and
+size are recorded so that an index of a changed dataset is not reused.
+
+:Classes:
+
+    ======================== ===================================================
+    :class:`SpatialIndex`    KD-tree of points or item boxes
+    ======================== ===================================================
+
+.. seealso:: `geosoft.gxpy.geometry.PPoint`, `geosoft.gxpy.geometry.Mesh`, `geosoft.gxpy.gdb.Geosoft_gdb`
+
+.. note::
+
+    Regression tests provide usage examples:
+    `Tests <https://github.com/GeosoftInc/gxpy/blob/master/geosoft/gxpy/tests/test_spatial_index.py>`_
+
+.. versionadded:: 2024.1
+"""
+import os
+import json
+import numpy as np
+
+import geosoft
+from . import coordinate_system as gxcs
+from . import geometry as gxgm
+
+__version__ = geosoft.__version__
+
+LEAF_SIZE = 32  #: maximum number of items in a leaf of the tree
+QUERY_SIZE = 4000000  #: approximate number of candidate items examined per batch of query points
+INDEX_VERSION = 1  #: index file format version, index files of a different version are not loaded
+
+
+def _t(s):
+    return geosoft.gxpy.system.translate(s)
+
+
+class SpatialIndexException(geosoft.GXRuntimeError):
+    """
+    Exceptions from :mod:`geosoft.gxpy.spatial_index`.
+
+    .. versionadded:: 2024.1
+    """
+    pass
+
+
+def default_index_file(file_name):
+    """
+    Default spatial index file for a dataset, "<dataset>.spatial.npz" next to the dataset.
+
+    :param file_name:   dataset file name
+    :returns:           index file name
+
+    .. versionadded:: 2024.1
+    """
+    return os.path.normpath(file_name) + '.spatial.npz'
+
+
+def _file_state(file_name):
+    """(modification time, size) of a file"""
+    st = os.stat(file_name)
+    return st.st_mtime, st.st_size
+
+
+def _interleave(a, b):
+    return np.stack((a, b), axis=1).ravel()
+
+
+def _ragged_range(starts, counts):
+    """concatenated ranges start:start+count"""
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(total, dtype=np.int64) - offsets + np.repeat(starts, counts)
+
+
+def _overlap(lo, hi, i, qlo, qhi, q):
+    """True where boxes i overlap query boxes q"""
+    keep = (lo[i, 0] <= qhi[q, 0]) & (hi[i, 0] >= qlo[q, 0])
+    for axis in range(1, lo.shape[1]):
+        keep &= (lo[i, axis] <= qhi[q, axis]) & (hi[i, axis] >= qlo[q, axis])
+    return keep
+
+
+def _distance(alo, ahi, blo, bhi):
+    """distance between boxes, which is 0 for overlapping boxes and the point distance for points"""
+    d = np.maximum(np.maximum(blo - ahi, alo - bhi), 0.)
+    return np.sqrt(np.sum(d * d, axis=-1))
+
+
+class SpatialIndex:
+    """
+    KD-tree spatial index of points or item bounding boxes.
+
+    :param xyz:                 item locations as a numpy array shaped (n, 2) or (n, 3+), or a
+                                `geosoft.gxpy.geometry.PPoint`.  Items with a numpy.nan location are not indexed.
+    :param boxes:               optional (lo, hi) item bounding boxes, each an array shaped like the
+                                locations.  Locations are then the box centres used to split the tree.
+    :param dimension:           2 to index (x, y), or 3 to index (x, y, z).  The default is the number of
+                                location columns, to a maximum of 3.
+    :param leaf_size:           maximum number of items in a leaf, default `LEAF_SIZE`
+    :param coordinate_system:   coordinate system of the locations, default is the `PPoint` coordinate system
+
+    Queries return item indexes, which are the row of each item in `xyz`.  Query points may be a
+    `geosoft.gxpy.geometry.PPoint`, which is reprojected to the index coordinate system, or an array of
+    locations in the index coordinate system.
+
+    Examples:
+
+    .. code::
+
+        import geosoft.gxpy.spatial_index as gxsi
+
+        index = gxsi.SpatialIndex(pp)
+
+        # distances and indexes of the 5 nearest stations to each sample
+        distance, nearest = index.knn(samples, 5)
+
+        # pairs of stations that are closer than 0.5 m
+        duplicates = index.pairs(0.5)
+
+    .. versionadded:: 2024.1
+    """
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__, self.__dict__)
+
+    def __str__(self):
+        return "SpatialIndex({} items, {}D)".format(len(self), self._dimension)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __init__(self, xyz, boxes=None, dimension=None, leaf_size=LEAF_SIZE, coordinate_system=None):
+
+        if isinstance(xyz, gxgm.PPoint):
+            if coordinate_system is None:
+                coordinate_system = xyz.coordinate_system
+            xyz = xyz.pp
+        xyz = np.asarray(xyz, dtype=np.float64)
+        if xyz.ndim != 2 or xyz.shape[1] < 2:
+            raise SpatialIndexException(_t('Locations must be an array shaped (n, 2) or (n, 3+).'))
+        if dimension is None:
+            dimension = min(xyz.shape[1], 3)
+        if dimension not in (2, 3) or dimension > xyz.shape[1]:
+            raise SpatialIndexException(_t('Dimension must be 2 or 3 and no more than the location dimension.'))
+        if leaf_size < 2:
+            raise SpatialIndexException(_t('Leaf size must be at least 2.'))
+
+        self._dimension = dimension
+        self._leaf_size = int(leaf_size)
+        self._cs = coordinate_system
+        self._lines = None
+        self._meta = {}
+
+        centres = xyz[:, :dimension]
+        valid = ~np.isnan(centres).any(axis=1)
+        if boxes is not None:
+            lo = np.asarray(boxes[0], dtype=np.float64)[:, :dimension]
+            hi = np.asarray(boxes[1], dtype=np.float64)[:, :dimension]
+            valid &= ~(np.isnan(lo).any(axis=1) | np.isnan(hi).any(axis=1))
+        ids = np.flatnonzero(valid)
+        if len(ids) < len(centres):
+            centres = centres[ids]
+            if boxes is not None:
+                lo = lo[ids]
+                hi = hi[ids]
+        self._build(centres, ids, (lo, hi) if boxes is not None else None)
+
+    def _build(self, centres, ids, boxes):
+
+        n = len(centres)
+        depth = 0
+        while -(-n // (1 << depth)) > self._leaf_size:
+            depth += 1
+
+        perm = np.arange(n)
+        starts = np.zeros(1, dtype=np.int64)
+        ends = np.array([n], dtype=np.int64)
+        split_axis = []
+        split_value = []
+        for level in range(depth):
+            sizes = ends - starts
+            pts = centres[perm]
+            nodes = np.repeat(np.arange(len(starts)), sizes)
+            low = np.minimum.reduceat(pts, starts, axis=0)
+            extent = np.maximum.reduceat(pts, starts, axis=0) - low
+            axis = np.argmax(extent, axis=1)
+            value = pts[np.arange(n), axis[nodes]]
+
+            # sort by node then value in one pass, with values scaled to [0, 0.5] within each node
+            span = extent[np.arange(len(starts)), axis]
+            span[span == 0.] = 1.
+            key = (value - low[np.arange(len(starts)), axis][nodes]) * (0.5 / span)[nodes] + nodes
+            order = np.argsort(key)
+            perm = perm[order]
+            mids = starts + sizes // 2
+            split_axis.append(axis)
+            split_value.append(value[order][mids])
+            starts, ends = _interleave(starts, mids), _interleave(mids, ends)
+
+        self._depth = depth
+        self._ids = ids[perm]
+        self._points = centres[perm]
+        if boxes is None:
+            self._item_lo = self._item_hi = self._points
+        else:
+            self._item_lo = boxes[0][perm]
+            self._item_hi = boxes[1][perm]
+        self._leaf_start = np.append(starts, n) if n else np.zeros(2, dtype=np.int64)
+        self._split_axis = np.concatenate(split_axis) if split_axis else np.zeros(0, dtype=np.int64)
+        self._split_value = np.concatenate(split_value) if split_value else np.zeros(0)
+        self._node_boxes()
+
+    def _node_boxes(self):
+        """node bounding boxes in heap order, level by level from the root"""
+        d = self._dimension
+        if len(self._ids) == 0:
+            self._node_lo = np.full((1, d), np.inf)
+            self._node_hi = np.full((1, d), -np.inf)
+            return
+        starts = self._leaf_start[:-1]
+        lo = np.minimum.reduceat(self._item_lo, starts, axis=0)
+        hi = np.maximum.reduceat(self._item_hi, starts, axis=0)
+        levels_lo = [lo]
+        levels_hi = [hi]
+        for _ in range(self._depth):
+            lo = np.minimum(lo[0::2], lo[1::2])
+            hi = np.maximum(hi[0::2], hi[1::2])
+            levels_lo.insert(0, lo)
+            levels_hi.insert(0, hi)
+        self._node_lo = np.concatenate(levels_lo)
+        self._node_hi = np.concatenate(levels_hi)
+
+    @classmethod
+    def from_mesh(cls, mesh, faces=False, leaf_size=LEAF_SIZE):
+        """
+        Spatial index of a mesh.
+
+        :param mesh:        `geosoft.gxpy.geometry.Mesh` instance
+        :param faces:       `False` to index verticies, `True` to index faces by their bounding boxes.
+        :param leaf_size:   maximum number of items in a leaf
+        :returns:           3D `SpatialIndex` of vertex or face indexes
+
+        .. versionadded:: 2024.1
+        """
+        verticies = np.asarray(mesh.verticies, dtype=np.float64)
+        if not faces:
+            return cls(verticies, leaf_size=leaf_size, coordinate_system=mesh.coordinate_system)
+        corners = verticies[np.asarray(mesh.faces)]
+        return cls(corners.mean(axis=1), boxes=(corners.min(axis=1), corners.max(axis=1)),
+                   leaf_size=leaf_size, coordinate_system=mesh.coordinate_system)
+
+    @classmethod
+    def from_gdb(cls, gdb, lines=None, channels=None, leaf_size=LEAF_SIZE, persist=False):
+        """
+        Spatial index of the data locations of a database.
+
+        :param gdb:         `geosoft.gxpy.gdb.Geosoft_gdb` instance
+        :param lines:       lines to index, default is the selected lines
+        :param channels:    (x, y) or (x, y, z) location channels, default is the database (x, y) channels.
+        :param leaf_size:   maximum number of items in a leaf
+        :param persist:     `True` to load a saved index for the same lines and channels if the database has not
+                            changed, and to save a new index next to the database, see `default_index_file`.
+                            A saved index is neither loaded nor saved while the database has uncommitted changes.
+        :returns:           `SpatialIndex` of database rows, see `line_rows`.
+
+        .. versionadded:: 2024.1
+        """
+
+        if channels is None:
+            channels = gdb.xyz_channels[:2]
+            if None in channels:
+                raise SpatialIndexException(_t('The database does not have x and y location channels.'))
+        channels = list(channels)
+        if lines is None:
+            lines = gdb.list_lines()
+        lines = sorted(gdb.line_name_symb(line)[0] for line in lines)
+
+        file_name = None
+        if persist and gdb.file_name and not gdb.data_has_changed:
+            file_name = default_index_file(gdb.file_name)
+        if file_name and os.path.isfile(file_name):
+            index = cls.load(file_name, source=gdb.file_name)
+            if index is not None and index._lines == lines and index._meta.get('channels') == channels:
+                return index
+
+        data = []
+        line_rows = []
+        for i, line in enumerate(lines):
+            xyz = gdb.read_line(line, channels=channels, dtype=np.float64)[0]
+            data.append(xyz)
+            line_rows.append(np.stack((np.full(len(xyz), i), np.arange(len(xyz))), axis=1))
+        if data:
+            xyz = np.concatenate(data)
+            line_rows = np.concatenate(line_rows)
+        else:
+            xyz = np.zeros((0, len(channels)))
+            line_rows = np.zeros((0, 2), dtype=np.int64)
+
+        index = cls(xyz, leaf_size=leaf_size, coordinate_system=gdb.coordinate_system)
+        index._lines = lines
+        index._line_rows = line_rows
+        index._meta['channels'] = channels
+        if file_name:
+            index.save(file_name, source=gdb.file_name)
+        return index
+
+    @property
+    def dimension(self):
+        """index dimension, 2 for (x, y) or 3 for (x, y, z)"""
+        return self._dimension
+
+    @property
+    def coordinate_system(self):
+        """coordinate system of the index locations, or None"""
+        if self._cs is not None and not isinstance(self._cs, gxcs.Coordinate_system):
+            self._cs = gxcs.Coordinate_system(self._cs)
+        return self._cs
+
+    @property
+    def depth(self):
+        """number of tree levels below the root"""
+        return self._depth
+
+    @property
+    def extent(self):
+        """
+        Extent of the indexed items as a `geosoft.gxpy.geometry.Point2`, None if there are no items.
+
+        .. versionadded:: 2024.1
+        """
+        if len(self) == 0:
+            return None
+        lo = list(self._node_lo[0]) + [0.] * (3 - self._dimension)
+        hi = list(self._node_hi[0]) + [0.] * (3 - self._dimension)
+        return gxgm.Point2((lo, hi), self.coordinate_system)
+
+    @property
+    def lines(self):
+        """lines of a database index, None if not a database index"""
+        return None if self._lines is None else list(self._lines)
+
+    def line_rows(self, indexes):
+        """
+        Database line and row of items of a database index.
+
+        :param indexes: item indexes returned by a query
+        :returns:       (line names, rows) as numpy arrays
+
+        .. versionadded:: 2024.1
+        """
+        if self._lines is None:
+            raise SpatialIndexException(_t('This is not a database index.'))
+        lr = self._line_rows[np.asarray(indexes, dtype=np.int64)]
+        return np.array(self._lines, dtype=object)[lr[..., 0]], lr[..., 1]
+
+    def _query_points(self, xyz):
+        """query points as an (m, dimension) float64 array, True if a single point"""
+        if isinstance(xyz, gxgm.Point):
+            xyz = gxgm.PPoint((xyz,))
+        if isinstance(xyz, gxgm.PPoint):
+            if gxcs.is_known(self.coordinate_system) and gxcs.is_known(xyz.coordinate_system):
+                xyz = gxgm.PPoint(xyz, coordinate_system=self.coordinate_system)
+            xyz = xyz.pp
+        xyz = np.asarray(xyz, dtype=np.float64)
+        single = xyz.ndim == 1
+        if single:
+            xyz = xyz.reshape((1, -1))
+        if xyz.ndim != 2 or xyz.shape[1] < self._dimension:
+            raise SpatialIndexException(_t('Query locations must have at least {} coordinates.')
+                                        .format(self._dimension))
+        return xyz[:, :self._dimension], single
+
+    def _node_range(self, level, nodes):
+        """item (start, end) of nodes at a level"""
+        shift = self._depth - level
+        return self._leaf_start[nodes << shift], self._leaf_start[(nodes + 1) << shift]
+
+    def _search(self, qlo, qhi):
+        """(query, item position) pairs of items that overlap query boxes"""
+        q = np.arange(len(qlo))
+        nodes = np.zeros(len(qlo), dtype=np.int64)
+        for level in range(self._depth + 1):
+            heap = nodes + ((1 << level) - 1)
+            keep = _overlap(self._node_lo, self._node_hi, heap, qlo, qhi, q)
+            q = q[keep]
+            nodes = nodes[keep]
+            if level < self._depth:
+                q = np.repeat(q, 2)
+                nodes = _interleave(nodes * 2, nodes * 2 + 1)
+        starts, ends = self._node_range(self._depth, nodes)
+        counts = ends - starts
+        items = _ragged_range(starts, counts)
+        q = np.repeat(q, counts)
+        keep = _overlap(self._item_lo, self._item_hi, items, qlo, qhi, q)
+        return q[keep], items[keep]
+
+    def _batches(self, m, per_query):
+        """query batch ranges that examine about `QUERY_SIZE` items each"""
+        size = max(1, QUERY_SIZE // max(1, per_query))
+        return [(i, min(i + size, m)) for i in range(0, m, size)]
+
+    def knn(self, xyz, k=1):
+        """
+        k nearest items to query locations.
+
+        :param xyz: query location, or an array or `geosoft.gxpy.geometry.PPoint` of locations
+        :param k:   number of nearest items
+        :returns:   (distances, indexes), each shaped (m, k), or (k,) for a single location.  Indexes are
+                    ordered by distance, and where there are fewer than k items the distance is numpy.inf and
+                    the index is -1.  Locations that contain numpy.nan have no nearest items.
+
+        .. versionadded:: 2024.1
+        """
+
+        xyz, single = self._query_points(xyz)
+        m = len(xyz)
+        k = int(k)
+        distances = np.full((m, k), np.inf)
+        indexes = np.full((m, k), -1, dtype=np.int64)
+        kn = min(k, len(self))
+        valid = np.flatnonzero(~np.isnan(xyz).any(axis=1))
+        if kn > 0 and len(valid):
+
+            # level of the smallest nodes that hold at least k items
+            level = self._depth
+            while level > 0 and (len(self) >> level) < kn:
+                level -= 1
+            size = int(np.max(np.diff(self._leaf_start[np.arange((1 << level) + 1) << (self._depth - level)])))
+
+            for b0, b1 in self._batches(len(valid), size):
+                rows = valid[b0:b1]
+                p = xyz[rows]
+
+                # descend to the node that contains each point for a first distance bound
+                nodes = np.zeros(len(p), dtype=np.int64)
+                for lv in range(level):
+                    heap = nodes + ((1 << lv) - 1)
+                    right = p[np.arange(len(p)), self._split_axis[heap]] >= self._split_value[heap]
+                    nodes = nodes * 2 + right
+                starts, ends = self._node_range(level, nodes)
+                candidates = starts[:, None] + np.arange(size)
+                inside = candidates < ends[:, None]
+                candidates = np.where(inside, candidates, starts[:, None])
+                d = _distance(self._item_lo[candidates], self._item_hi[candidates], p[:, None, :], p[:, None, :])
+                d[~inside] = np.inf
+                bound = np.partition(d, kn - 1, axis=1)[:, kn - 1]
+
+                # all items within the bound, then the k nearest
+                r = bound * (1. + 1.0e-12)
+                q, items = self._search(p - r[:, None], p + r[:, None])
+                d = _distance(self._item_lo[items], self._item_hi[items], p[q], p[q])
+                keep = d <= bound[q]
+                q = q[keep]
+                items = items[keep]
+                d = d[keep]
+                order = np.lexsort((items, d, q))
+                first = np.searchsorted(q[order], np.arange(len(p)))
+                take = order[first[:, None] + np.arange(kn)]
+                distances[rows, :kn] = d[take]
+                indexes[rows, :kn] = self._ids[items[take]]
+
+        if single:
+            return distances[0], indexes[0]
+        return distances, indexes
+
+    def radius(self, xyz, r, sort=True):
+        """
+        Items within a distance of query locations.
+
+        :param xyz:     query location, or an array or `geosoft.gxpy.geometry.PPoint` of locations
+        :param r:       distance, or an array of a distance for each location
+        :param sort:    `True` to order items by distance, `False` to order by index
+        :returns:       numpy array of item indexes for a single location, or a list of arrays, one for each
+                        location.
+
+        .. versionadded:: 2024.1
+        """
+
+        xyz, single = self._query_points(xyz)
+        m = len(xyz)
+        r = np.broadcast_to(np.asarray(r, dtype=np.float64), (m,))
+        qs = []
+        items = []
+        distances = []
+        for b0, b1 in self._batches(m, self._leaf_size * 4):
+            p = xyz[b0:b1]
+            rb = r[b0:b1]
+            q, it = self._search(p - rb[:, None], p + rb[:, None])
+            d = _distance(self._item_lo[it], self._item_hi[it], p[q], p[q])
+            keep = d <= rb[q]
+            qs.append(q[keep] + b0)
+            items.append(self._ids[it[keep]])
+            distances.append(d[keep])
+        q = np.concatenate(qs) if qs else np.zeros(0, dtype=np.int64)
+        items = np.concatenate(items) if items else np.zeros(0, dtype=np.int64)
+        d = np.concatenate(distances) if distances else np.zeros(0)
+
+        order = np.lexsort((items, d, q)) if sort else np.lexsort((items, q))
+        q = q[order]
+        result = np.split(items[order], np.searchsorted(q, np.arange(1, m)))
+        if single:
+            return result[0]
+        return result
+
+    def box(self, extent):
+        """
+        Items inside or overlapping a box.
+
+        :param extent:  box as a `geosoft.gxpy.geometry.Point2`, or (min_x, min_y, max_x, max_y), or
+                        (min_x, min_y, min_z, max_x, max_y, max_z).  A 3D index queried with an (x, y) box
+                        returns items at all z.
+        :returns:       numpy array of item indexes in index order
+
+        .. versionadded:: 2024.1
+        """
+
+        if isinstance(extent, gxgm.Point2):
+            if gxcs.is_known(self.coordinate_system) and gxcs.is_known(extent.coordinate_system):
+                extent = gxgm.Point2(extent, coordinate_system=self.coordinate_system)
+            extent = extent.extent_xyz if self._dimension == 3 else extent.extent_xy
+        extent = np.asarray(extent, dtype=np.float64)
+        nd = len(extent) // 2
+        if nd not in (2, 3):
+            raise SpatialIndexException(_t('Box must be (min_x, min_y, max_x, max_y) or '
+                                           '(min_x, min_y, min_z, max_x, max_y, max_z).'))
+        lo = np.full(self._dimension, -np.inf)
+        hi = np.full(self._dimension, np.inf)
+        n = min(nd, self._dimension)
+        lo[:n] = np.minimum(extent[:n], extent[nd:nd + n])
+        hi[:n] = np.maximum(extent[:n], extent[nd:nd + n])
+        items = self._search(lo[None, :], hi[None, :])[1]
+        return np.sort(self._ids[items])
+
+    def pairs(self, r):
+        """
+        Pairs of items that are within a distance of each other, which can be used to find duplicates.
+
+        :param r:   distance
+        :returns:   numpy array shaped (n, 2) of (i, j) item index pairs, i < j, sorted.
+
+        .. versionadded:: 2024.1
+        """
+
+        pairs = []
+        for b0, b1 in self._batches(len(self), self._leaf_size * 4):
+            lo = self._item_lo[b0:b1]
+            hi = self._item_hi[b0:b1]
+            q, items = self._search(lo - r, hi + r)
+            q += b0
+            keep = q < items
+            q = q[keep]
+            items = items[keep]
+            keep = _distance(self._item_lo[q], self._item_hi[q], self._item_lo[items], self._item_hi[items]) <= r
+            i = self._ids[q[keep]]
+            j = self._ids[items[keep]]
+            pairs.append(np.stack((np.minimum(i, j), np.maximum(i, j)), axis=1))
+        if not pairs:
+            return np.zeros((0, 2), dtype=np.int64)
+        pairs = np.concatenate(pairs)
+        return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+    def save(self, file_name, source=None):
+        """
+        Save the index to a numpy `.npz` file.
+
+        :param file_name:   index file name, see `default_index_file`
+        :param source:      dataset file name.  The dataset modification time and size are saved so that
+                            `load` will not load the index if the dataset changes.
+
+        .. versionadded:: 2024.1
+        """
+
+        meta = dict(self._meta)
+        meta.update({'version': INDEX_VERSION,
+                     'dimension': self._dimension,
+                     'leaf_size': self._leaf_size,
+                     'depth': self._depth,
+                     'lines': self._lines,
+                     'coordinate_system': self.coordinate_system.xml if gxcs.is_known(self.coordinate_system)
+                     else None})
+        if source:
+            meta['mtime'], meta['size'] = _file_state(source)
+        arrays = {'meta': np.array(json.dumps(meta)),
+                  'ids': self._ids,
+                  'points': self._points,
+                  'leaf_start': self._leaf_start,
+                  'split_axis': self._split_axis,
+                  'split_value': self._split_value,
+                  'node_lo': self._node_lo,
+                  'node_hi': self._node_hi}
+        if self._item_lo is not self._points:
+            arrays['item_lo'] = self._item_lo
+            arrays['item_hi'] = self._item_hi
+        if self._lines is not None:
+            arrays['line_rows'] = self._line_rows
+        with open(file_name, 'wb') as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, file_name, source=None):
+        """
+        Load an index saved by `save`.
+
+        :param file_name:   index file name
+        :param source:      dataset file name, if specified the index is only loaded if the dataset modification
+                            time and size are the same as when the index was saved.
+        :returns:           `SpatialIndex` instance, or None if the index is for a different version of the
+                            dataset or the index format.
+
+        .. versionadded:: 2024.1
+        """
+
+        with np.load(file_name, allow_pickle=False) as npz:
+            meta = json.loads(str(npz['meta']))
+            if meta.get('version') != INDEX_VERSION:
+                return None
+            if source and (meta.get('mtime'), meta.get('size')) != _file_state(source):
+                return None
+
+            index = cls.__new__(cls)
+            index._dimension = meta.pop('dimension')
+            index._leaf_size = meta.pop('leaf_size')
+            index._depth = meta.pop('depth')
+            index._lines = meta.pop('lines')
+            index._cs = meta.pop('coordinate_system')
+            for key in ('version', 'mtime', 'size'):
+                meta.pop(key, None)
+            index._meta = meta
+            index._ids = npz['ids']
+            index._points = npz['points']
+            index._leaf_start = npz['leaf_start']
+            index._split_axis = npz['split_axis']
+            index._split_value = npz['split_value']
+            index._node_lo = npz['node_lo']
+            index._node_hi = npz['node_hi']
+            if 'item_lo' in npz:
+                index._item_lo = npz['item_lo']
+                index._item_hi = npz['item_hi']
+            else:
+                index._item_lo = index._item_hi = index._points
+            if index._lines is not None:
+                index._line_rows = npz['line_rows']
+        return index
@@ -900,7 +900,7 @@ class Surface(gxspd.SpatialData, Sequence):
         else:
             required_cs = self.coordinate_system
         if coordinate_system != required_cs:
-            gxcs.Coordinate_translate(coordinate_system, required_cs).convert_vv(xvv, yvv, zvv)
+            gxcs.coordinate_translate(coordinate_system, required_cs).convert_vv(xvv, yvv, zvv)
 
         self._gxsurfaceitem.add_mesh(xvv.gxvv, yvv.gxvv, zvv.gxvv,
                                      f1vv.gxvv, f2vv.gxvv, f3vv.gxvv)
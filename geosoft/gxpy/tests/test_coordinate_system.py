@@ -542,6 +542,98 @@ class Test(GXPYTest):
         self.assertTrue(new_cs.is_oriented)
         self.assertFalse(new_cs.is_known)
 
+    def test_cache(self):
+        self.start()
+
+        gxcs.clear_cache()
+        cs1 = gxcs.Coordinate_system('NAD83 / UTM zone 17N')
+        cs2 = gxcs.Coordinate_system('NAD83 / UTM zone 17N')
+        self.assertFalse(cs1 is cs2)
+        self.assertEqual(cs1.gxf, cs2.gxf)
+        self.assertTrue(cs1 == cs2)
+        self.assertTrue(cs1 == 'NAD83 / UTM zone 17N')
+        self.assertFalse(cs1 == 'NAD27 / UTM zone 17N')
+        self.assertFalse(cs1 == 'NAD27 / UTM zone 17N')  # cached comparison
+
+        # cached copies can still be changed
+        cs2.vcs = 'NAVD88'
+        self.assertEqual(cs2.name, 'NAD83 / UTM zone 17N [NAVD88]')
+        self.assertEqual(cs1.name, 'NAD83 / UTM zone 17N')
+        self.assertEqual(gxcs.Coordinate_system('NAD83 / UTM zone 17N').name, 'NAD83 / UTM zone 17N')
+        self.assertFalse(cs2 == gxcs.Coordinate_system('NAD83 / UTM zone 17N [CGVD28]'))
+
+        # interned coordinate systems are shared and read-only
+        ics = gxcs.interned('NAD83 / UTM zone 17N')
+        self.assertTrue(ics is gxcs.interned('NAD83 / UTM zone 17N'))
+        self.assertTrue(ics is gxcs.interned(ics))
+        self.assertTrue(ics.read_only)
+        self.assertFalse(cs1.read_only)
+        self.assertTrue(ics == cs1)
+        with self.assertRaises(gxcs.CSException):
+            ics.vcs = 'NAVD88'
+
+        # translations are cached
+        pj = gxcs.coordinate_translate('NAD83 / UTM zone 17N', 'NAD27 / UTM zone 17N')
+        self.assertTrue(pj is gxcs.coordinate_translate(cs1, 'NAD27 / UTM zone 17N'))
+        xyz = pj.convert((500000., 6000000., 50.))
+        self.assertEqual(xyz, gxcs.Coordinate_translate(cs1, 'NAD27 / UTM zone 17N').convert((500000., 6000000., 50.)))
+
+        gxcs.clear_cache()
+        self.assertFalse(pj is gxcs.coordinate_translate(cs1, 'NAD27 / UTM zone 17N'))
+
+
+    def test_convert_array(self):
+        self.start()
+
+        pj = gxcs.Coordinate_translate('NAD83 / UTM zone 15N', 'NAD27')
+        np.random.seed(0)
+        data = np.empty((5000, 4))
+        data[:, 0] = np.random.uniform(300000., 400000., len(data))
+        data[:, 1] = np.random.uniform(6400000., 6500000., len(data))
+        data[:, 2] = np.random.uniform(0., 100., len(data))
+        data[:, 3] = np.arange(len(data))
+        data[7, 1] = np.nan
+
+        vvx = gxvv.GXvv(data[:, 0])
+        vvy = gxvv.GXvv(data[:, 1])
+        vvz = gxvv.GXvv(data[:, 2])
+        pj.convert_vv(vvx, vvy, vvz)
+        expected = np.array([vvx.np, vvy.np, vvz.np]).T
+
+        xyz = data.copy()
+        self.assertTrue(pj.convert_array(xyz, chunk_size=333) is xyz)
+        self.assertTrue(np.array_equal(xyz[:, :3], expected, equal_nan=True))
+        self.assertTrue(np.array_equal(xyz[:, 3], data[:, 3]))
+        self.assertTrue(np.isnan(xyz[7, 0]))
+
+        xyz = data.copy()
+        pj.convert_array(xyz, chunk_size=333, threads=4)
+        self.assertTrue(np.array_equal(xyz[:, :3], expected, equal_nan=True))
+
+        # strided view, only x, y
+        xyz = data.copy()
+        pj.convert_array(xyz[:, :2], chunk_size=1000)
+        self.assertTrue(np.array_equal(xyz[:, 2], data[:, 2]))
+
+        xyz = data.copy()
+        self.assertTrue(pj.convert(xyz, in_place=True) is xyz)
+        self.assertTrue(np.array_equal(xyz[:, :3], expected, equal_nan=True))
+        self.assertTrue(np.array_equal(pj.convert(data), expected, equal_nan=True))
+
+        self.assertRaises(gxcs.CSException, pj.convert_array, data.astype(np.float32))
+        self.assertRaises(gxcs.CSException, pj.convert_array, data[:, 0])
+
+        with gxcs.Coordinate_system({'type': 'local', 'lon_lat': (-96., 43.), 'azimuth': 25}) as cs:
+            xyzo = data[:, :3].copy()
+            xyz = cs.xyz_from_oriented(xyzo)
+            self.assertEqual(xyz.shape, (len(data), 3))
+            self.assertTrue(np.array_equal(cs.xyz_from_oriented(xyzo, threads=3), xyz, equal_nan=True))
+            self.assertTrue(np.array_equal(cs.xyz_from_oriented(xyzo.T, column_ordered=True), xyz.T, equal_nan=True))
+
+            back = xyz.copy()
+            self.assertTrue(cs.oriented_from_xyz(back, in_place=True) is back)
+            self.assertTrue(np.allclose(back[8:], xyzo[8:]))
+
 
 ###############################################################################################
 
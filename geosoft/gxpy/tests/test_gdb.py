@@ -356,6 +356,98 @@ class Test(GXPYTest):
 
             gdb.discard()
 
+    def test_line_reader(self):
+        self.start()
+
+        with gxdb.Geosoft_gdb.open(self.gdb_name) as gdb:
+
+            reader = gxdb.LineReader(gdb, ['X', 'Y', 'Z'])
+            self.assertEqual(reader.width, 3)
+            self.assertEqual(reader.channel_names, ['X', 'Y', 'Z'])
+
+            npd, ch, fid = reader.read('D578625')
+            self.assertEqual(npd.shape, (832, 3))
+            self.assertTrue(npd.flags['F_CONTIGUOUS'])
+            self.assertEqual(npd[10].tolist(), [578625.0, 7773625.0, -1195.7531280517615])
+            self.assertEqual(fid, (0.0, 1.0))
+
+            npd2, ch2, fid2 = gdb.read_line('D578625', channels=['X', 'Y', 'Z'])
+            self.assertTrue(np.array_equal(npd, npd2))
+            self.assertEqual(ch, ch2)
+
+            out = np.zeros((1000, 3), order='F')
+            npd, ch, fid = reader.read('D578625', out=out)
+            self.assertEqual(npd.shape, (832, 3))
+            self.assertEqual(out[10, 0], 578625.0)
+            self.assertRaises(gxdb.GdbException, reader.read, 'D578625', out=np.zeros((10, 3)))
+            self.assertRaises(gxdb.GdbException, reader.read, 'D578625', out=np.zeros((1000, 2)))
+
+            reader = gxdb.LineReader(gdb, ['X', 'Y'], reuse_buffer=True)
+            npd, ch, fid = reader.read('D578625')
+            npd2, ch, fid = reader.read('D578625', fid=(0.1, 4.8))
+            self.assertEqual(npd2.shape, (174, 2))
+            self.assertTrue(np.shares_memory(npd, npd2))
+
+            gdb.discard()
+
+    def test_line_writer(self):
+        self.start()
+
+        with gxdb.Geosoft_gdb.open(self.gdb_name) as gdb:
+
+            gdb.delete_channel(['w1', 'w2'])
+            writer = gxdb.LineWriter(gdb, ['w1', 'X', 'w2'])
+            self.assertEqual(writer.width, 3)
+            self.assertEqual(writer.channels, ['w1', 'X', 'w2'])
+
+            data = np.array([[1.0, 10.0, np.nan], [2.0, 20.0, 200.0], [np.nan, 30.0, 300.0]])
+            writer.write('D578625', data, fid=(5.0, 0.5))
+            npd, ch, fid = gdb.read_line('D578625', channels=['w1', 'X', 'w2'])
+            self.assertEqual(fid, (5.0, 0.5))
+            self.assertTrue(np.array_equal(npd, data, equal_nan=True))
+            self.assertTrue(np.isnan(data[0, 2]))
+
+            writer.write('D2', data[:2])
+            npd, ch, fid = gdb.read_line('D2', channels=['w1', 'X', 'w2'])
+            self.assertTrue(np.array_equal(npd, data[:2], equal_nan=True))
+
+            self.assertRaises(gxdb.GdbException, writer.write, 'D2', data[:, :2])
+
+            gdb.write_line('D578625', data[:, [0, 2]], channels=['w1', 'w2'])
+            npd, ch, fid = gdb.read_line('D578625', channels=['w1', 'w2'])
+            self.assertTrue(np.array_equal(npd, data[:, [0, 2]], equal_nan=True))
+            self.assertEqual(fid, (0.0, 1.0))
+
+            gdb.discard()
+
+    def test_iter_lines(self):
+        self.start()
+
+        with gxdb.Geosoft_gdb.open(self.gdb_name) as gdb:
+
+            lines = list(gdb.list_lines())
+            n = 0
+            for line, npd, fid in gdb.iter_lines(['X', 'Y', 'Z']):
+                self.assertTrue(line in lines)
+                self.assertEqual(npd.shape[1], 3)
+                n += 1
+            self.assertEqual(n, len(lines))
+
+            chunks = list(gdb.iter_lines(['X', 'Y'], lines=['D578625'], chunk_rows=100))
+            self.assertEqual(len(chunks), 9)
+            self.assertEqual(chunks[0][1].shape, (100, 2))
+            self.assertEqual(chunks[-1][1].shape, (32, 2))
+            self.assertEqual(chunks[1][2], (100.0, 1.0))
+            self.assertEqual(chunks[0][1][10].tolist(), [578625.0, 7773625.0])
+            self.assertRaises(gxdb.GdbException, list, gdb.iter_lines(chunk_rows=0))
+
+            npd, ch, fid = gdb.read_line('D578625', channels=['X', 'Y'])
+            for line, data, fid in gdb.iter_lines(['X', 'Y'], lines=['D578625'], prefetch=2):
+                self.assertEqual(line, 'D578625')
+                self.assertTrue(np.array_equal(npd, data))
+
+            gdb.discard()
+
     def test_read_line_dataframe(self):
         self.start()
 
@@ -371,6 +463,31 @@ class Test(GXPYTest):
             self.assertEqual(df.shape, (832, 3))
             self.assertEqual(df.values[10, :3].tolist(), [578625.0, 7773625.0, -1195.7531280517615])
 
+            df, ch, fid = gdb.read_line_dataframe('D578625', array_format=gxdb.DATAFRAME_ARRAY_MULTIINDEX)
+            self.assertEqual(df.shape, (832, 10))
+            self.assertEqual(df.columns.nlevels, 2)
+            self.assertEqual(df[('X', '')].iloc[10], 578625.0)
+            self.assertEqual(ch, list(df.columns))
+
+            df_expand, ch_expand, fid = gdb.read_line_dataframe('D578625')
+            df, ch, fid = gdb.read_line_dataframe('D578625', array_format=gxdb.DATAFRAME_ARRAY_BLOCK)
+            self.assertEqual(df.shape[0], 832)
+            self.assertEqual(df.shape[1], len(gdb.sorted_chan_list()))
+            for cn in df.columns:
+                if '{}[0]'.format(cn) in ch_expand:
+                    self.assertEqual(df[cn].iloc[10][0], df_expand['{}[0]'.format(cn)].iloc[10])
+            self.assertRaises(gxdb.GdbException, gdb.read_line_dataframe, 'D578625', array_format=99)
+
+            lines = list(gdb.list_lines())
+            df, ch = gdb.read_lines_dataframe(channels=['X', 'Y'])
+            self.assertEqual(ch, ['line', 'X', 'Y'])
+            self.assertEqual(sorted(df['line'].cat.categories), sorted(lines))
+            self.assertEqual(len(df), sum(len(gdb.read_line(ln, channels=['X', 'Y'])[0]) for ln in lines))
+            self.assertEqual(df[df['line'] == 'D578625']['X'].iloc[10], 578625.0)
+
+            df, ch = gdb.read_lines_dataframe(lines=[], channels=['X'])
+            self.assertEqual(len(df), 0)
+
             gdb.discard()
 
     def test_read_vv_GDB(self):
@@ -469,6 +586,14 @@ class Test(GXPYTest):
                 self.assertEqual(npd.shape, (832,1))
                 self.assertEqual(npd.shape[1], len(ch))
 
+                npd, ch, fid = gdb.read_line('D2', dummy_policy=gxu.DUMMY_DROP)
+                self.assertEqual(npd.shape, (825, 10))
+
+                npd, ch, fid = gdb.read_line('D2', channels=('x', 'y'),
+                                             dummy_policy={'y': gxu.DUMMY_FILL}, fill_value={'y': 0.})
+                self.assertEqual(npd.shape, (832, 2))
+                self.assertFalse(np.isnan(npd[:, 1]).any())
+
                 px = geosoft.gxpy.geometry.Point2(gdb.extent_xyz)
                 self.assertEqual(str(px), '_point2_[(578625.0, 7773625.0, -5261.5553894043005) (578625.0, 7782875.0, 1062.4999999999964)]')
 
@@ -539,6 +664,40 @@ class Test(GXPYTest):
             finally:
                 gdb.discard()
 
+    def test_select_lines_in_area(self):
+        self.start()
+
+        with gxdb.Geosoft_gdb.open(self.gdb_name) as gdb:
+
+            try:
+                gdb.select_lines()
+                x, y = gdb.read_line('D578625', channels=['X', 'Y'])[0].T
+                box = gxgeo.Point2((578600, 7773000, 578650, 7774000))
+                inside = (x >= 578600) & (x <= 578650) & (y >= 7773000) & (y <= 7774000)
+
+                lines = gdb.select_lines_in_area(box, select=False)
+                self.assertTrue('D578625' in lines)
+                self.assertEqual(len(gdb.list_lines()), 5)
+
+                ranges = gdb.select_lines_in_area(box, row_ranges=True)
+                self.assertEqual(sorted(ranges), sorted(lines))
+                self.assertEqual(sorted(gdb.list_lines()), sorted(lines))
+                rows = np.zeros(len(x), dtype=bool)
+                for r0, r1 in ranges['D578625']:
+                    rows[r0:r1] = True
+                self.assertTrue(np.array_equal(rows, inside))
+
+                far = gxgeo.Point2((0, 0, 10, 10))
+                self.assertEqual(gdb.select_lines_in_area(far, selected=False, select=False), [])
+
+                polygon = gxgeo.PPoint(((578600, 7773000), (578650, 7773000), (578650, 7774000), (578600, 7774000)))
+                self.assertEqual(sorted(gdb.select_lines_in_area(polygon, selected=False)), sorted(lines))
+
+                self.assertRaises(gxdb.GdbException, gdb.select_lines_in_area, 'D2')
+
+            finally:
+                gdb.select_lines()
+
     def test_write_vv_GDB(self):
         self.start()
 
@@ -0,0 +1,103 @@
+import unittest
+import os
+import numpy as np
+
+import geosoft
+import geosoft.gxpy.system as gsys
+import geosoft.gxpy.gdb as gxdb
+import geosoft.gxpy.gdb_cache as gxcache
+
+from base import GXPYTest
+
+
+class Test(GXPYTest):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.setUpGXPYTest()
+        cls.folder, files = gsys.unzip(os.path.join(os.path.dirname(cls._test_case_py), 'test_database.zip'),
+                                       folder=cls._gx.temp_folder())
+        cls.gdb_name = os.path.join(cls.folder, 'test_database.gdb')
+
+    def test_version(self):
+        self.start()
+        self.assertEqual(gxcache.__version__, geosoft.__version__)
+
+    def test_build(self):
+        self.start()
+
+        with gxdb.Geosoft_gdb.open(self.gdb_name) as gdb:
+            cache = gxcache.GdbCache(gdb)
+            cache.clear()
+            self.assertFalse(cache.is_valid)
+            self.assertEqual(cache.folder, gxcache.default_cache_folder(gdb.file_name))
+
+            cache.build(channels=['X', 'Y', 'Z'])
+            self.assertTrue(cache.is_valid)
+            self.assertTrue(os.path.isfile(os.path.join(cache.folder, gxcache.MANIFEST_FILE)))
+            self.assertTrue(cache.has('D578625', 'X'))
+            self.assertFalse(cache.has('D578625', 'dx'))
+            self.assertEqual(cache.channel_details('X')['name'], 'X')
+
+            data, fid = cache.read_channel('D578625', 'X')
+            self.assertTrue(isinstance(data, np.memmap))
+            self.assertEqual(data.shape, (832,))
+            self.assertEqual(data[10], 578625.0)
+            self.assertEqual(fid, (0.0, 1.0))
+            self.assertRaises(gxcache.GdbCacheException, cache.read_channel, 'D578625', 'dx')
+
+            npd, ch, fid = cache.read_line('D578625', ['X', 'Y', 'Z'])
+            self.assertEqual(npd.shape, (832, 3))
+            self.assertEqual(ch, ['X', 'Y', 'Z'])
+            self.assertEqual(npd[10].tolist(), [578625.0, 7773625.0, -1195.7531280517615])
+            self.assertEqual(cache.read_line('D578625', ['X'], fid=(0.5, 1.0)), None)
+
+            # reopen uses the existing cache
+            cache2 = gxcache.GdbCache(gdb)
+            self.assertTrue(cache2.is_valid)
+
+            cache.clear()
+            self.assertFalse(os.path.isdir(cache.folder))
+
+    def test_no_file(self):
+        self.start()
+
+        gdb = gxdb.Geosoft_gdb()
+        self.assertEqual(gdb.file_name, None)
+        self.assertEqual(gdb.use_cache(), None)
+        self.assertRaises(gxcache.GdbCacheException, gxcache.GdbCache, gdb)
+
+    def test_gdb_read(self):
+        self.start()
+
+        with gxdb.Geosoft_gdb.open(self.gdb_name) as gdb:
+            npd_db, ch_db, fid_db = gdb.read_line('D578625', channels=['X', 'Y', 'Z'])
+
+            cache = gdb.use_cache(channels=['X', 'Y', 'Z'])
+            self.assertTrue(cache.is_valid)
+
+            data, fid = gdb.read_channel('D578625', 'X')
+            self.assertTrue(isinstance(data, np.memmap))
+            self.assertEqual(data[10], 578625.0)
+
+            npd, ch, fid = gdb.read_line('D578625', channels=['X', 'Y', 'Z'])
+            self.assertTrue(np.array_equal(npd, npd_db, equal_nan=True))
+            self.assertEqual(ch, ch_db)
+            self.assertEqual(fid, fid_db)
+
+            # uncommitted changes bypass the cache
+            gdb.write_channel('D578625', 'X', np.arange(832, dtype=np.float64))
+            self.assertFalse(cache.is_valid)
+            data, fid = gdb.read_channel('D578625', 'X')
+            self.assertFalse(isinstance(data, np.memmap))
+            self.assertEqual(data[10], 10.0)
+
+            gdb.discard()
+            cache.clear()
+
+
+###############################################################################################
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+import os
+import numpy as np
+
+import geosoft
+import geosoft.gxpy.system as gsys
+import geosoft.gxpy.utility as gxu
+import geosoft.gxpy.gdb as gxdb
+import geosoft.gxpy.vv as gxvv
+import geosoft.gxpy.gdb_index as gxindex
+
+from base import GXPYTest
+
+
+class Test(GXPYTest):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.setUpGXPYTest()
+        cls.folder, files = gsys.unzip(os.path.join(os.path.dirname(cls._test_case_py), 'test_database.zip'),
+                                       folder=cls._gx.temp_folder())
+        cls.gdb_name = os.path.join(cls.folder, 'test_database.gdb')
+
+    def test_version(self):
+        self.start()
+        self.assertEqual(gxindex.__version__, geosoft.__version__)
+
+    def test_statistics(self):
+        self.start()
+
+        stats = gxindex.channel_statistics(np.array([1.0, np.nan, 3.0, -2.0]), (10.0, 0.5))
+        self.assertEqual(stats['min'], -2.0)
+        self.assertEqual(stats['max'], 3.0)
+        self.assertEqual(stats['count'], 3)
+        self.assertEqual(stats['dummies'], 1)
+        self.assertEqual(stats['length'], 4)
+        self.assertEqual(stats['fid'], [10.0, 0.5])
+
+        stats = gxindex.channel_statistics(np.array([], dtype=np.float64))
+        self.assertEqual(stats['count'], 0)
+        self.assertEqual(stats['min'], None)
+
+        stats = gxindex.channel_statistics(np.array([[1, gxu.gx_dummy(np.int32)], [5, 2]], dtype=np.int32))
+        self.assertEqual(stats['count'], 3)
+        self.assertEqual(stats['dummies'], 1)
+        self.assertEqual(stats['length'], 2)
+        self.assertEqual(stats['max'], 5.0)
+
+    def test_index(self):
+        self.start()
+
+        with gxdb.Geosoft_gdb.open(self.gdb_name) as gdb:
+            ext = gdb.extent
+
+            index = gdb.use_index()
+            index.clear()
+            self.assertEqual(gdb.index, index)
+            self.assertEqual(index.file_name, gxindex.default_index_file(gdb.file_name))
+
+            stats = index.statistics('D578625', 'X')
+            self.assertEqual(stats['length'], 832)
+            self.assertEqual(stats['fid'], [0.0, 1.0])
+            self.assertTrue('D578625' in index.lines)
+
+            gdb.clear_extent()
+            ext_index = gdb.extent
+            self.assertEqual(ext_index.p0.xyz, ext.p0.xyz)
+            self.assertEqual(ext_index.p1.xyz, ext.p1.xyz)
+
+            box = index.line_extent('D578625')
+            self.assertEqual(box[0], stats['min'])
+            self.assertEqual(box[3], stats['max'])
+
+            gdb.write_channel('D578625', 'ix', np.array([1.0, 2.0, np.nan, 8.0]), fid=(5.0, 2.0))
+            stats = index.statistics('D578625', 'ix')
+            self.assertEqual(stats['min'], 1.0)
+            self.assertEqual(stats['max'], 8.0)
+            self.assertEqual(stats['dummies'], 1)
+            self.assertEqual(stats['fid'], [5.0, 2.0])
+
+            # new channels written from a VV are indexed under the database channel name
+            gdb.write_channel_vv('D578625', 'ixvv', gxvv.GXvv(np.array([3.0, 4.0])))
+            self.assertTrue(index.is_indexed('D578625', gdb.channel_name_symb('ixvv')[0]))
+            self.assertEqual(index.statistics('D578625', 'ixvv')['max'], 4.0)
+            gdb.delete_channel('ixvv')
+
+            gdb.delete_line_data('D578625')
+            self.assertEqual(index.statistics('D578625', 'ix')['count'], 0)
+            self.assertEqual(gdb.list_values('ix', selected=False), [])
+
+            gdb.delete_channel('ix')
+            self.assertFalse('ix' in index._lines.get('D578625', {}))
+            gdb.discard()
+            self.assertFalse('D578625' in index.lines)
+
+    def test_persist(self):
+        self.start()
+
+        with gxdb.Geosoft_gdb.open(self.gdb_name) as gdb:
+            index = gdb.use_index(build=True)
+            gdb.commit()
+            self.assertTrue(os.path.isfile(index.file_name))
+            n = len(index.lines)
+
+        with gxdb.Geosoft_gdb.open(self.gdb_name) as gdb:
+            index = gdb.use_index()
+            self.assertEqual(len(index.lines), n)
+            index.clear()
+            self.assertFalse(os.path.isfile(index.file_name))
+
+
+###############################################################################################
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -691,6 +691,62 @@ class Test(GXPYTest):
         self.assertEqual(tuple(pm[4]), (550160., 6000070., 0.))
         self.assertEqual(str(pm[5]), '_point_(550173.9373550161, 6000287.416398498, 4.0)')
 
+    def test_pp_block(self):
+        self.start()
+
+        pp = gxgeo.PPoint(((1, 2, 3), (4, 5, 6), (7, 8, 9)), attributes={'v': (10, 20, 30), 'k': 1})
+        self.assertEqual(pp.attributes, ['v', 'k'])
+        self.assertEqual(pp.block.shape, (5, 3))
+        self.assertEqual(pp.attribute('v').tolist(), [10., 20., 30.])
+        self.assertEqual(pp.attribute('k').tolist(), [1., 1., 1.])
+        self.assertRaises(gxgeo.GeometryException, pp.attribute, 'nope')
+
+        # slices are views
+        s = pp[1:]
+        self.assertEqual(len(s), 2)
+        self.assertEqual(s.attributes, ['v', 'k'])
+        s.x = -1.
+        s.attribute('v')[:] = 0.
+        self.assertEqual(pp.x.tolist(), [1., -1., -1.])
+        self.assertEqual(pp.attribute('v').tolist(), [10., 0., 0.])
+        self.assertEqual(pp[[0, 2]].x.tolist(), [1., -1.])
+        self.assertEqual(pp.copy().attributes, ['v', 'k'])
+
+        pp.set_attribute('w', 5.)
+        self.assertEqual(pp.block.shape, (6, 3))
+        self.assertEqual(s.attributes, ['v', 'k'])
+
+        # setting locations keeps attributes, unless the number of points changes
+        pp.pp = pp.pp + 1.
+        self.assertEqual(pp.attribute('w').tolist(), [5., 5., 5.])
+        pp.pp = np.zeros((5, 3))
+        self.assertEqual(len(pp), 5)
+        self.assertEqual(pp.attributes, [])
+        s.pp = np.ones((1, 3))
+        self.assertEqual(s.block.shape, (3, 1))
+
+        block = np.zeros((4, 100))
+        pp = gxgeo.PPoint.from_block(block, coordinate_system='NAD83 / UTM zone 15N', attributes=['v'])
+        pp.y = 6000000.
+        self.assertEqual(block[1, 50], 6000000.)
+        self.assertRaises(gxgeo.GeometryException, gxgeo.PPoint.from_block, block)
+
+        # reprojection is deferred until the locations are read
+        pp = gxgeo.PPoint(((500000, 6000000), (500001, 6000001)), coordinate_system='NAD83 / UTM zone 15N')
+        pp27 = gxgeo.PPoint(pp, coordinate_system='NAD27 / UTM zone 15N')
+        self.assertTrue(len(pp27._pending))
+        self.assertEqual(pp27[0].xyz, (500016.35614845896, 5999777.5863711238, 0.0))
+        self.assertFalse(len(pp27._pending))
+        self.assertEqual(pp.x.tolist(), [500000., 500001.])
+
+        pm = gxgeo.PPoint.merge((pp27, pp, gxgeo.PPoint(((1, 2),), attributes={'v': 3})))
+        self.assertEqual(pm.coordinate_system, 'NAD27 / UTM zone 15N')
+        self.assertEqual(pm.attributes, ['v'])
+        self.assertTrue(np.isnan(pm.attribute('v')[0]))
+        self.assertEqual(pm.attribute('v')[4], 3.)
+        self.assertEqual(pm[2].xyz, pm[0].xyz)
+        self.assertEqual(pm[4].xyz, (1., 2., 0.))
+
     def test_union(self):
         self.start()
         
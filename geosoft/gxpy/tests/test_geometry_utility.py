@@ -122,6 +122,73 @@ class Test(GXPYTest):
         self.assertEqual(ppr[0], pp[0])
         self.assertEqual(ppr[1], pp[1])
 
+    def test_resample_lines(self):
+        self.start()
+
+        plinelist = [[110, 5],
+                     [120, 20],
+                     [130, 15],
+                     [150, 50],
+                     [160, 70],
+                     [175, 35],
+                     [190, 65],
+                     [220, 50],
+                     [235, 18.5]]
+        lines = [plinelist,
+                 plinelist + [plinelist[0]],
+                 [[110, 5]],
+                 [[110, 5], [120, 20]],
+                 [[110, 5], [110, 5], [120, 20], [130, 15]]]
+        offsets, xy = gxgeou.lines_to_ragged(lines)
+        self.assertEqual(list(offsets), [0, 9, 19, 20, 22, 26])
+        self.assertEqual(xy.shape, (26, 2))
+
+        # same as resampling each line, Akima and linear match the Geosoft splines
+        for spline in (gxgeou.SPLINE_LINEAR, gxgeou.SPLINE_AKIMA, gxgeou.SPLINE_NEAREST):
+            ro, rxy = gxgeou.resample_lines(offsets, xy, 2.5, spline=spline)
+            self.assertEqual(len(ro), 6)
+            resampled = gxgeou.lines_from_ragged(ro, rxy)
+            for line, r in zip(lines, resampled):
+                if len(line) > 1:
+                    expected = gxgeou.resample(np.array(line, dtype=np.float64)[1 if len(line) == 4 else 0:], 2.5,
+                                               spline=spline)
+                else:
+                    expected = np.array(line, dtype=np.float64)
+                self.assertEqual(r.shape, expected.shape)
+                self.assertTrue(np.allclose(r, expected))
+
+        ro, rxy = gxgeou.resample_lines(offsets, xy, 2.5, spline=gxgeou.SPLINE_AKIMA, closed=True)
+        resampled = gxgeou.lines_from_ragged(ro, rxy)
+        self.assertEqual(len(resampled[0]), 145)
+        self.assertEqual(tuple(resampled[0][-1]), (110., 5.))
+        self.assertTrue(np.allclose(resampled[0][-2], (109.96046205631022, 4.960353267681198)))
+        self.assertTrue(np.allclose(resampled[1], resampled[0]))
+
+        ro, rxy = gxgeou.resample_lines(offsets, xy, 2.5)
+        resampled = gxgeou.lines_from_ragged(ro, rxy)
+        self.assertEqual(len(resampled[0]), 93)
+        self.assertEqual(tuple(resampled[0][0]), (110., 5.))
+        self.assertEqual(tuple(resampled[2][0]), (110., 5.))
+        self.assertTrue(np.allclose(resampled[3][-1], (119.7072534339415, 19.560880150912265)))
+
+        ro, rx = gxgeou.resample_lines([0, 9], np.array(plinelist)[:, 0], 2.5)
+        self.assertEqual(rx.shape, (51, 1))
+        self.assertEqual(rx[-1, 0], 235.)
+
+        self.assertRaises(gxgeou.GeometryUtilityException, gxgeou.resample_lines, offsets, xy, 0.)
+
+    def test_points_in_polygon(self):
+        self.start()
+
+        square = gxgeo.PPoint(((0, 0), (10, 0), (10, 10), (0, 10)))
+        xy = np.array([[5, 5], [-1, 5], [5, 11], [9.9, 0.1], [np.nan, 5], [20, 20]])
+        self.assertEqual(gxgeou.points_in_polygon(xy, square).tolist(), [True, False, False, True, False, False])
+
+        triangle = [(0, 0), (10, 0), (0, 10), (0, 0)]
+        self.assertEqual(gxgeou.points_in_polygon([[1, 1], [6, 6]], triangle).tolist(), [True, False])
+
+        self.assertRaises(gxgeou.GeometryUtilityException, gxgeou.points_in_polygon, xy, [(0, 0), (1, 1)])
+
 
 ###############################################################################################
 
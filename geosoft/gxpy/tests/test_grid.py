@@ -8,6 +8,8 @@ import geosoft.gxpy.gx as gx
 import geosoft.gxpy.system as gsys
 import geosoft.gxpy.coordinate_system as gxcs
 import geosoft.gxpy.grid as gxgrd
+import geosoft.gxpy.vv as gxvv
+import geosoft.gxpy.utility as gxu
 import geosoft.gxpy.map as gxmap
 import geosoft.gxpy.gdb as gxgdb
 
@@ -68,6 +70,22 @@ class Test(GXPYTest):
             stats = g1.statistics()
             self.assertAlmostEqual(stats['mean'], 997.2176063303659)
             self.assertEqual(stats['num_data'] + stats['num_dummy'], g1.nx * g1.ny)
+            ndummy = stats['num_dummy']
+        self.assertTrue(ndummy > 0)
+
+        # integer grid dummies are not data
+        with gxgrd.Grid.open(self.g1f, dtype=np.int32) as g1:
+            stats = g1.statistics()
+            self.assertEqual(stats['num_dummy'], ndummy)
+            self.assertEqual(stats['num_data'] + stats['num_dummy'], g1.nx * g1.ny)
+            self.assertTrue(stats['min'] > gxu.gx_dummy(np.int32))
+            self.assertAlmostEqual(stats['mean'], 997.2176063303659, delta=1.)
+
+            data_stats = g1.data_statistics().statistics()
+            self.assertEqual(data_stats['num_dummy'], ndummy)
+            self.assertEqual(data_stats['min'], stats['min'])
+            self.assertEqual(data_stats['max'], stats['max'])
+            self.assertAlmostEqual(data_stats['mean'], stats['mean'])
 
     def test_copy(self):
         self.start()
@@ -553,6 +571,58 @@ class Test(GXPYTest):
             self.assertEqual(g.get_value(7.043, 44.625), 1912.4500000000035)
             self.assertEqual(g.get_value(0,0), None)
 
+    def test_tiles(self):
+        self.start()
+
+        with gxgrd.Grid.open(self.g1f) as g:
+            data = g.np()
+            g.set_tile_cache(tile_size=16, max_tiles=4)
+
+            window = g.read_window(10, 20, 40, 30)
+            self.assertEqual(window.shape, (30, 40))
+            self.assertTrue(np.array_equal(window, data[20:50, 10:50], equal_nan=True))
+            self.assertTrue(len(g._tiles) <= 4)
+            self.assertTrue(np.array_equal(g.read_window(), data, equal_nan=True))
+            self.assertRaises(gxgrd.GridException, g.read_window, 90, 0, 20, 10)
+
+            self.assertEqual(g[0][3], 771)
+            self.assertEqual(g[45], (7.45, 44.0, 0.0, 1699))
+            self.assertEqual(g.get_value(7.043, 44.625), 1912.4500000000035)
+
+            core_sum = 0.
+            ntiles = 0
+            for ix0, iy0, tile, core in g.tiles(30, 40, halo=2):
+                ntiles += 1
+                ny, nx = tile.shape
+                self.assertTrue(np.array_equal(tile, data[iy0: iy0 + ny, ix0: ix0 + nx], equal_nan=True))
+                core_sum += np.nansum(tile[core])
+            self.assertEqual(ntiles, 4 * 3)
+            self.assertEqual(core_sum, np.nansum(data))
+
+            self.assertRaises(gxgrd.GridException, g.set_tile_cache, 0)
+
+        # integer grid dummies are numpy.nan in float windows and tiles
+        with gxgrd.Grid.open(self.g1f) as g:
+            ndummy = int(np.sum(np.isnan(g.np(dtype=np.float64))))
+        self.assertTrue(ndummy > 0)
+        with gxgrd.Grid.open(self.g1f, dtype=np.int32) as g:
+            g.set_tile_cache(tile_size=16)
+            window = g.read_window(dtype=np.float64)
+            self.assertEqual(int(np.sum(np.isnan(window))), ndummy)
+            self.assertEqual(int(np.sum(g.read_window() == gxu.gx_dummy(np.int32))), ndummy)
+            self.assertEqual(sum(int(np.sum(np.isnan(tile[core]))) for _, _, tile, core in
+                                 g.tiles(30, halo=1, dtype=np.float64)), ndummy)
+            self.assertEqual(g.get_value(7.043, 44.625), 1912.4500000000035)
+
+            # writes through the shared pager are seen by cached reads
+            with gxgrd.Grid.copy(g) as gc:
+                self.assertEqual(gc[0][3], 771)
+                mean = gc.statistics()['mean']
+                pg = gc.gxpg()
+                pg.write_row(0, 0, 0, gxvv.GXvv(np.zeros(gc.nx)).gxvv)
+                self.assertEqual(gc[0][3], 0)
+                self.assertNotEqual(gc.statistics()['mean'], mean)
+
     def test_metadata(self):
         self.start()
 
@@ -634,6 +704,36 @@ class Test(GXPYTest):
                 self.assertEqual(gm.xyz(0), (18.595203516590775, 39.8775426296126, 1007.0))
                 self.assertEqual(gm.xyz((g.nx - 1, g.ny - 1)), (19.00281516607315, 40.75166863280787, 1008.0342903237216))
 
+                xyz = gm.xyz_window()
+                self.assertEqual(xyz.shape, (g.ny, g.nx, 3))
+                self.assertEqual(tuple(xyz[0, 0]), gm.xyz(0))
+                self.assertEqual(tuple(xyz[-1, -1]), gm.xyz((g.nx - 1, g.ny - 1)))
+                self.assertTrue(np.array_equal(gm.xyz_window(10, 20, 5, 3), xyz[20:23, 10:15]))
+
+    def test_xyzv_iterators(self):
+        self.start()
+
+        with gxgrd.Grid.open(self.g1f) as g:
+            with gxgrd.Grid.copy(g) as gr:
+                gr.rot = 30.0
+                xyzv = gr.xyzv()
+                self.assertAlmostEqual(xyzv[100, 100, 0], gr.xy_from_index(100, 100)[0])
+                self.assertAlmostEqual(xyzv[100, 100, 1], gr.xy_from_index(100, 100)[1])
+
+                n = 0
+                for iy0, strip in gr.xyzv_rows(30):
+                    self.assertTrue(np.array_equal(strip, xyzv[iy0: iy0 + 30], equal_nan=True))
+                    n += strip.shape[0]
+                self.assertEqual(n, gr.ny)
+                self.assertRaises(gxgrd.GridException, next, gr.xyzv_rows(0))
+
+                n = 0
+                for ix0, iy0, tile in gr.xyzv_tiles(40, 25):
+                    ny, nx = tile.shape[:2]
+                    self.assertTrue(np.array_equal(tile, xyzv[iy0: iy0 + ny, ix0: ix0 + nx], equal_nan=True))
+                    n += nx * ny
+                self.assertEqual(n, gr.nx * gr.ny)
+
     def test_figure_map(self):
         self.start()
         map_file = gxgrd.figure_map(self.g1f, map_file='figure_map.map', title='image_test', features='all').file_name
@@ -651,6 +751,21 @@ class Test(GXPYTest):
             self.assertEqual(10081870.0, np.nansum(data))
             self.assertEqual(91, np.count_nonzero(np.isnan(data)))
 
+            window = g1.np(iy0=50, ny=20)
+            self.assertEqual(window.shape, (20, 101))
+            self.assertTrue(np.array_equal(window, data[50:70], equal_nan=True))
+
+            out = np.zeros((101, 101), dtype=np.float64)
+            self.assertTrue(g1.np(out=out) is out)
+            self.assertTrue(np.array_equal(out, data, equal_nan=True))
+            self.assertRaises(gxgrd.GridException, g1.np, out=np.zeros((10, 10)))
+            self.assertRaises(gxgrd.GridException, g1.np, iy0=100, ny=2)
+
+            xyzv = g1.xyzv()
+            xyzv_window = g1.xyzv(iy0=50, ny=20)
+            self.assertTrue(np.array_equal(xyzv_window, xyzv[50:70], equal_nan=True))
+            self.assertTrue(np.array_equal(xyzv[:, :, 3], data, equal_nan=True))
+
         with gxgrd.Grid.open(self.g2f) as g2:
             data = g2.np()
             self.assertEqual(data.dtype, np.dtype(np.float32))
@@ -676,6 +791,10 @@ class Test(GXPYTest):
             self.assertEqual(col_2[2], 102)
             self.assertEqual(col_2[3], 255)
 
+            window = gc.np(iy0=100, ny=1)
+            self.assertEqual(window.shape, (1, 254, 4))
+            self.assertTrue(np.array_equal(window[0], data[100]))
+
     def test_image_file(self):
         self.start()
 
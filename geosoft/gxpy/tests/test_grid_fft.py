@@ -109,6 +109,58 @@ class Test(GXPYTest):
 
             self.assertAlmostEqual(fft.result_grid().statistics()['sd'], 99.68591520777781, 0)
 
+    def test_np_filter(self):
+        self.start()
+
+        with gxfft.GridFFT(self.mag) as fft:
+            source = fft.source_grid.np(dtype=np.float64)
+            mask = np.isnan(source)
+            self.assertTrue(fft.np_source_transform is fft.np_source_transform)
+            u, v = fft.np_wavenumbers()
+            self.assertEqual(u.shape[1], fft.np_source_transform.shape[1])
+            self.assertEqual(v.shape[0], fft.np_source_transform.shape[0])
+
+            # no filter reproduces the source, continuation up then down as well
+            nofilter, updown = fft.np_results([[], ['CNUP 200', 'CNDN 200']])
+            self.assertTrue(np.array_equal(np.isnan(nofilter), mask))
+            self.assertTrue(np.allclose(nofilter[~mask], source[~mask], atol=0.01))
+            self.assertTrue(np.allclose(updown, nofilter, equal_nan=True))
+
+            heights = [100., 200., 400., 800.]
+            results = fft.np_results([[('CNUP', h)] for h in heights], threads=4)
+            self.assertEqual(len(results), 4)
+            sd = [np.nanstd(r) for r in results]
+            self.assertTrue(all(sd[i] > sd[i + 1] for i in range(3)))
+            self.assertTrue(np.array_equal(results[1], fft.np_results([['CNUP 200']], threads=1)[0],
+                                           equal_nan=True))
+
+            up = fft.np_result_grid(['CNUP 500'])
+            self.assertAlmostEqual(up.statistics()['variance'], 15442.23622462059, -2)
+
+            vd = fft.np_results([['DRVZ 1']])[0]
+            self.assertAlmostEqual(np.nanmean(vd), 0., 1)
+            rtp = fft.np_results([['REDP 90 0']])[0]
+            self.assertTrue(np.allclose(rtp[~mask], nofilter[~mask] - fft._np_trend_surface()[~mask]))
+            self.assertRaises(gxfft.GridFFTException, fft.np_filter, ['REDP'])
+            self.assertRaises(gxfft.GridFFTException, fft.np_filter, ['BTWR 100'])
+
+    def test_np_spectrum(self):
+        self.start()
+
+        with gxfft.GridFFT(self.mag) as fft:
+            pspec = fft.np_radially_averaged_spectrum()
+            self.assertTrue(pspec is fft.np_radially_averaged_spectrum())
+            self.assertEqual(pspec.shape[1], 5)
+            self.assertAlmostEqual(pspec[0, gxfft.I_WAVENUMBER], 0.)
+            self.assertAlmostEqual(pspec[1, gxfft.I_WAVENUMBER],
+                                   1000. * max(fft.du, fft.dv), 6)
+            self.assertEqual(pspec[:, gxfft.I_SAMPLE_COUNT][0], 1)
+
+            up = fft.np_radially_averaged_spectrum(['CNUP 500'])
+            dk = up[1:, gxfft.I_WAVENUMBER] / 1000.
+            self.assertTrue(np.allclose(up[1:, gxfft.I_LOG_POWER],
+                                        pspec[1:, gxfft.I_LOG_POWER] - 4. * math.pi * 500. * dk, atol=0.2))
+
 ###############################################################################################
 
 if __name__ == '__main__':
@@ -0,0 +1,137 @@
+import unittest
+import os
+import numpy as np
+
+import geosoft
+import geosoft.gxpy.system as gsys
+import geosoft.gxpy.grid as gxgrd
+import geosoft.gxpy.grid_utility as gxgrdu
+import geosoft.gxpy.grid_overview as gxgrdov
+
+from base import GXPYTest
+
+
+class Test(GXPYTest):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.setUpGXPYTest()
+        cls.folder, files = gsys.unzip(os.path.join(os.path.dirname(cls._test_case_py), 'testgrids.zip'),
+                                       folder=cls._gx.temp_folder())
+        cls.g1f = os.path.join(cls.folder, 'test_grid_1.grd')
+
+    def test_version(self):
+        self.start()
+        self.assertEqual(gxgrdov.__version__, geosoft.__version__)
+
+    def test_build(self):
+        self.start()
+
+        with gxgrd.Grid.open(self.g1f) as g:
+            self.assertEqual(g.overviews, None)
+            data = g.np(dtype=np.float64)
+
+            ov = g.build_overviews((4, 2))
+            self.assertTrue(ov.is_valid)
+            self.assertEqual(ov.levels, [2, 4])
+            self.assertEqual(ov.method, gxgrdov.OVERVIEW_MEAN)
+            self.assertTrue(os.path.isdir(ov.folder))
+
+            level = ov.read(2)
+            self.assertEqual(level.shape, (51, 51))
+            self.assertEqual(level.dtype, np.float32)
+            self.assertAlmostEqual(float(level[10, 20]), np.nanmean(data[20:22, 40:42]), 3)
+            self.assertAlmostEqual(float(level[50, 50]), data[100, 100], 3)
+            self.assertEqual(ov.read(4).shape, (26, 26))
+
+            p = ov.properties(4)
+            self.assertAlmostEqual(p['dx'], 0.04)
+            self.assertAlmostEqual(p['x0'], 7.015)
+            self.assertAlmostEqual(p['y0'], 44.015)
+            self.assertEqual(p['nx'], 26)
+
+            self.assertEqual(ov.level(0.005), 1)
+            self.assertEqual(ov.level(0.02), 2)
+            self.assertEqual(ov.level(0.035), 2)
+            self.assertEqual(ov.level(1.0), 4)
+            self.assertRaises(gxgrdov.GridOverviewException, ov.read, 8)
+            self.assertRaises(gxgrdov.GridOverviewException, ov.build, (1, 2))
+
+            ov.build((2,), method=gxgrdov.OVERVIEW_NEAREST)
+            self.assertTrue(np.array_equal(ov.read(2), data[::2, ::2].astype(np.float32), equal_nan=True))
+            self.assertAlmostEqual(ov.properties(2)['x0'], 7.0)
+
+            ov.build((2,), method=gxgrdov.OVERVIEW_MAX)
+            self.assertEqual(float(ov.read(2)[10, 20]), np.nanmax(data[20:22, 40:42]))
+
+        # overviews persist
+        with gxgrd.Grid.open(self.g1f) as g:
+            self.assertEqual(g.overviews.levels, [2])
+
+            data, properties = g.read_overview(0.05)
+            self.assertEqual(data.shape, (51, 51))
+            self.assertAlmostEqual(properties['dx'], 0.02)
+
+            data, properties = g.read_overview(0.01)
+            self.assertEqual(data.shape, (101, 101))
+            self.assertAlmostEqual(properties['dx'], 0.01)
+
+            g.overviews.clear()
+            self.assertEqual(g.overviews, None)
+
+    def test_sample(self):
+        self.start()
+
+        with gxgrd.Grid.open(self.g1f) as g:
+            ov = g.build_overviews((2,))
+            level = ov.read(2)
+            p = ov.properties(2)
+            xyz = np.array([[p['x0'] + 10 * p['dx'], p['y0'] + 20 * p['dy'], 0.],
+                            [p['x0'] + 10.5 * p['dx'], p['y0'] + 20 * p['dy'], 0.],
+                            [0., 0., 0.]])
+            v = gxgrdu.sample(g, xyz, cell_size=0.02)
+            self.assertAlmostEqual(v[0], float(level[20, 10]), 4)
+            self.assertAlmostEqual(v[1], (float(level[20, 10]) + float(level[20, 11])) * 0.5, 4)
+            self.assertTrue(np.isnan(v[2]))
+
+            full = gxgrdu.sample(g, xyz[:2])
+            self.assertAlmostEqual(full[0], g.get_value(xyz[0, 0], xyz[0, 1]), 4)
+            ov.clear()
+
+    def test_invalidate(self):
+        self.start()
+
+        file_name = os.path.join(self.folder, 'test_overview.grd(GRD)')
+        with gxgrd.Grid.copy(self.g1f, file_name, overwrite=True) as g:
+
+            # a grid open for writing may still change
+            self.assertFalse(g.read_only)
+            self.assertRaises(gxgrdov.GridOverviewException, g.build_overviews, (2,))
+            self.assertEqual(g.overviews, None)
+
+        with gxgrd.Grid.open(file_name) as g:
+            self.assertTrue(g.read_only)
+            g.build_overviews((2,))
+            folder = gxgrdov.default_overview_folder(g.file_name)
+            self.assertTrue(os.path.isdir(folder))
+
+        with gxgrd.Grid.open(file_name, mode=gxgrd.FILE_READWRITE) as g:
+            self.assertTrue(g.overviews is not None)
+            g.write_rows(np.zeros((1, g.nx)), iy0=0)
+            self.assertFalse(os.path.isdir(folder))
+            self.assertEqual(g.overviews, None)
+            g.delete_files()
+
+        # the shared pager of a read-only grid does not touch the overviews
+        with gxgrd.Grid.open(self.g1f) as g:
+            g.build_overviews((2,))
+            g.gxpg()
+            self.assertEqual(g.overviews.levels, [2])
+            g.overviews.clear()
+
+
+###############################################################################################
+
+if __name__ == '__main__':
+
+    unittest.main()
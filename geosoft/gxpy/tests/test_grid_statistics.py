@@ -0,0 +1,141 @@
+import unittest
+import os
+import numpy as np
+
+import geosoft
+import geosoft.gxpy.system as gsys
+import geosoft.gxpy.grid as gxgrd
+import geosoft.gxpy.grid_statistics as gxgrdst
+
+from base import GXPYTest
+
+
+class Test(GXPYTest):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.setUpGXPYTest()
+        cls.folder, files = gsys.unzip(os.path.join(os.path.dirname(cls._test_case_py), 'testgrids.zip'),
+                                       folder=cls._gx.temp_folder())
+        cls.g1f = os.path.join(cls.folder, 'test_grid_1.grd')
+
+    def test_version(self):
+        self.start()
+        self.assertEqual(gxgrdst.__version__, geosoft.__version__)
+
+    def test_statistics(self):
+        self.start()
+
+        data = np.array([[1., 2., np.nan], [4., 8., 16.]])
+        st = gxgrdst.Statistics().add(data).statistics()
+        self.assertEqual(st['num_data'], 5)
+        self.assertEqual(st['num_dummy'], 1)
+        self.assertEqual(st['min'], 1.)
+        self.assertEqual(st['max'], 16.)
+        self.assertAlmostEqual(st['mean'], 6.2)
+        self.assertAlmostEqual(st['sum'], 31.)
+        self.assertAlmostEqual(st['sum_power_2'], 341.)
+        self.assertAlmostEqual(st['sum_power_3'], 4681.)
+        self.assertAlmostEqual(st['sd'], np.std([1., 2., 4., 8., 16.], ddof=1))
+        self.assertAlmostEqual(st['geometric_mean'], 4.)
+
+        st = gxgrdst.Statistics().add([-1., 1.]).statistics()
+        self.assertEqual(st['geometric_mean'], None)
+
+        st = gxgrdst.Statistics().add([np.nan]).statistics()
+        self.assertEqual(st['num_data'], 0)
+        self.assertEqual(st['mean'], None)
+
+        self.assertRaises(gxgrdst.GridStatisticsException, gxgrdst.Statistics, accuracy=0.)
+
+    def test_merge(self):
+        self.start()
+
+        data = np.random.default_rng(7).normal(100., 20., 10000)
+        whole = gxgrdst.Statistics().add(data)
+        merged = gxgrdst.Statistics()
+        for part in np.array_split(data, 7):
+            merged.merge(gxgrdst.Statistics().add(part))
+        for k, v in whole.statistics().items():
+            self.assertTrue(np.isclose(merged.statistics()[k], v, rtol=1.0e-9), k)
+        self.assertEqual(merged.percentile(50), whole.percentile(50))
+
+        parallel = gxgrdst.tile_statistics(np.array_split(data, 13), threads=4)
+        self.assertAlmostEqual(parallel.statistics()['kurtosis'], whole.statistics()['kurtosis'])
+
+        self.assertRaises(gxgrdst.GridStatisticsException, merged.merge, gxgrdst.Statistics(exact=True))
+
+    def test_percentile(self):
+        self.start()
+
+        data = np.random.default_rng(3).lognormal(0., 2., 20000) - 1.
+        q = (0., 1., 10., 50., 90., 99., 100.)
+        exact = gxgrdst.Statistics(exact=True).add(data[:5000]).merge(gxgrdst.Statistics(exact=True).add(data[5000:]))
+        self.assertTrue(np.allclose(exact.percentile(q), np.percentile(data, q)))
+
+        sketch = gxgrdst.Statistics().add(data)
+        p = np.percentile(data, q, method='nearest')
+        self.assertTrue(np.all(np.abs(sketch.percentile(q) - p) <= np.abs(p) * gxgrdst.SKETCH_ACCURACY * 1.01))
+        self.assertEqual(sketch.percentile(0.), data.min())
+        self.assertEqual(sketch.percentile(100.), data.max())
+        self.assertRaises(gxgrdst.GridStatisticsException, sketch.percentile, 101.)
+
+        restored = gxgrdst.Statistics.from_dict(sketch.to_dict())
+        self.assertTrue(np.array_equal(restored.percentile(q), sketch.percentile(q)))
+        self.assertRaises(gxgrdst.GridStatisticsException, exact.to_dict)
+
+    def test_histogram(self):
+        self.start()
+
+        data = np.random.default_rng(5).uniform(-10., 10., 5000)
+        counts, edges = gxgrdst.Statistics(exact=True).add(data).histogram(20)
+        self.assertTrue(np.array_equal(counts, np.histogram(data, 20)[0]))
+
+        counts, edges = gxgrdst.Statistics().add(data).histogram(20, range=(-10., 10.))
+        self.assertEqual(len(edges), 21)
+        self.assertEqual(counts.sum(), 5000)
+        self.assertTrue(np.all(np.abs(counts - np.histogram(data, 20, range=(-10., 10.))[0]) < 10))
+
+    def test_grid(self):
+        self.start()
+
+        with gxgrd.Grid.open(self.g1f) as g:
+            cache = g.statistics_cache
+            cache.clear()
+            data = g.np(dtype=np.float64)
+            valid = data[~np.isnan(data)]
+
+            st = g.statistics()
+            self.assertAlmostEqual(st['mean'], 997.2176063303659)
+            self.assertEqual(st['num_data'], valid.size)
+            self.assertEqual(st['num_dummy'], 91)
+            self.assertEqual(st['min'], 157.)
+            self.assertEqual(st['max'], 3187.)
+            self.assertTrue(os.path.isfile(cache.file_name))
+            self.assertTrue(g.data_statistics() is g.data_statistics())
+
+            self.assertEqual(g.percentile(50., exact=True), np.percentile(valid, 50.))
+            self.assertAlmostEqual(g.percentile(50.), np.percentile(valid, 50., method='nearest'),
+                                   delta=np.percentile(valid, 50.) * gxgrdst.SKETCH_ACCURACY)
+            counts, edges = g.histogram(16, exact=True)
+            self.assertEqual(counts.sum(), valid.size)
+            self.assertEqual(edges[0], 157.)
+
+        # statistics are read from the cache
+        with gxgrd.Grid.open(self.g1f) as g:
+            self.assertTrue(g.statistics_cache.get('statistics') is not None)
+            self.assertAlmostEqual(g.statistics()['mean'], 997.2176063303659)
+
+        # writable grids are not cached, and statistics follow writes
+        with gxgrd.Grid.copy(self.g1f) as g:
+            self.assertEqual(g.statistics_cache, None)
+            self.assertEqual(g.statistics()['num_dummy'], 91)
+            g.write_rows(np.full((1, g.nx), np.nan), iy0=0)
+            self.assertEqual(g.statistics()['num_dummy'], 91 + g.nx - np.count_nonzero(np.isnan(data[0])))
+
+
+###############################################################################################
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -68,6 +68,43 @@ class Test(GXPYTest):
             self.assertEqual(properties.get('ny'),101)
             self.assertEqual(str(properties.get('coordinate_system')),'WGS 84')
 
+    def test_mosaic_blend(self):
+        self.start()
+
+        with gxgrd.Grid.open(self.g1f) as g:
+            data1 = g.np(dtype=np.float64)
+        with gxgrd.Grid.open(self.g2f) as g:
+            data2 = g.np(dtype=np.float64)
+            ix0 = int(round((g.x0 - 7.0) / g.dx))
+        glist = [self.g1f, self.g2f]
+
+        m = os.path.join(self.folder, 'test_mosaic_last.grd(GRD)')
+        with gxgrdu.grid_mosaic(m, glist, rows=7, threads=3) as grd:
+            grd.delete_files()
+            data = grd.np(dtype=np.float64)
+            self.assertEqual(data.shape, (101, 201))
+            expected = np.full(data.shape, np.nan)
+            expected[:, :data1.shape[1]] = data1
+            block = expected[:, ix0: ix0 + data2.shape[1]]
+            np.copyto(block, data2, where=~np.isnan(data2))
+            self.assertTrue(np.array_equal(data, expected, equal_nan=True))
+
+        m = os.path.join(self.folder, 'test_mosaic_average.grd(GRD)')
+        with gxgrdu.grid_mosaic(m, [self.g1f, self.g1f], blend=gxgrdu.MOSAIC_AVERAGE, rows=10) as grd:
+            grd.delete_files()
+            self.assertTrue(np.allclose(grd.np(dtype=np.float64), data1, equal_nan=True))
+
+        m = os.path.join(self.folder, 'test_mosaic_feather.grd(GRD)')
+        with gxgrdu.grid_mosaic(m, glist, blend=gxgrdu.MOSAIC_FEATHER, feather_width=5) as grd:
+            grd.delete_files()
+            data = grd.np(dtype=np.float64)
+            self.assertTrue(np.array_equal(data[:, :ix0], data1[:, :ix0], equal_nan=True))
+            self.assertTrue(np.array_equal(data[:, data1.shape[1]:], data2[:, data1.shape[1] - ix0:],
+                                           equal_nan=True))
+
+        self.assertRaises(gxgrdu.GridUtilityException, gxgrdu.grid_mosaic, m, glist, blend=99)
+        self.assertRaises(gxgrdu.GridUtilityException, gxgrdu.grid_mosaic, m, [])
+
     def test_bool(self):
         self.start()
 
@@ -183,17 +220,53 @@ class Test(GXPYTest):
                 self.assertTrue(isinstance(xyp, list))
                 self.assertTrue(isinstance(xyp[0], gxgeo.PPoint))
                 self.assertEqual(len(xyp), 45)
+                self.assertEqual(len(gxgrdu.contour_points(gm, v, min_extent=0)), 61)
 
                 self.assertRaises(gxgrdu.GridUtilityException, gxgrdu.contour_points, gm, 0)
+                self.assertRaises(gxgrdu.GridUtilityException, gxgrdu.contour_points, gm, v, max_segments=10)
 
                 xyp = gxgrdu.contour_points(gm, 500, return_as=gxgrdu.RETURN_PPOINT)
                 self.assertTrue(isinstance(xyp, gxgeo.PPoint))
-                self.assertEqual(len(xyp), 343)
+                self.assertEqual(len(xyp), 344)
+
+                xyp = gxgrdu.contour_points(gm, 500, resolution=0, return_as=gxgrdu.RETURN_PPOINT)
+                self.assertTrue(isinstance(xyp, gxgeo.PPoint))
+                self.assertEqual(len(xyp), 469)
 
                 xyp = gxgrdu.contour_points(gm, 250, return_as=gxgrdu.RETURN_GDB)
                 self.assertTrue(isinstance(xyp, gxgdb.Geosoft_gdb))
                 self.assertEqual(len(xyp.list_lines()), 9)
 
+                xyp = gxgrdu.contour_points(gm, (250, 500), resolution=0)
+                self.assertEqual(len(xyp), 23)
+
+    def test_contours(self):
+        self.start()
+
+        with gxgrd.Grid.open(self.g1f) as g:
+            c = gxgrdu.contours(g, (250, 500, 5000), tile_size=16)
+            self.assertEqual(sorted(c), [250., 500., 5000.])
+            self.assertEqual(len(c[250.]), 15)
+            self.assertEqual(len(c[500.]), 22)
+            self.assertEqual(sum(len(pp) for pp in c[500.]), 502)
+            self.assertEqual(len(c[5000.]), 0)
+
+            # tiles do not change the result
+            c1 = gxgrdu.contours(g, 500)
+            self.assertEqual(sum(len(pp) for pp in c1[500.]), 502)
+
+            pp = c[500.][0]
+            self.assertEqual(pp[0].z, 0.0)
+            for p in pp:
+                self.assertAlmostEqual(g.get_value(p.x, p.y), 500., 3)
+
+            with gxgrd.Grid.copy(g) as gr:
+                gr.rot = 30.0
+                c = gxgrdu.contours(gr, 500)[500.]
+                self.assertEqual(len(c), 22)
+                for p in c[0]:
+                    self.assertAlmostEqual(gr.get_value(p.x, p.y), 500., 3)
+
     def test_tilt_depth(self):
         self.start()
 
@@ -266,6 +339,35 @@ class Test(GXPYTest):
             x = gxgrdu.expression((grd, grd), 'g1-g2')
             self.assertEqual(x.statistics()['mean'], 0.)
 
+    def test_expression_np(self):
+        self.start()
+
+        with gxgrd.Grid.open(self.mag) as grd:
+            data = grd.np(dtype=np.float64)
+
+            x = gxgrdu.expression_np({'first': grd, 'second': grd}, 'first-second', rows=7, threads=3)
+            self.assertEqual(x.statistics()['mean'], 0.)
+            self.assertEqual((x.nx, x.ny), (grd.nx, grd.ny))
+
+            x = gxgrdu.expression_np((grd, self.mag), 'd = g1 * 2; where(g2 > 0, d, nan)', rows=10)
+            expected = np.where(data > 0, data * 2, np.nan)
+            self.assertTrue(np.allclose(x.np(), expected, equal_nan=True))
+
+            x = gxgrdu.expression_np((grd,), 'sqrt(abs(g1))', dtype=np.float32)
+            self.assertEqual(x.dtype, np.float32)
+            self.assertTrue(np.allclose(x.np(), np.sqrt(np.abs(data)), equal_nan=True))
+
+            self.assertRaises(gxgrdu.GridUtilityException, gxgrdu.expression_np, (grd,), 'g1 +')
+            self.assertRaises(gxgrdu.GridUtilityException, gxgrdu.expression_np, (grd,), 'a = g1')
+
+            # evaluation errors in parallel strips name the expression, and the result grid is removed
+            result_file = os.path.join(self.folder, 'test_expression_np.grd(GRD)')
+            with self.assertRaises(gxgrdu.GridUtilityException) as context:
+                gxgrdu.expression_np((grd,), 'g1 + unknown', result_file_name=result_file, overwrite=True,
+                                     rows=7, threads=3)
+            self.assertTrue('g1 + unknown' in str(context.exception))
+            self.assertFalse(os.path.isfile(os.path.join(self.folder, 'test_expression_np.grd')))
+
 
 ###############################################################################################
 
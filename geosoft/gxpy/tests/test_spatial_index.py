@@ -0,0 +1,157 @@
+import unittest
+import os
+import numpy as np
+
+import geosoft
+import geosoft.gxpy.system as gsys
+import geosoft.gxpy.gdb as gxdb
+import geosoft.gxpy.geometry as gxgeo
+import geosoft.gxpy.spatial_index as gxsi
+
+from base import GXPYTest
+
+
+def brute_distances(points, xyz):
+    return np.sqrt(np.sum((points - xyz) ** 2, axis=1))
+
+
+class Test(GXPYTest):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.setUpGXPYTest()
+        cls.folder, files = gsys.unzip(os.path.join(os.path.dirname(cls._test_case_py), 'test_database.zip'),
+                                       folder=cls._gx.temp_folder())
+        cls.gdb_name = os.path.join(cls.folder, 'test_database.gdb')
+
+    def test_version(self):
+        self.start()
+        self.assertEqual(gxsi.__version__, geosoft.__version__)
+
+    def test_points(self):
+        self.start()
+
+        np.random.seed(1)
+        points = np.random.uniform(0., 100., (5000, 3))
+        points[10] = np.nan
+        index = gxsi.SpatialIndex(points, leaf_size=8)
+        self.assertEqual(len(index), 4999)
+        self.assertEqual(index.dimension, 3)
+
+        queries = np.random.uniform(-10., 110., (50, 3))
+        distances, nearest = index.knn(queries, 5)
+        self.assertEqual(nearest.shape, (50, 5))
+        for q, d, i in zip(queries, distances, nearest):
+            bd = brute_distances(points, q)
+            bd[10] = np.inf
+            self.assertTrue(np.allclose(np.sort(bd)[:5], d))
+            self.assertTrue(np.allclose(bd[i], d))
+
+        d, i = index.knn(queries[0], 1)
+        self.assertEqual(i[0], nearest[0, 0])
+
+        within = index.radius(queries, 12.)
+        self.assertEqual(len(within), 50)
+        for q, w in zip(queries, within):
+            bd = brute_distances(points, q)
+            self.assertEqual(sorted(w), list(np.flatnonzero(bd <= 12.)))
+            self.assertTrue(np.all(np.diff(bd[w]) >= 0.))
+
+        box = index.box((10., 20., 30., 60., 70., 80.))
+        with np.errstate(invalid='ignore'):
+            expected = np.flatnonzero(np.all((points >= (10., 20., 30.)) & (points <= (60., 70., 80.)), axis=1))
+        self.assertEqual(list(box), list(expected))
+        box = index.box((10., 20., 60., 70.))
+        with np.errstate(invalid='ignore'):
+            expected = np.flatnonzero(np.all((points[:, :2] >= (10., 20.)) & (points[:, :2] <= (60., 70.)), axis=1))
+        self.assertEqual(list(box), list(expected))
+
+        points[100] = points[200] + 0.001
+        index = gxsi.SpatialIndex(points, dimension=2)
+        self.assertEqual(index.dimension, 2)
+        pairs = index.pairs(0.01)
+        self.assertTrue([100, 200] in pairs.tolist())
+        self.assertTrue(np.all(pairs[:, 0] < pairs[:, 1]))
+
+        index = gxsi.SpatialIndex(points[:3])
+        d, i = index.knn((50., 50., 50.), 5)
+        self.assertEqual(list(i[3:]), [-1, -1])
+        self.assertTrue(np.isinf(d[4]))
+
+        self.assertRaises(gxsi.SpatialIndexException, gxsi.SpatialIndex, points[:, 0])
+
+    def test_ppoint(self):
+        self.start()
+
+        pp = gxgeo.PPoint(((500000, 6000000), (500100, 6000000), (500200, 6000050)),
+                          coordinate_system='NAD83 / UTM zone 15N')
+        index = gxsi.SpatialIndex(pp)
+        self.assertEqual(index.coordinate_system, 'NAD83 / UTM zone 15N')
+        d, i = index.knn(gxgeo.Point((500190, 6000040)), 2)
+        self.assertEqual(list(i), [2, 1])
+
+        # queries are reprojected to the index coordinate system
+        pp27 = gxgeo.PPoint(pp, coordinate_system='NAD27 / UTM zone 15N')
+        d, i = index.knn(pp27, 1)
+        self.assertEqual(list(i[:, 0]), [0, 1, 2])
+        self.assertTrue(np.all(d < 0.001))
+
+        ext = index.extent
+        self.assertEqual(ext.extent_xy, (500000., 6000000., 500200., 6000050.))
+
+    def test_mesh(self):
+        self.start()
+
+        v = np.array(range(27), dtype=np.float64).reshape(-1, 3)
+        f = np.array(range(len(v))).reshape(-1, 3)
+        m = gxgeo.Mesh((f, v))
+
+        index = gxsi.SpatialIndex.from_mesh(m)
+        self.assertEqual(len(index), 9)
+        d, i = index.knn((9., 10., 11.), 1)
+        self.assertEqual(i[0], 3)
+        self.assertEqual(d[0], 0.)
+
+        index = gxsi.SpatialIndex.from_mesh(m, faces=True)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(list(index.box((5., 6., 7., 10., 11., 12.))), [0, 1])
+        d, i = index.knn((12., 13., 14.), 1)
+        self.assertEqual(i[0], 1)
+        self.assertEqual(d[0], 0.)
+
+    def test_gdb(self):
+        self.start()
+
+        with gxdb.Geosoft_gdb.open(self.gdb_name) as gdb:
+            index_file = gxsi.default_index_file(gdb.file_name)
+            if os.path.isfile(index_file):
+                os.remove(index_file)
+
+            index = gxsi.SpatialIndex.from_gdb(gdb)
+            self.assertFalse(os.path.isfile(index_file))
+            index = gxsi.SpatialIndex.from_gdb(gdb, persist=True)
+            self.assertTrue(os.path.isfile(index_file))
+            self.assertEqual(index.dimension, 2)
+            self.assertTrue('D578625' in index.lines)
+
+            channels = gdb.xyz_channels[:2]
+            xy = gdb.read_line('D578625', channels=channels)[0]
+            d, i = index.knn(xy[100], 1)
+            self.assertEqual(d[0], 0.)
+            line, row = index.line_rows(i)
+            self.assertTrue(np.array_equal(gdb.read_line(line[0], channels=channels)[0][row[0]], xy[100]))
+
+            # reused while the database is unchanged
+            loaded = gxsi.SpatialIndex.from_gdb(gdb, persist=True)
+            self.assertEqual(loaded.lines, index.lines)
+            self.assertTrue(np.array_equal(loaded.knn(xy[:20], 3)[1], index.knn(xy[:20], 3)[1]))
+            self.assertTrue(gxsi.SpatialIndex.load(index_file, source=gdb.file_name) is not None)
+
+            os.remove(index_file)
+
+
+###############################################################################################
+
+if __name__ == '__main__':
+
+    unittest.main()
@@ -97,6 +97,35 @@ class Test(GXPYTest):
             self.assertTrue(False)
         except: pass
 
+    def test_dummy_policy(self):
+        self.start()
+
+        npd = np.array([[1., 2.], [np.nan, 3.], [4., gxapi.rDUMMY], [5., 6.]])
+        self.assertEqual(gxu.dummy_mask(npd).tolist(), [False, True, True, False])
+        self.assertEqual(gxu.dummy_mask(npd, axis=0).tolist(), [True, True])
+        self.assertEqual(gxu.dummy_mask(npd, axis=None).shape, (4, 2))
+
+        data, dropped = gxu.apply_dummy_policy(npd, [gxu.DUMMY_DROP, gxu.DUMMY_KEEP])
+        self.assertEqual(data.shape, (3, 2))
+        self.assertEqual(dropped.tolist(), [False, True, False, False])
+        data, dropped = gxu.apply_dummy_policy(npd, [gxu.DUMMY_DROP, gxu.DUMMY_KEEP], compact=False)
+        self.assertEqual(data.shape, (4, 2))
+
+        data, dropped = gxu.apply_dummy_policy(npd, [gxu.DUMMY_INTERPOLATE, gxu.DUMMY_FILL], fill_value=[0., 9.])
+        self.assertEqual(data.tolist(), [[1., 2.], [2.5, 3.], [4., 9.], [5., 6.]])
+        self.assertFalse(dropped.any())
+        self.assertTrue(np.isnan(npd[1, 0]))
+
+        data, dropped = gxu.apply_dummy_policy(npd, gxu.DUMMY_NAN)
+        self.assertTrue(np.isnan(data[2, 1]))
+
+        npi = np.array([1, gxapi.iDUMMY, 5, gxapi.iDUMMY], dtype=np.int32)
+        data, dropped = gxu.apply_dummy_policy(npi, gxu.DUMMY_INTERPOLATE)
+        self.assertEqual(data.tolist(), [1, 3, 5, 5])
+        self.assertRaises(gxu.UtilityException, gxu.apply_dummy_policy, npi, gxu.DUMMY_NAN)
+        self.assertRaises(gxu.UtilityException, gxu.apply_dummy_policy, npi, gxu.DUMMY_FILL)
+        self.assertRaises(gxu.UtilityException, gxu.apply_dummy_policy, npd, [gxu.DUMMY_NAN])
+
     def test_dictlist(self):
         self.start()
 
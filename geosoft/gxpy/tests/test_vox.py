@@ -8,6 +8,7 @@ import geosoft.gxpy.system as gsys
 import geosoft.gxpy.coordinate_system as gxcs
 import geosoft.gxpy.vox as gxvox
 import geosoft.gxpy.gdb as gxgdb
+import geosoft.gxpy.geometry as gxgm
 
 from base import GXPYTest
 
@@ -115,6 +116,42 @@ class Test(GXPYTest):
             self.assertEqual(vox.value_at_location((0, 0, 0)), None)
             self.assertEqual(vox.value_at_location((-1.0e25, 0, 1e25)), None)
 
+    def test_values(self):
+        self.start()
+
+        with gxvox.Vox.open(self.vox_file) as vox:
+            xyz = np.array([vox.xyz(50, 65, 18),
+                            (441076, 6129426, 370),
+                            (441100, 6129400, 225.895),
+                            (0, 0, 0)])
+            v = vox.values_at_locations(xyz)
+            self.assertAlmostEqual(v[0], 0.00019816514181249432)
+            self.assertAlmostEqual(v[1], vox.value_at_location(xyz[1]))
+            self.assertTrue(np.isnan(v[3]))
+            v = vox.values_at_locations(xyz, interpolate=gxvox.INTERP_NEAREST)
+            self.assertAlmostEqual(v[1], vox.value_at_location(xyz[1], interpolate=gxvox.INTERP_NEAREST))
+            self.assertRaises(gxvox.VoxException, vox.values_at_locations, xyz, interpolate=gxvox.INTERP_SMOOTH)
+
+            # every cell centre
+            npv = vox.np()
+            centres = np.array([vox.xyz(ix, iy, iz)
+                                for iz in range(vox.nz) for iy in range(vox.ny) for ix in range(vox.nx)])
+            v = vox.values_at_locations(gxgm.PPoint(centres, coordinate_system=vox.coordinate_system),
+                                        interpolate=gxvox.INTERP_NEAREST)
+            self.assertTrue(np.array_equal(v, npv.flatten(), equal_nan=True))
+
+            vox.is_depth = True
+            xyz[:, 2] *= -1.
+            vd = vox.values_at_locations(xyz)
+            self.assertAlmostEqual(vd[0], 0.00019816514181249432)
+            self.assertAlmostEqual(vd[1], vox.value_at_location(xyz[1]))
+
+            # reprojected locations
+            ll = gxgm.PPoint(xyz[:2], coordinate_system=vox.coordinate_system)
+            ll = gxgm.PPoint(ll, coordinate_system='NAD83')
+            v = vox.values_at_locations(ll)
+            self.assertAlmostEqual(v[0], vd[0], 6)
+
     def test_np(self):
         self.start()
 
@@ -149,6 +186,36 @@ class Test(GXPYTest):
             sum = npv[np.isfinite(npv)].sum()
             self.assertAlmostEqual(sum, 0.01212498417)
 
+    def test_array(self):
+        self.start()
+
+        with gxvox.Vox.open(self.vox_file) as vox:
+            npv = vox.np()
+            array = vox.array
+            self.assertTrue(array is vox.array)
+            self.assertEqual(array.shape, (vox.nz, vox.ny, vox.nx))
+            self.assertEqual(array.dtype, npv.dtype)
+            self.assertEqual(len(array), vox.nz)
+
+            for key in (np.s_[18], np.s_[:, 65], np.s_[:, :, 50], np.s_[:, 65, 50], np.s_[18, 65, 50],
+                        np.s_[2:20:3, 10:40, [3, 7, 50]], np.s_[..., 5], np.s_[-1]):
+                self.assertTrue(np.array_equal(array[key], npv[key], equal_nan=True), key)
+            self.assertEqual(array[18, 65, 50], vox[50, 65, 18][3])
+            self.assertRaises(IndexError, array.__getitem__, (vox.nz, 0, 0))
+            self.assertRaises(IndexError, array.__getitem__, (0, 0, 0, 0))
+
+            vox.is_depth = True
+            self.assertTrue(np.array_equal(vox.array[:, 65], npv[::-1, 65], equal_nan=True))
+            self.assertTrue(np.array_equal(vox.np(), npv[::-1], equal_nan=True))
+            self.assertTrue(np.array_equal(vox.np(subset=((None, None, -1), (None, None, 1))), npv[:1],
+                                           equal_nan=True))
+
+        with gxvox.Vox.open(self.vectorvox_file) as vox:
+            npv = vox.np()
+            self.assertEqual(vox.array.shape, (vox.nz, vox.ny, vox.nx, 3))
+            self.assertTrue(np.array_equal(vox.array[:, 3, 4], npv[:, 3, 4], equal_nan=True))
+            self.assertTrue(np.array_equal(vox.array[2, :, 1:3], npv[2, :, 1:3], equal_nan=True))
+
     def test_metadata(self):
         self.start()
 
@@ -386,6 +386,43 @@ class Test(GXPYTest):
         vv3 = gxvv.GXvv(vv2, dim=1)
         self.assertTrue(vv == vv3)
 
+    def test_np_cache(self):
+        self.start()
+
+        with gxvv.GXvv([1., 2., np.nan, 4.], fid=(10, 2)) as vv:
+            npd = vv.np
+            self.assertTrue(npd is vv.np)
+            self.assertFalse(npd.flags.writeable)
+            self.assertEqual(vv[1], (2.0, 12))
+            self.assertEqual(vv.min_max(), (1.0, 4.0))
+            self.assertEqual([v[1] for v in vv], [10, 12, 14, 16])
+
+            vv.set_data([5., 6.])
+            self.assertFalse(npd is vv.np)
+            self.assertEqual(list(vv.np), [5., 6.])
+
+            vv.fid = (0, 1)
+            self.assertEqual(vv[1], (6.0, 1))
+
+            vv.fill(3.)
+            self.assertEqual(vv.min_max(), (3.0, 3.0))
+
+            vv.length = 4
+            self.assertEqual(len(vv.np), 4)
+
+            vv.gxvv.fill_double(7.)
+            self.assertEqual(vv[0][0], 7.)
+
+            self.assertEqual(vv.get_data()[0][0], 7.)
+            self.assertTrue(vv.get_data()[0].flags.writeable)
+
+        with gxvv.GXvv([gxapi.iDUMMY, 5, -2], dtype=np.int32) as vv:
+            self.assertEqual(vv.min_max(), (-2.0, 5.0))
+            self.assertEqual(vv.dummy_mask().tolist(), [True, False, False])
+            vv.refid((0, 0.5))
+            self.assertEqual(vv.length, 5)
+            self.assertEqual(vv.np.shape, (5,))
+
     def test_empty(self):
         self.start()
 
@@ -1,6 +1,13 @@
 """
 Utility functions to support Geosoft Python scripts and modules.
 
+:Constants:
+    :DUMMY_KEEP:        0 leave dummies in place
+    :DUMMY_DROP:        1 drop rows that have a dummy
+    :DUMMY_NAN:         2 replace dummies with numpy.nan (float data only)
+    :DUMMY_FILL:        3 replace dummies with a fill value
+    :DUMMY_INTERPOLATE: 4 linearly interpolate across dummies
+
 .. note::
 
     Regression tests provide usage examples:
@@ -36,6 +43,12 @@ def _t(s):
     return geosoft.gxpy.system.translate(s)
 
 
+DUMMY_KEEP = 0
+DUMMY_DROP = 1
+DUMMY_NAN = 2
+DUMMY_FILL = 3
+DUMMY_INTERPOLATE = 4
+
 # cached lookup tables
 _dummy_map = {}
 _gx2np_type = {}
@@ -734,23 +747,118 @@ def dummyMask(npd):
     return dummy_mask(npd)
 
 
-def dummy_mask(npd):
+def dummy_mask(npd, axis=1):
     """
-    Return a 1-D dummy mask that is True for all rows  in a 2D numpy array that
-    have a Geosoft dummy value.
+    Return a dummy mask for a numpy array.  For float data both Geosoft dummies and numpy.nan are dummies.
 
-    :param npd: numpy data array
-    :returns:   numpy 1D array, True for any row that had a dummy in any data field
+    :param npd:     numpy data array
+    :param axis:    for a 2D array, 1 (default) to mask rows that have a dummy in any column, 0 to mask
+                    columns that have a dummy in any row, or None for an element mask the same shape as the data.
+                    1D arrays always return an element mask.
+    :returns:       numpy boolean array, True for dummies
 
     .. versionadded:: 9.2
+
+    .. versionchanged:: 2024.1 vectorized, numpy.nan is a dummy for float data, added `axis`
     """
 
     dummy = gx_dummy(npd.dtype)
-    if npd.ndim == 1:
-        return npd == dummy
-    if len(npd.shape) != 2:
+    if npd.dtype == np.float32 or npd.dtype == np.float64:
+        mask = np.isnan(npd)
+        mask |= (npd == dummy)
+    else:
+        mask = (npd == dummy)
+    if npd.ndim == 1 or axis is None:
+        return mask
+    if npd.ndim != 2:
         raise UtilityException(_t('Must be a 2D array'))
-    return np.apply_along_axis(lambda a: dummy in a, 1, npd)
+    return mask.any(axis=axis)
+
+
+def _interpolate_dummies(column, mask):
+    """linear interpolation of a 1D column across dummies, ends are extended from the nearest valid value"""
+    valid = ~mask
+    if not valid.any():
+        return
+    index = np.arange(column.shape[0])
+    values = np.interp(index[mask], index[valid], column[valid].astype(np.float64))
+    if np.issubdtype(column.dtype, np.integer):
+        values = np.rint(values)
+    column[mask] = values.astype(column.dtype)
+
+
+def apply_dummy_policy(npd, policy=DUMMY_NAN, fill_value=None, compact=True):
+    """
+    Apply dummy handling policies to the columns of a numpy array.
+
+    :param npd:         1D or 2D numpy data array. The array is not changed.
+    :param policy:      one of the DUMMY constants applied to all columns, or a sequence with one DUMMY
+                        constant for each column:
+
+        ================== ==================================================================
+        DUMMY_KEEP         leave dummies in place
+        DUMMY_DROP         drop rows that have a dummy in this column
+        DUMMY_NAN          replace dummies with numpy.nan, float data only
+        DUMMY_FILL         replace dummies with `fill_value`
+        DUMMY_INTERPOLATE  linear interpolation across dummies, ends extend the nearest value
+        ================== ==================================================================
+
+    :param fill_value:  value for DUMMY_FILL columns, a single value or a sequence with a value for each column
+    :param compact:     `True` (default) to remove DUMMY_DROP rows from the returned data, `False` to only
+                        report them in the returned mask.
+    :returns:           (data, mask), where mask is a 1D boolean array that is True for rows with a dummy in
+                        a DUMMY_DROP column.
+
+    .. versionadded:: 2024.1
+    """
+
+    if npd.ndim not in (1, 2):
+        raise UtilityException(_t('Must be a 1D or 2D array'))
+
+    data = npd.reshape((npd.shape[0], -1))
+    ncols = data.shape[1]
+
+    if isinstance(policy, int):
+        policy = [policy] * ncols
+    elif len(policy) != ncols:
+        raise UtilityException(_t('{} dummy policies for {} columns').format(len(policy), ncols))
+
+    if fill_value is None or np.ndim(fill_value) == 0:
+        fill_value = [fill_value] * ncols
+    elif len(fill_value) != ncols:
+        raise UtilityException(_t('{} fill values for {} columns').format(len(fill_value), ncols))
+
+    is_float = data.dtype == np.float32 or data.dtype == np.float64
+    mask = dummy_mask(data, axis=None)
+    drop = np.zeros(data.shape[0], dtype=bool)
+
+    if any(p not in (DUMMY_KEEP, DUMMY_DROP) for p in policy):
+        data = data.copy()
+
+    for i, p in enumerate(policy):
+        if p == DUMMY_KEEP:
+            continue
+        cmask = mask[:, i]
+        if p == DUMMY_DROP:
+            drop |= cmask
+        elif p == DUMMY_NAN:
+            if not is_float:
+                raise UtilityException(_t('DUMMY_NAN requires float data, not {}').format(data.dtype))
+            data[cmask, i] = np.nan
+        elif p == DUMMY_FILL:
+            if fill_value[i] is None:
+                raise UtilityException(_t('DUMMY_FILL requires a fill_value'))
+            data[cmask, i] = fill_value[i]
+        elif p == DUMMY_INTERPOLATE:
+            _interpolate_dummies(data[:, i], cmask)
+        else:
+            raise UtilityException(_t('Unrecognized dummy policy {}').format(p))
+
+    if compact and drop.any():
+        data = data[~drop]
+    if npd.ndim == 1:
+        data = data.reshape(-1)
+    return data, drop
 
 
 def dummy_to_nan(data):
@@ -3,9 +3,10 @@ Geosoft voxel (voxset) handling.
 
 :Classes:
 
-    ============ ==========================================================================
-    :class:`Vox` Geosoft voxel (voxset), subclass of `geosoft.gxpy.spatialdata.SpatialData`
-    ============ ==========================================================================
+    ================= ==========================================================================
+    :class:`Vox`      Geosoft voxel (voxset), subclass of `geosoft.gxpy.spatialdata.SpatialData`
+    :class:`VoxArray` lazy numpy-like view of vox data
+    ================= ==========================================================================
 
 :Constants:
     :Z_ELEVATION:    0, z values are elevation
@@ -28,6 +29,7 @@ Geosoft voxel (voxset) handling.
 """
 import os
 import numpy as np
+from collections import OrderedDict
 from collections.abc import Sequence
 
 import geosoft
@@ -137,6 +139,204 @@ MODE_NEW = gxspd.MODE_NEW
 Z_ELEVATION = 0
 Z_DEPTH = 1
 
+ARRAY_CACHE_BYTES = 128 * 1024 * 1024  #: default memory limit of the `VoxArray` plane cache
+
+
+def _axis_indexes(key, n):
+    """index array and scalar flag of an axis index"""
+    if isinstance(key, (int, np.integer)):
+        if key < -n or key >= n:
+            raise IndexError(_t('Index {} out of range for axis of length {}').format(key, n))
+        return np.array([key % n]), True
+    return np.arange(n)[key], False
+
+
+class VoxArray:
+    """
+    Numpy-like read-only view of the data in a `Vox`, shaped (nz, ny, nx), or (nz, ny, nx, 3) for a vector vox.
+    The z order follows the `Vox.is_depth` setting, z index 0 is the top of the vox for depth and the bottom of the
+    vox for elevation.
+
+    :param vox:         `Vox` instance
+    :param dtype:       data type, default is the vox dtype
+    :param cache_bytes: memory limit for the cache of recently read planes, default `ARRAY_CACHE_BYTES`.
+
+    Nothing is read until the view is indexed.  Indexes may be integers, slices, integer or boolean arrays, and
+    an `Ellipsis`, and an integer index removes an axis, as for numpy arrays.  Data is read in the fewest
+    engine calls of whole planes, rows, columns or vertical traces, and whole planes are cached.  Null values
+    are `numpy.nan` for float data.
+
+    Example of sections and depth slices:
+
+    .. code::
+
+        import geosoft.gxpy.vox as gxvox
+
+        with gxvox.Vox.open('inversion_model', depth=True) as vox:
+            depth_slice = vox.array[10]
+            ew_section = vox.array[:, 120, :]
+            trace = vox.array[:, 120, 45]
+
+    .. versionadded:: 2024.1
+    """
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__, self.__dict__)
+
+    def __str__(self):
+        return 'VoxArray({}, shape={}, dtype={})'.format(self._vox.name, self.shape, self._dtype)
+
+    def __init__(self, vox, dtype=None, cache_bytes=ARRAY_CACHE_BYTES):
+
+        self._vox = vox
+        self._dtype = np.dtype(vox.dtype if dtype is None else dtype)
+        self._dim = 3 if vox.is_vectorvox else 1
+        self._planes = OrderedDict()
+        plane_bytes = vox.nx * vox.ny * self._dim * self._dtype.itemsize
+        self._cache_planes = int(cache_bytes // max(plane_bytes, 1))
+
+    @property
+    def shape(self):
+        """array shape"""
+        if self._dim == 3:
+            return self._vox.nz, self._vox.ny, self._vox.nx, 3
+        return self._vox.nz, self._vox.ny, self._vox.nx
+
+    @property
+    def dtype(self):
+        """array numpy dtype"""
+        return self._dtype
+
+    @property
+    def ndim(self):
+        """number of array dimensions"""
+        return len(self.shape)
+
+    @property
+    def size(self):
+        """number of elements in the array"""
+        return int(np.prod(self.shape))
+
+    def __len__(self):
+        return self._vox.nz
+
+    def clear(self):
+        """
+        Clear the plane cache, which must be done if vox data is changed through the `Vox.gxpg` pager.
+
+        .. versionadded:: 2024.1
+        """
+        self._planes = OrderedDict()
+
+    def _vv(self, n):
+        vv = gxvv.GXvv(dtype=self._dtype, dim=self._dim)
+        vv.length = n
+        return vv
+
+    def _cache(self, pz, plane):
+        if self._cache_planes > 0:
+            self._planes[pz] = plane
+            while len(self._planes) > self._cache_planes:
+                self._planes.popitem(last=False)
+
+    def plane(self, pz):
+        """
+        Data of a plane of the vox pager.
+
+        :param pz:  plane index in the vox pager, which always counts from the bottom of the vox.
+        :returns:   numpy array shaped (ny, nx), or (ny, nx, 3) for a vector vox.
+
+        .. versionadded:: 2024.1
+        """
+        plane = self._planes.get(pz)
+        if plane is not None:
+            self._planes.move_to_end(pz)
+            return plane
+        nx, ny = self._vox.nx, self._vox.ny
+        plane = np.empty((ny, nx, 3) if self._dim == 3 else (ny, nx), dtype=self._dtype)
+        vv = self._vv(nx)
+        gxpg = self._vox.gxpg
+        for iy in range(ny):
+            gxpg.read_row_3d(pz, iy, 0, nx, vv.gxvv)
+            plane[iy] = vv.np
+        self._cache(pz, plane)
+        return plane
+
+    def __getitem__(self, key):
+
+        if not isinstance(key, tuple):
+            key = (key,)
+        if any(k is Ellipsis for k in key):
+            i = [k is Ellipsis for k in key].index(True)
+            key = key[:i] + (slice(None),) * (self.ndim - len(key) + 1) + key[i + 1:]
+        if len(key) > self.ndim:
+            raise IndexError(_t('Too many indices for VoxArray'))
+        key = key + (slice(None),) * (self.ndim - len(key))
+
+        vox = self._vox
+        iz, sz = _axis_indexes(key[0], vox.nz)
+        iy, sy = _axis_indexes(key[1], vox.ny)
+        ix, sx = _axis_indexes(key[2], vox.nx)
+        pz = (vox.nz - 1 - iz) if vox.is_depth else iz
+        vshape = (3,) if self._dim == 3 else ()
+        result = np.empty((len(iz), len(iy), len(ix)) + vshape, dtype=self._dtype)
+
+        if result.size:
+            gxpg = vox.gxpg
+            uz = np.unique(pz)
+            uy = np.unique(iy)
+            ux = np.unique(ix)
+            uncached = [int(p) for p in uz if int(p) not in self._planes]
+
+            # engine calls to read the uncached data by planes, rows, columns or traces, prefer
+            # planes, which are cached, unless another method needs far fewer calls
+            costs = (len(uncached) * vox.ny,
+                     len(uncached) * len(uy),
+                     len(uncached) * len(ux),
+                     (len(ux) * len(uy)) if uncached else 0)
+            method = 0 if costs[0] <= 2 * min(costs) else costs.index(min(costs))
+
+            jy = np.searchsorted(uy, iy)
+            jx = np.searchsorted(ux, ix)
+
+            if method == 3 and uncached:
+                p0 = int(uz[0])
+                vv = self._vv(int(uz[-1]) - p0 + 1)
+                block = np.empty((len(iz), len(uy), len(ux)) + vshape, dtype=self._dtype)
+                for i, x in enumerate(ux):
+                    for j, y in enumerate(uy):
+                        gxpg.read_trace_3d(int(x), int(y), p0, vv.length, vv.gxvv)
+                        block[:, j, i] = vv.np[pz - p0]
+                result[...] = block[:, jy][:, :, jx]
+
+            else:
+                planes = {}
+                for p in uz:
+                    p = int(p)
+                    if p in self._planes or method == 0:
+                        planes[p] = self.plane(p)[np.ix_(iy, ix)]
+                    elif method == 1:
+                        x0 = int(ux[0])
+                        vv = self._vv(int(ux[-1]) - x0 + 1)
+                        block = np.empty((len(uy), len(ux)) + vshape, dtype=self._dtype)
+                        for j, y in enumerate(uy):
+                            gxpg.read_row_3d(p, int(y), x0, vv.length, vv.gxvv)
+                            block[j] = vv.np[ux - x0]
+                        planes[p] = block[np.ix_(jy, jx)]
+                    else:
+                        y0 = int(uy[0])
+                        vv = self._vv(int(uy[-1]) - y0 + 1)
+                        block = np.empty((len(uy), len(ux)) + vshape, dtype=self._dtype)
+                        for i, x in enumerate(ux):
+                            gxpg.read_col_3d(p, int(x), y0, vv.length, vv.gxvv)
+                            block[:, i] = vv.np[uy - y0]
+                        planes[p] = block[np.ix_(jy, jx)]
+                for k, p in enumerate(pz):
+                    result[k] = planes[int(p)]
+
+        return result[tuple(0 if s else slice(None) for s in (sz, sy, sx))]
+
+
 
 class Vox(gxspd.SpatialData, Sequence):
     """
@@ -177,7 +377,19 @@ class Vox(gxspd.SpatialData, Sequence):
                         if v is not None:
                             print(x, y, z, v)
 
+    Use `array` for numpy access to slices of the vox data:
+
+    .. code::
+
+        import geosoft.gxpy.vox as gxvox
+
+        with gxvox.Vox.open('some_voxel') as vox:
+            depth_slice = vox.array[5]
+            ns_section = vox.array[:, :, 20]
+
     .. versionadded:: 9.3.1
+
+    .. versionchanged:: 2024.1 cell values are read through the `array` plane cache
     """
 
     def _close(self, pop=True):
@@ -192,7 +404,7 @@ class Vox(gxspd.SpatialData, Sequence):
                 self._locations = None
                 self._cells = None
                 self._uniform_cell_size = None
-                self._buffer_np = None
+                self._array = None
 
                 super(Vox, self)._close()
 
@@ -212,7 +424,7 @@ class Vox(gxspd.SpatialData, Sequence):
         self._locations = None
         self._cells = None
         self._pg = None
-        self._buffered_plane = self._buffered_row = None
+        self._array = None
         self._is_depth = False
 
         ityp = gxapi.int_ref()
@@ -263,17 +475,7 @@ class Vox(gxspd.SpatialData, Sequence):
         if self.is_depth:
             iz = self.nz - iz - 1
 
-        if (self._buffered_plane != iz) or (self._buffered_row != iy):
-            self._buffered_plane = iz
-            self._buffered_row = iy
-            if self.is_vectorvox:
-                vv = gxvv.GXvv(dtype=self._dtype, dim=3)
-            else:
-                vv = gxvv.GXvv(dtype=self._dtype)
-            self.gxpg.read_row_3d(iz, iy, 0, self._dim[0], vv.gxvv)
-            self._buffer_np = vv.np
-
-        v = self._buffer_np[ix]
+        v = self.array.plane(iz)[iy, ix]
         if self._return_int:
             v = int(v)
             if v == gxapi.iDUMMY:
@@ -613,6 +815,18 @@ class Vox(gxspd.SpatialData, Sequence):
             self._pg = self.gxvox.create_pg()
         return self._pg
 
+    @property
+    def array(self):
+        """
+        `VoxArray` lazy numpy-like view of the vox data, shaped (nz, ny, nx), with a cache of recently read
+        planes.  The z order follows the `is_depth` setting.
+
+        .. versionadded:: 2024.1
+        """
+        if self._array is None:
+            self._array = VoxArray(self)
+        return self._array
+
     @property
     def gxvoxe(self):
         """Return a `gxapi.GXVOXE` instance"""
@@ -674,6 +888,8 @@ class Vox(gxspd.SpatialData, Sequence):
 
         :returns:           vox value at that location
 
+        .. seealso:: `values_at_locations` to sample many locations.
+
         .. versionadded:: 9.3.1
         """
         x, y, z = xyz
@@ -684,6 +900,126 @@ class Vox(gxspd.SpatialData, Sequence):
             return None
         return v
 
+    def values_at_locations(self, xyz, interpolate=INTERP_LINEAR, coordinate_system=None):
+        """
+        Vox values at many locations.
+
+        :param xyz:                 locations as a numpy array shaped (n, 3) or a `geosoft.gxpy.geometry.PPoint`.
+                                    z is depth if `is_depth` is `True`, otherwise elevation.
+        :param interpolate:         method by which to interpolate between cell centers:
+
+            ============== =============================================================
+            INTERP_NEAREST same as value inside a cell.
+            INTERP_LINEAR  tri-linear interpolation between neighboring cell centers.
+            ============== =============================================================
+
+        :param coordinate_system:   coordinate system of the locations if not the vox coordinate system. The
+                                    default for a `geosoft.gxpy.geometry.PPoint` is the coordinate system of the
+                                    `PPoint`.
+        :returns:                   numpy float64 array of n values, or shaped (n, 3) for a vector vox. Locations
+                                    outside the vox or next to null cells are `numpy.nan`.
+
+        Locations are grouped by vox plane and values are gathered one plane at a time from `array`, so memory
+        use is bounded by the plane cache rather than the extent of the locations.  Cells are located from the
+        cell sizes so vox with variable cell sizes are supported.  Within half a cell of the vox edges tri-linear
+        interpolation uses the edge cell value.
+
+        .. seealso:: `value_at_location` for the engine smooth interpolation.
+
+        .. versionadded:: 2024.1
+        """
+
+        if interpolate not in (INTERP_NEAREST, INTERP_LINEAR):
+            raise VoxException(_t('Only INTERP_NEAREST and INTERP_LINEAR are supported.'))
+
+        if isinstance(xyz, gxgm.PPoint):
+            if coordinate_system is None:
+                coordinate_system = xyz.coordinate_system
+            xyz = xyz.pp
+        xyz = np.array(xyz, dtype=np.float64).reshape((-1, 3))
+        if coordinate_system is not None and self.coordinate_system is not None:
+            if not isinstance(coordinate_system, gxcs.Coordinate_system):
+                coordinate_system = gxcs.Coordinate_system(coordinate_system)
+            if coordinate_system != self.coordinate_system:
+                xyz = gxcs.coordinate_translate(coordinate_system, self.coordinate_system).convert(xyz)
+
+        # work in the pager frame, z elevation from the bottom
+        z = -xyz[:, 2] if self.is_depth else xyz[:, 2]
+        axes = ((xyz[:, 0], self._locations[0], self._cells[0]),
+                (xyz[:, 1], self._locations[1], self._cells[1]),
+                (z, self._locations[2], self._cells[2]))
+
+        n = len(xyz)
+        vshape = (3,) if self.is_vectorvox else ()
+        result = np.full((n,) + vshape, np.nan)
+        inside = np.ones(n, dtype=bool)
+        index = []
+        for v, loc, cells in axes:
+            loc = np.asarray(loc, dtype=np.float64)
+            cells = np.asarray(cells, dtype=np.float64)
+            edges = np.append(loc - cells * 0.5, loc[-1] + cells[-1] * 0.5)
+            with np.errstate(invalid='ignore'):
+                inside &= (v >= edges[0]) & (v <= edges[-1])
+            if interpolate == INTERP_NEAREST:
+                i = np.clip(np.searchsorted(edges, v, side='right') - 1, 0, len(loc) - 1)
+                index.append((i,))
+            else:
+                i = np.clip(np.searchsorted(loc, v, side='right') - 1, 0, max(len(loc) - 2, 0))
+                i1 = np.minimum(i + 1, len(loc) - 1)
+                span = loc[i1] - loc[i]
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    t = np.where(span > 0., (v - loc[i]) / span, 0.)
+                t = np.clip(t, 0., 1.)
+                index.append((i, i1, t))
+        if not inside.any():
+            return result
+
+        # gather values one vox plane at a time, so memory is bounded by a plane rather than the locations
+        index = [tuple(a[inside] for a in axis) for axis in index]
+
+        def plane_groups(zi):
+            order = np.argsort(zi, kind='stable')
+            planes, starts = np.unique(zi[order], return_index=True)
+            return dict(zip(planes.tolist(), np.split(order, starts[1:])))
+
+        def gather(plane, yi, xi):
+            v = plane[yi, xi]
+            if self._return_int:
+                v = np.where(v == gxu.gx_dummy(v.dtype), np.nan, v)
+            return v.astype(np.float64)
+
+        if interpolate == INTERP_NEAREST:
+            (ix,), (iy,), (iz,) = index
+            values = np.empty((len(ix),) + vshape)
+            for pz, sel in plane_groups(iz).items():
+                values[sel] = gather(self.array.plane(pz), iy[sel], ix[sel])
+            result[inside] = values
+            return result
+
+        (ix, ix1, tx), (iy, iy1, ty), (iz, iz1, tz) = index
+        zcorners = ((plane_groups(iz), 1. - tz), (plane_groups(iz1), tz))
+        total = np.zeros((len(ix),) + vshape)
+        dummy = np.zeros(len(ix), dtype=bool)
+        for pz in sorted(set(zcorners[0][0]) | set(zcorners[1][0])):
+            plane = self.array.plane(pz)
+            for groups, wz in zcorners:
+                sel = groups.get(pz)
+                if sel is None:
+                    continue
+                for yi, wy in ((iy, 1. - ty), (iy1, ty)):
+                    for xi, wx in ((ix, 1. - tx), (ix1, tx)):
+                        w = wx[sel] * wy[sel] * wz[sel]
+                        v = gather(plane, yi[sel], xi[sel])
+                        if vshape:
+                            w = w.reshape((-1, 1))
+                        missing = np.isnan(v)
+                        contributes = w > 0.
+                        dummy[sel] |= (missing & contributes).reshape((len(sel), -1)).any(axis=1)
+                        total[sel] += np.where(missing, 0., v) * w
+        total[dummy] = np.nan
+        result[inside] = total
+        return result
+
     def np(self, subset=None, dtype=None):
         """
         Return vox subset in a 3D numpy array.
@@ -704,7 +1040,11 @@ class Vox(gxspd.SpatialData, Sequence):
 
         :return:        numpy array of shape (nz, ny, nx). The order of z depends on is_depth property setting.
 
+        .. seealso:: `array` for numpy-like slicing of the vox data.
+
         .. versionadded:: 9.3.1
+
+        .. versionchanged:: 2024.1 read in blocks through `array`
         """
 
         def set_0(n, nn):
@@ -749,35 +1089,11 @@ class Vox(gxspd.SpatialData, Sequence):
             ny = set_d(y0, ny, self.ny)
             nz = set_d(z0, nz, self.nz)
 
-        gxpg = self.gxpg
-        if dtype is None:
-            dtype = self._dtype
-        if self.is_vectorvox:
-            shape = (nz, ny, nx, 3)
-            dim = 3
-        else:
-            shape = (nz, ny, nx)
-            dim = 1
-        npv = np.empty(shape, dtype=dtype)
-        vv = gxvv.GXvv(dtype=dtype, dim=dim)
-        vv.length = nx
-
-        if self.is_depth:
-            z0 = self.nz - (z0 + nz)
-            i = 1
-            for iz in range(z0, z0 + nz):
-                for iy in range(y0, y0 + ny):
-                    gxpg.read_row_3d(iz, iy, x0, nx, vv.gxvv)
-                    npv[nz - i, iy - y0, :] = vv.np
-                i += 1
-
+        if dtype is None or np.dtype(dtype) == self.array.dtype:
+            array = self.array
         else:
-            for iz in range(z0, z0 + nz):
-                for iy in range(y0, y0 + ny):
-                    gxpg.read_row_3d(iz, iy, x0, nx, vv.gxvv)
-                    npv[iz - z0, iy - y0, :] = vv.np
-
-        return npv
+            array = VoxArray(self, dtype=dtype, cache_bytes=0)
+        return array[z0: z0 + nz, y0: y0 + ny, x0: x0 + nx]
 
     @classmethod
     def _rbf(cls, data,
@@ -135,6 +135,10 @@ class GXvv(Sequence):
     .. versionchanged:: 9.3.1 added string support in __getitem__, and creates from a source `GVvv` instance.
 
     .. versionchanged:: 9.6 Added length parameter.
+
+    .. versionchanged:: 2024.1 numpy data is cached on first use and shared by `np`, indexing, iteration,
+                        `list` and `min_max`. The cache is dropped when the VV changes or when the
+                        `gxvv` handle is requested.
     """
 
     def __enter__(self):
@@ -146,6 +150,7 @@ class GXvv(Sequence):
     def __del__(self):
         if hasattr(self, '_gxvv'):
             self._gxvv = None
+            self._cache = None
 
     def __eq__(self, other):
         return np.array_equal(self.np, other.np) \
@@ -218,6 +223,7 @@ class GXvv(Sequence):
         fid = fid
         self._next = 0
         self._unit_of_measure = unit_of_measure
+        self._cache = None
 
         if array is not None:
             self.set_data(array, fid)
@@ -229,29 +235,46 @@ class GXvv(Sequence):
         return self
 
     def __next__(self):
-        if self._next >= self.length:
+        npd, (start, incr) = self._cached()
+        if self._next >= npd.shape[0]:
             self._next = 0
             raise StopIteration
         else:
             i = self._next
             self._next += 1
-            return self.np[i], self.fid[0] + self.fid[1] * i
+            return npd[i], start + incr * i
 
     def __getitem__(self, item):
-        start, incr = self.fid
+        npd, (start, incr) = self._cached()
         if self._is_float:
-            v = float(self.np[item])
+            v = float(npd[item])
         elif self._is_int:
-            v = int(self.np[item])
+            v = int(npd[item])
         else:
-            v = str(self.np[item])
+            v = str(npd[item])
         return v, start + incr * item
 
+    def _cached(self):
+        """
+        Return the cached (data, fid) for this VV, reading the VV from the engine only if the cache is empty.
+        The cached array is read-only as it is shared by all callers.
+        """
+        if self._cache is None:
+            npd, _ = self.get_data()
+            npd.flags.writeable = False
+            self._cache = (npd, (self._gxvv.get_fid_start(), self._gxvv.get_fid_incr()))
+        return self._cache
+
+    def _invalidate(self):
+        """drop cached numpy data, called whenever the VV content or fid may have changed"""
+        self._cache = None
+
     def _set_data_np(self, npd, start=0):
         """set to data in a numpy array"""
         if not npd.flags['C_CONTIGUOUS']:
             npd = np.ascontiguousarray(npd)
-        self.gxvv.set_data(start, npd.shape[0], npd.data.tobytes(), gxu.gx_dtype_dimension(npd.dtype, self._dim))
+        self._invalidate()
+        self._gxvv.set_data(start, npd.shape[0], npd.data.tobytes(), gxu.gx_dtype_dimension(npd.dtype, self._dim))
 
     def _get_data_np(self, start=0, n=None, dtype=None):
         """return data in a numpy array"""
@@ -262,7 +285,7 @@ class GXvv(Sequence):
         else:
             sh = (n, self._dim)
         bytearr = np.empty(sh, dtype=dtype).tobytes()
-        self.gxvv.get_data(start, n, bytearr, gxu.gx_dtype_dimension(dtype, self._dim))
+        self._gxvv.get_data(start, n, bytearr, gxu.gx_dtype_dimension(dtype, self._dim))
         npd = np.frombuffer(bytearr, dtype=dtype).reshape(sh)
         return np.array(npd)
 
@@ -277,7 +300,13 @@ class GXvv(Sequence):
 
     @property
     def gxvv(self):
-        """:class:`geosoft.gxapi.GXVV` instance"""
+        """
+        :class:`geosoft.gxapi.GXVV` instance.
+
+        The caller may change the VV through this handle, so cached numpy data is dropped and will be
+        re-read on next use.
+        """
+        self._invalidate()
         return self._gxvv
 
     @property
@@ -291,6 +320,7 @@ class GXvv(Sequence):
 
     @fid.setter
     def fid(self, fid):
+        self._invalidate()
         self._gxvv.set_fid_start(fid[0])
         self._gxvv.set_fid_incr(fid[1])
 
@@ -364,12 +394,14 @@ class GXvv(Sequence):
         Numpy array of VV data, in the data type of the VV.  Use :meth:`get_data` to get a numpy array
         in another dtype.
 
-        Note that changing the data in the numpy array does NOT change the data in the VV.  Use
-        `set_data` to change data in the VV.
-        
-        .. versionadded:: 9.2 
+        The array is cached and shared, so it is read-only. Use `get_data` for an array that can be
+        changed, and `set_data` to change data in the VV.
+
+        .. versionadded:: 9.2
+
+        .. versionchanged:: 2024.1 returns a cached read-only array
         """
-        return self.get_data()[0]
+        return self._cached()[0]
 
     def get_data(self, dtype=None, start=0, n=None, float_dummies_to_nan=True):
         """
@@ -427,8 +459,7 @@ class GXvv(Sequence):
                     npd = self._get_data_np(start, n, dtype)
 
         if float_dummies_to_nan:
-            if npd.dtype == np.float32 or npd.dtype == np.float64:
-                npd[npd == gxu.gx_dummy(npd.dtype)] = np.nan
+            gxu.dummy_to_nan(npd)
 
         fid = self.fid
         start = fid[0] + start * fid[1]
@@ -457,6 +488,7 @@ class GXvv(Sequence):
         elif not isinstance(data, np.ndarray):
             data = np.array(data)
 
+        self._invalidate()
         if data.size == 0:
             self.length = 0
             if fid:
@@ -516,6 +548,7 @@ class GXvv(Sequence):
             length = (((end_fid - fid[0]) + fid[1] * 0.5) // fid[1]) + 1
             if length < 0:
                 length = 0
+        self._invalidate()
         self._gxvv.re_fid(fid[0], fid[1], int(length))
         self.fid = fid
 
@@ -525,7 +558,7 @@ class GXvv(Sequence):
         
         .. versionadded:: 9.2
         """
-        return [v[0] for v in self]
+        return list(self.np)
 
     def fill(self, value):
         """
@@ -535,12 +568,24 @@ class GXvv(Sequence):
 
         .. versionadded:: 9.3.1
         """
+        self._invalidate()
         if self.is_float:
-            self.gxvv.fill_double(float(value))
-        if self.is_int:
-            self.gxvv.fill_int(int(value))
+            self._gxvv.fill_double(float(value))
+        elif self.is_int:
+            self._gxvv.fill_int(int(value))
         else:
-            self.gxvv.fill_string(str(value))
+            self._gxvv.fill_string(str(value))
+
+    def dummy_mask(self):
+        """
+        Return a dummy mask for the VV data, see `geosoft.gxpy.utility.dummy_mask`.
+
+        :return: numpy boolean array length of the VV, True for dummy elements. For 2D and 3D VVs an
+                 element is a dummy if any of its components is a dummy.
+
+        .. versionadded:: 2024.1
+        """
+        return gxu.dummy_mask(self._cached()[0])
 
     def min_max(self):
         """
@@ -549,8 +594,17 @@ class GXvv(Sequence):
         :return: (minimum, maximum), or if all dummy, (None, None)
 
         .. versionadded:: 9.3.1
+
+        .. versionchanged:: 2024.1 numeric data is evaluated from the cached numpy data
         """
 
+        if not self._is_string:
+            npd = self._cached()[0]
+            npd = npd[~gxu.dummy_mask(npd, axis=None)]
+            if npd.size == 0:
+                return (None, None)
+            return float(npd.min()), float(npd.max())
+
         rmin = gxapi.float_ref()
         rmax = gxapi.float_ref()
         self._gxvv.range_double(rmin, rmax)